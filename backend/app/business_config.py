@@ -1,9 +1,183 @@
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any
+
 from .config import get_settings
 from .db import SQLALCHEMY_AVAILABLE, SessionLocal
 from .db_models import BusinessDB
 
+if SQLALCHEMY_AVAILABLE:
+    from sqlalchemy import event, select
+    from sqlalchemy.orm import Session
+
+
+# Tenant settings change rarely but are read on every webhook turn, so rows
+# are cached per business_id for a short window and dropped on any ORM write.
+BUSINESS_CACHE_TTL_SECONDS = 300.0
+# Suspension and lockdown gate traffic, and other instances only notice a
+# change when they reload the row, so those checks accept a much older copy
+# only for this long.
+BUSINESS_STATUS_MAX_AGE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class BusinessSnapshot:
+    """Immutable copy of the BusinessDB fields read on hot request paths."""
+
+    name: str | None
+    language_code: str | None
+    status: str | None
+    owner_phone: str | None
+    owner_email: str | None
+    owner_email_alerts_enabled: bool | None
+    twilio_missed_statuses: str | None
+    vertical: str | None
+    tts_voice: str | None
+    calendar_id: str | None
+    lockdown_mode: bool | None
+    service_tier: str | None
+    emergency_keywords: str | None
+
+
+_SNAPSHOT_COLUMNS = (
+    tuple(getattr(BusinessDB, f.name) for f in fields(BusinessSnapshot))
+    if SQLALCHEMY_AVAILABLE
+    else ()
+)
+
+# business_id arrives from untrusted input (webhook query strings, widget
+# paths), so both maps are bounded and evict their oldest entries first.
+# Unknown ids get their own smaller map so they cannot push real tenants out.
+_BUSINESS_CACHE_MAX = 4096
+_MISSING_BUSINESS_CACHE_MAX = 1024
+
+# business_id -> (loaded_at, snapshot), with loaded_at from time.monotonic().
+_business_cache: OrderedDict[str, tuple[float, BusinessSnapshot]] = OrderedDict()
+# business_id -> loaded_at for ids with no Business row.
+_missing_business_ids: OrderedDict[str, float] = OrderedDict()
+_business_cache_lock = threading.Lock()
+
+
+def invalidate_business_cache(business_id: str | None = None) -> None:
+    """Drop cached tenant rows (one business, or all when no id is given)."""
+    with _business_cache_lock:
+        if business_id is None:
+            _business_cache.clear()
+            _missing_business_ids.clear()
+        else:
+            _business_cache.pop(business_id, None)
+            _missing_business_ids.pop(business_id, None)
+
+
+def _cached_snapshot(
+    business_id: str, max_age: float
+) -> tuple[bool, BusinessSnapshot | None]:
+    """Return (hit, snapshot) for a cached row or known-missing id.
+
+    Entries older than max_age are a miss; entries past the TTL are removed
+    as they are found.
+    """
+    now = time.monotonic()
+    max_age = min(max_age, BUSINESS_CACHE_TTL_SECONDS)
+    with _business_cache_lock:
+        entry = _business_cache.get(business_id)
+        if entry is not None:
+            age = now - entry[0]
+            if age < max_age:
+                return True, entry[1]
+            if age >= BUSINESS_CACHE_TTL_SECONDS:
+                del _business_cache[business_id]
+            return False, None
+        missing_at = _missing_business_ids.get(business_id)
+        if missing_at is not None:
+            age = now - missing_at
+            if age < max_age:
+                return True, None
+            if age >= BUSINESS_CACHE_TTL_SECONDS:
+                del _missing_business_ids[business_id]
+    return False, None
+
+
+def _remember_snapshot(
+    business_id: str, loaded_at: float, snapshot: BusinessSnapshot | None
+) -> None:
+    with _business_cache_lock:
+        if snapshot is None:
+            _business_cache.pop(business_id, None)
+            _missing_business_ids[business_id] = loaded_at
+            _missing_business_ids.move_to_end(business_id)
+            while len(_missing_business_ids) > _MISSING_BUSINESS_CACHE_MAX:
+                _missing_business_ids.popitem(last=False)
+            return
+        _missing_business_ids.pop(business_id, None)
+        _business_cache[business_id] = (loaded_at, snapshot)
+        _business_cache.move_to_end(business_id)
+        while len(_business_cache) > _BUSINESS_CACHE_MAX:
+            _business_cache.popitem(last=False)
+
+
+def business_snapshot_cached(
+    business_id: str | None, max_age: float = BUSINESS_CACHE_TTL_SECONDS
+) -> bool:
+    """Return True when a fresh snapshot (or known-missing row) is cached."""
+    if not business_id:
+        return False
+    return _cached_snapshot(business_id, max_age)[0]
+
+
+def get_business_snapshot(
+    business_id: str | None, max_age: float = BUSINESS_CACHE_TTL_SECONDS
+) -> BusinessSnapshot | None:
+    """Return cached tenant fields, loading the row at most once per TTL.
+
+    Callers gating traffic on status or lockdown_mode pass
+    max_age=BUSINESS_STATUS_MAX_AGE_SECONDS so those flags are re-read from
+    the database more often than the display fields.
+
+    Returns None when there is no such business or DB support is unavailable.
+    """
+    if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
+        return None
+
+    hit, snapshot = _cached_snapshot(business_id, max_age)
+    if hit:
+        return snapshot
+
+    loaded_at = time.monotonic()
+    # Select just the snapshot columns so no BusinessDB instance is built or
+    # tracked in the identity map; the compiled statement is cached by
+    # SQLAlchemy across calls.
+    session = SessionLocal()
+    try:
+        row = session.execute(
+            select(*_SNAPSHOT_COLUMNS).where(BusinessDB.id == business_id)
+        ).first()
+    finally:
+        session.close()
+    snapshot = BusinessSnapshot(*row) if row is not None else None
+
+    _remember_snapshot(business_id, loaded_at, snapshot)
+    return snapshot
+
+
+if SQLALCHEMY_AVAILABLE:
+
+    @event.listens_for(BusinessDB, "after_insert")
+    @event.listens_for(BusinessDB, "after_update")
+    @event.listens_for(BusinessDB, "after_delete")
+    def _invalidate_business_row(mapper: Any, connection: Any, target: Any) -> None:
+        invalidate_business_cache(getattr(target, "id", None) or None)
+
+    @event.listens_for(Session, "after_bulk_update")
+    @event.listens_for(Session, "after_bulk_delete")
+    def _invalidate_business_bulk(context: Any) -> None:
+        if context.mapper.class_ is BusinessDB:
+            invalidate_business_cache()
+
 
 def get_calendar_id_for_business(business_id: str) -> str:
     """Return the calendar ID to use for a given business/tenant.
@@ -14,17 +188,10 @@ def get_calendar_id_for_business(business_id: str) -> str:
     settings = get_settings()
     default_calendar_id = settings.calendar.calendar_id
 
-    if not SQLALCHEMY_AVAILABLE or SessionLocal is None:
-        return default_calendar_id
-
-    session = SessionLocal()
-    try:
-        row = session.get(BusinessDB, business_id)
-        if row and getattr(row, "calendar_id", None):
-            return row.calendar_id  # type: ignore[return-value]
-        return default_calendar_id
-    finally:
-        session.close()
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.calendar_id:
+        return snapshot.calendar_id
+    return default_calendar_id
 
 
 def get_language_for_business(business_id: str | None) -> str:
@@ -36,17 +203,10 @@ def get_language_for_business(business_id: str | None) -> str:
     settings = get_settings()
     default_language = getattr(settings, "default_language_code", "en")
 
-    if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
-        return default_language
-
-    session = SessionLocal()
-    try:
-        row = session.get(BusinessDB, business_id)
-        if row and getattr(row, "language_code", None):
-            return row.language_code  # type: ignore[return-value]
-        return default_language
-    finally:
-        session.close()
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.language_code:
+        return snapshot.language_code
+    return default_language
 
 
 def get_vertical_for_business(business_id: str | None) -> str:
@@ -58,17 +218,10 @@ def get_vertical_for_business(business_id: str | None) -> str:
     settings = get_settings()
     default_vertical = getattr(settings, "default_vertical", "plumbing")
 
-    if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
-        return default_vertical
-
-    session = SessionLocal()
-    try:
-        row = session.get(BusinessDB, business_id)
-        if row and getattr(row, "vertical", None):
-            return row.vertical  # type: ignore[return-value]
-        return default_vertical
-    finally:
-        session.close()
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.vertical:
+        return snapshot.vertical
+    return default_vertical
 
 
 def get_voice_for_business(business_id: str | None) -> str:
@@ -80,14 +233,7 @@ def get_voice_for_business(business_id: str | None) -> str:
     settings = get_settings()
     default_voice = settings.speech.openai_tts_voice
 
-    if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
-        return default_voice
-
-    session = SessionLocal()
-    try:
-        row = session.get(BusinessDB, business_id)
-        if row and getattr(row, "tts_voice", None):
-            return row.tts_voice  # type: ignore[return-value]
-        return default_voice
-    finally:
-        session.close()
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.tts_voice:
+        return snapshot.tts_voice
+    return default_voice
@@ -103,6 +103,10 @@ class TelephonySettings(BaseModel):
     twilio_stream_min_seconds: float = float(
         os.getenv("TWILIO_STREAM_MIN_SECONDS", "1.0")
     )
+    # Only let the owner's registered phone use the owner IVR line.
+    owner_voice_require_match: bool = (
+        os.getenv("OWNER_VOICE_REQUIRE_MATCH", "false").lower() == "true"
+    )
 
 
 class QuickBooksSettings(BaseModel):
@@ -300,6 +304,10 @@ class AppSettings(BaseModel):
             twilio_stream_min_seconds=float(
                 os.getenv("TWILIO_STREAM_MIN_SECONDS", "1.0")
             ),
+            owner_voice_require_match=os.getenv(
+                "OWNER_VOICE_REQUIRE_MATCH", "false"
+            ).lower()
+            == "true",
         )
         quickbooks = QuickBooksSettings(
             client_id=os.getenv("QBO_CLIENT_ID"),
@@ -11,6 +11,7 @@ from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy import text
 
+from .business_config import BUSINESS_STATUS_MAX_AGE_SECONDS, get_business_snapshot
 from .config import get_settings
 from .db import SQLALCHEMY_AVAILABLE, SessionLocal, init_db
 from .logging_config import configure_logging
@@ -32,6 +33,7 @@ from .services.audit import (
 from .services.retention_purge import start_retention_scheduler
 from .services.rate_limit import RateLimiter, RateLimitError
 from .services.job_queue import job_queue
+from .services.sms import sms_service
 from .services import alerting
 from .routers import (
     business_admin,
@@ -62,21 +64,20 @@ def _is_business_locked(business_id: str) -> bool:
     """Return True when the tenant is in lockdown mode (DB-backed flag)."""
     if not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
         return False
-    from .db_models import BusinessDB  # local import to avoid circular deps
-
-    session_db = SessionLocal()
+    # Runs in the middleware for every webhook/widget request, so it reads the
+    # cached tenant snapshot rather than opening a session per request. The
+    # flag is re-read after the short status max age so a lockdown set on
+    # another instance applies here within seconds.
     try:
-        row = session_db.get(BusinessDB, business_id)
-        if row is None:
-            return False
-        return bool(getattr(row, "lockdown_mode", False))
+        snapshot = get_business_snapshot(
+            business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+        )
     except Exception:
         logging.getLogger(__name__).warning(
             "lockdown_check_failed", exc_info=True, extra={"business_id": business_id}
         )
         return False
-    finally:
-        session_db.close()
+    return bool(snapshot is not None and snapshot.lockdown_mode)
 
 
 def create_app() -> FastAPI:
@@ -236,7 +237,7 @@ def create_app() -> FastAPI:
         try:
             start_retention_scheduler(int(purge_interval_hours * 3600))
         except Exception:
-            metrics.background_job_errors += 1
+            metrics.incr("background_job_errors")
             logger.exception("retention_purge_scheduler_failed")
     try:
         job_queue.start()
@@ -572,6 +573,14 @@ def create_app() -> FastAPI:
             job_queue.stop()
         except Exception:
             logger.warning("job_queue_stop_failed", exc_info=True)
+        try:
+            await sms_service.aclose()
+        except Exception:
+            logger.warning("sms_client_close_failed", exc_info=True)
+        try:
+            await alerting.aclose()
+        except Exception:
+            logger.warning("oncall_webhook_client_close_failed", exc_info=True)
 
     app.include_router(voice.router, prefix="/v1/voice", tags=["voice"])
     # Support both legacy and versioned prefixes for telephony and Twilio
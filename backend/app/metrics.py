@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import threading
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict
 
 
-@dataclass
+# Per-tenant and per-route records are created in bulk and mutated on every
+# webhook, so they use __slots__ instead of a per-instance __dict__.
+@dataclass(slots=True)
 class BusinessSmsMetrics:
     sms_sent_total: int = 0
     sms_sent_owner: int = 0
@@ -19,7 +23,7 @@ class BusinessSmsMetrics:
     sms_opt_in_events: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessTwilioMetrics:
     voice_requests: int = 0
     voice_errors: int = 0
@@ -27,13 +31,13 @@ class BusinessTwilioMetrics:
     sms_errors: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BusinessVoiceSessionMetrics:
     requests: int = 0
     errors: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class RouteMetrics:
     request_count: int = 0
     error_count: int = 0
@@ -41,7 +45,7 @@ class RouteMetrics:
     max_latency_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CallbackItem:
     phone: str
     first_seen: datetime
@@ -62,6 +66,9 @@ class Metrics:
     alert_events_total: int = 0
     alerts_open: Dict[str, Dict[str, Any]] = field(default_factory=dict)
     alert_last_fired: Dict[str, str] = field(default_factory=dict)
+    # Monotonic timestamps behind the cooldown check; alert_last_fired keeps
+    # the ISO strings for dashboards.
+    alert_last_fired_monotonic: Dict[str, float] = field(default_factory=dict)
     admin_token_last_used_at: str | None = None
     admin_token_last_rotated_at: str | None = None
     owner_token_last_used_at: str | None = None
@@ -117,7 +124,11 @@ class Metrics:
     security_events_total: int = 0
     security_events_by_type: Dict[str, int] = field(default_factory=dict)
     security_events_by_business: Dict[str, Dict[str, int]] = field(default_factory=dict)
-    sms_by_business: Dict[str, BusinessSmsMetrics] = field(default_factory=dict)
+    # defaultdicts so hot paths can index by business_id without building a
+    # throwaway metrics object for setdefault on every request.
+    sms_by_business: Dict[str, BusinessSmsMetrics] = field(
+        default_factory=lambda: defaultdict(BusinessSmsMetrics)
+    )
     twilio_voice_requests: int = 0
     twilio_voice_errors: int = 0
     twilio_sms_requests: int = 0
@@ -126,11 +137,13 @@ class Metrics:
     twilio_webhook_accepted: int = 0
     twilio_webhook_failures: int = 0
     calendar_webhook_failures: int = 0
-    twilio_by_business: Dict[str, BusinessTwilioMetrics] = field(default_factory=dict)
+    twilio_by_business: Dict[str, BusinessTwilioMetrics] = field(
+        default_factory=lambda: defaultdict(BusinessTwilioMetrics)
+    )
     voice_session_requests: int = 0
     voice_session_errors: int = 0
     voice_sessions_by_business: Dict[str, BusinessVoiceSessionMetrics] = field(
-        default_factory=dict
+        default_factory=lambda: defaultdict(BusinessVoiceSessionMetrics)
     )
     owner_notification_status_by_business: Dict[str, Dict[str, Any]] = field(
         default_factory=dict
@@ -140,9 +153,23 @@ class Metrics:
     )
     route_metrics: Dict[str, RouteMetrics] = field(default_factory=dict)
     callbacks_by_business: Dict[str, Dict[str, CallbackItem]] = field(
-        default_factory=dict
+        default_factory=lambda: defaultdict(dict)
     )
     retention_by_business: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    _thread_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment a counter under the metrics lock.
+
+        The lock only prevents lost updates when every writer of a counter
+        goes through it, so any counter bumped from a worker thread (job
+        queue, retention scheduler, sync endpoints) is incremented here
+        everywhere, never with a bare ``+=``.
+        """
+        with self._thread_lock:
+            setattr(self, name, getattr(self, name) + amount)
 
     def record_chat_latency(self, latency_ms: float) -> None:
         """Track chat latency with buckets and rolling samples."""
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from datetime import UTC, datetime, timedelta
+from typing import Dict, List, Optional, Sequence
 import os
 
+from sqlalchemy import case, func
+
 from .config import get_settings
 from .db import SQLALCHEMY_AVAILABLE, SessionLocal
 from .db_models import (
@@ -219,6 +222,38 @@ class InMemoryAppointmentRepository:
     def get(self, appointment_id: str) -> Optional[Appointment]:
         return self._by_id.get(appointment_id)
 
+    def next_upcoming_for_customer(
+        self, customer_id: str, business_id: str, now: datetime
+    ) -> Optional[Appointment]:
+        """Return the earliest non-cancelled appointment after ``now``."""
+        best: Appointment | None = None
+        for appt_id in self._by_customer.get(customer_id, []):
+            appt = self._by_id.get(appt_id)
+            if appt is None or appt.business_id != business_id:
+                continue
+            if (appt.status or "").upper() == "CANCELLED" or appt.start_time <= now:
+                continue
+            if best is None or appt.start_time < best.start_time:
+                best = appt
+        return best
+
+    def active_counts_between(
+        self, business_id: str, start: datetime, end: datetime
+    ) -> tuple[int, int]:
+        """Return (total, emergency) scheduled/confirmed appointments in a window."""
+        total = 0
+        emergency = 0
+        for appt_id in self._by_business.get(business_id, []):
+            appt = self._by_id.get(appt_id)
+            if appt is None or not (start <= appt.start_time <= end):
+                continue
+            if (appt.status or "").upper() not in ("SCHEDULED", "CONFIRMED"):
+                continue
+            total += 1
+            if appt.is_emergency:
+                emergency += 1
+        return total, emergency
+
     def find_by_calendar_event(
         self, calendar_event_id: str, *, business_id: str | None = None
     ) -> Optional[Appointment]:
@@ -350,6 +385,29 @@ class InMemoryConversationRepository:
             return
         conv.messages.append(ConversationMessage(role=role, text=redact_text(text)))
 
+    def append_messages(
+        self, conversation_id: str, messages: Sequence[tuple[str, str]]
+    ) -> None:
+        """Append several (role, text) entries in order."""
+        conv = self._by_id.get(conversation_id)
+        if not conv:
+            return
+        if not _capture_transcripts_allowed(getattr(conv, "business_id", None)):
+            return
+        conv.messages.extend(
+            ConversationMessage(role=role, text=redact_text(text))
+            for role, text in messages
+        )
+
+    def delete_last_message(self, conversation_id: str, role: str, text: str) -> None:
+        """Remove the newest message if it is the given (role, text) entry."""
+        conv = self._by_id.get(conversation_id)
+        if not conv or not conv.messages:
+            return
+        last = conv.messages[-1]
+        if last.role == role and last.text == redact_text(text):
+            conv.messages.pop()
+
     def set_intent(
         self, conversation_id: str, intent: str | None, confidence: float | None
     ) -> None:
@@ -675,6 +733,91 @@ class DbAppointmentRepository:
         finally:
             session.close()
 
+    def next_upcoming_for_customer(
+        self, customer_id: str, business_id: str, now: datetime
+    ) -> Optional[Appointment]:
+        """Return the earliest non-cancelled appointment after ``now``.
+
+        Filtering, ordering and LIMIT happen in SQL so only one row is loaded.
+        """
+        if SessionLocal is None:
+            raise RuntimeError("Database session factory is not available")
+        session = SessionLocal()
+        try:
+            row = (
+                session.query(AppointmentDB)
+                .filter(
+                    AppointmentDB.customer_id == customer_id,
+                    AppointmentDB.business_id == business_id,
+                    func.upper(AppointmentDB.status) != "CANCELLED",
+                    AppointmentDB.start_time > now,
+                )
+                .order_by(AppointmentDB.start_time)
+                .first()
+            )
+            return self._to_model(row) if row else None
+        finally:
+            session.close()
+
+    def next_upcoming_for_phone(
+        self, phone: str, business_id: str, now: datetime
+    ) -> Optional[Appointment]:
+        """Return the next appointment for the tenant's customer with ``phone``.
+
+        Joins the customer row so the phone lookup and the appointment search
+        cost a single round trip.
+        """
+        if SessionLocal is None:
+            raise RuntimeError("Database session factory is not available")
+        session = SessionLocal()
+        try:
+            row = (
+                session.query(AppointmentDB)
+                .join(CustomerDB, CustomerDB.id == AppointmentDB.customer_id)
+                .filter(
+                    CustomerDB.phone == phone,
+                    CustomerDB.business_id == business_id,
+                    AppointmentDB.business_id == business_id,
+                    func.upper(AppointmentDB.status) != "CANCELLED",
+                    AppointmentDB.start_time > now,
+                )
+                .order_by(AppointmentDB.start_time)
+                .first()
+            )
+            return self._to_model(row) if row else None
+        finally:
+            session.close()
+
+    def active_counts_between(
+        self, business_id: str, start: datetime, end: datetime
+    ) -> tuple[int, int]:
+        """Return (total, emergency) scheduled/confirmed appointments in a window.
+
+        Both counts come from one aggregate query instead of loading rows.
+        """
+        if SessionLocal is None:
+            raise RuntimeError("Database session factory is not available")
+        session = SessionLocal()
+        try:
+            total, emergency = (
+                session.query(
+                    func.count(AppointmentDB.id),
+                    func.coalesce(
+                        func.sum(case((AppointmentDB.is_emergency, 1), else_=0)), 0
+                    ),
+                )
+                .filter(
+                    AppointmentDB.business_id == business_id,
+                    AppointmentDB.start_time >= start,
+                    AppointmentDB.start_time <= end,
+                    func.upper(AppointmentDB.status).in_(("SCHEDULED", "CONFIRMED")),
+                )
+                .one()
+            )
+            return int(total), int(emergency)
+        finally:
+            session.close()
+
     def find_by_calendar_event(
         self, calendar_event_id: str, *, business_id: str | None = None
     ) -> Optional[Appointment]:
@@ -878,6 +1021,58 @@ class DbConversationRepository:
         finally:
             session.close()
 
+    def append_messages(
+        self, conversation_id: str, messages: Sequence[tuple[str, str]]
+    ) -> None:
+        """Append several (role, text) entries in order with one commit."""
+        if SessionLocal is None:
+            raise RuntimeError("Database session factory is not available")
+        session = SessionLocal()
+        try:
+            conv_row = session.get(ConversationDB, conversation_id)
+            if not conv_row:
+                return
+            if not _capture_transcripts_allowed(getattr(conv_row, "business_id", None)):
+                return
+            # Transcripts are read back ordered by timestamp, so spread the
+            # batch by a microsecond per entry to keep its order stable.
+            start = datetime.now(UTC)
+            session.add_all(
+                [
+                    ConversationMessageDB(
+                        id=new_conversation_id(),
+                        conversation_id=conversation_id,
+                        role=role,
+                        text=redact_text(text),
+                        timestamp=start + timedelta(microseconds=index),
+                    )  # type: ignore[call-arg]
+                    for index, (role, text) in enumerate(messages)
+                ]
+            )
+            session.commit()
+        finally:
+            session.close()
+
+    def delete_last_message(self, conversation_id: str, role: str, text: str) -> None:
+        """Remove the newest message if it is the given (role, text) entry."""
+        if SessionLocal is None:
+            raise RuntimeError("Database session factory is not available")
+        session = SessionLocal()
+        try:
+            last = (
+                session.query(ConversationMessageDB)
+                .filter(ConversationMessageDB.conversation_id == conversation_id)
+                .order_by(ConversationMessageDB.timestamp.desc())
+                .first()
+            )
+            if last is None:
+                return
+            if last.role == role and last.text == redact_text(text):
+                session.delete(last)
+                session.commit()
+        finally:
+            session.close()
+
     def set_intent(
         self, conversation_id: str, intent: str | None, confidence: float | None
     ) -> None:
@@ -17,12 +17,11 @@ from ..deps import (
     require_subscription_active,
 )
 from ..repositories import appointments_repo, conversations_repo, customers_repo
+from ..business_config import get_business_snapshot
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
-from ..db_models import BusinessDB
 from ..services.owner_assistant import owner_assistant_service
 from ..services import subscription as subscription_service
-from ..metrics import metrics, BusinessTwilioMetrics
-
+from ..metrics import metrics
 
 router = APIRouter(
     dependencies=[
@@ -49,14 +48,10 @@ def _business_label(business_id: str) -> tuple[str, str | None]:
     name = "Default Business"
     tier = None
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session = SessionLocal()
-        try:
-            row = session.get(BusinessDB, business_id)
-            if row is not None:
-                name = getattr(row, "name", name) or name
-                tier = getattr(row, "service_tier", None)
-        finally:
-            session.close()
+        row = get_business_snapshot(business_id)
+        if row is not None:
+            name = getattr(row, "name", name) or name
+            tier = getattr(row, "service_tier", None)
     return name, tier
 
 
@@ -103,7 +98,7 @@ def _build_business_context(business_id: str) -> str:
 
     # Enrich with usage/limits and callbacks.
     state = subscription_service.compute_state(business_id)
-    twilio_stats = metrics.twilio_by_business.get(business_id, BusinessTwilioMetrics())
+    twilio_stats = metrics.twilio_by_business.get(business_id)
     callbacks = metrics.callbacks_by_business.get(business_id, {}) or {}
     voice_usage = twilio_stats.voice_requests if twilio_stats else 0
     sms_usage = twilio_stats.sms_requests if twilio_stats else 0
@@ -7,9 +7,8 @@ from ..config import get_settings
 from ..deps import ensure_business_active
 from ..repositories import conversations_repo, customers_repo
 from ..services import conversation, sessions
+from ..business_config import BUSINESS_STATUS_MAX_AGE_SECONDS, get_business_snapshot
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
-from ..db_models import BusinessDB
-
 
 router = APIRouter()
 
@@ -51,11 +50,7 @@ async def widget_business(
     name = "Default Business"
     language_code = default_language
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
+        row = get_business_snapshot(business_id)
         if row is not None and getattr(row, "name", None):
             name = str(getattr(row, "name", name) or name)
         if row is not None and getattr(row, "language_code", None):
@@ -104,11 +99,9 @@ async def chat_message(
         raise HTTPException(status_code=404, detail="Conversation not found")
     conv_business_id = getattr(conv, "business_id", None)
     if conv_business_id and SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            row = session_db.get(BusinessDB, conv_business_id)
-        finally:
-            session_db.close()
+        row = get_business_snapshot(
+            conv_business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+        )
         if row is not None and getattr(row, "lockdown_mode", False):
             raise HTTPException(
                 status_code=status.HTTP_423_LOCKED,
@@ -134,9 +134,9 @@ async def import_contacts(
     def _job() -> None:
         try:
             result = _import_rows(rows, business_id)
-            metrics.contacts_imported += result.imported
+            metrics.incr("contacts_imported", result.imported)
             if result.errors:
-                metrics.contacts_import_errors += len(result.errors)
+                metrics.incr("contacts_import_errors", len(result.errors))
                 logger.warning(
                     "contacts_import_completed_with_errors",
                     extra={
@@ -157,7 +157,7 @@ async def import_contacts(
                 )
             result_holder["result"] = result
         except Exception as exc:  # pragma: no cover - defensive
-            metrics.background_job_errors += 1
+            metrics.incr("background_job_errors")
             logger.exception(
                 "contacts_import_failed",
                 extra={"business_id": business_id, "error": str(exc)},
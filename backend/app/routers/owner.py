@@ -41,6 +41,7 @@ from ..services.zip_enrichment import fetch_zip_income
 from ..business_config import get_voice_for_business
 from ..services.auth import decode_token, TokenError
 from ..services.privacy import redact_text
+from ..services.twilio_state import invalidate_sms_conversation_cache
 
 
 router = APIRouter(
@@ -712,7 +713,7 @@ def update_callback(
     business_id: str = Depends(ensure_business_active),
 ) -> OwnerCallbackItem:
     """Update the status/result of a callback item."""
-    queue = metrics.callbacks_by_business.setdefault(business_id, {})
+    queue = metrics.callbacks_by_business[business_id]
     item = queue.get(phone)
     if not item:
         raise HTTPException(status_code=404, detail="Callback not found")
@@ -3884,6 +3885,7 @@ def privacy_delete(
 
     appointments_repo.delete_for_customer(customer.id)
     conversations_repo.delete_for_customer(customer.id)
+    invalidate_sms_conversation_cache()
     customers_repo.delete(customer.id)
 
     return {"status": "deleted", "customer_id": customer.id}
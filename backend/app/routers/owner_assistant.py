@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from html import escape
+
 from fastapi import APIRouter, Depends
 from fastapi import Response, Form
 from pydantic import BaseModel
@@ -7,9 +9,12 @@ from pydantic import BaseModel
 from ..deps import ensure_business_active, require_owner_dashboard_auth
 from ..services.owner_assistant import owner_assistant_service
 
-
 router = APIRouter(dependencies=[Depends(require_owner_dashboard_auth)])
 
+# Single-line TwiML skeleton for spoken owner answers; the answer is escaped
+# before it is substituted.
+_TWIML_SAY_REPLY = '<Response><Say voice="alice">{reply}</Say></Response>'
+
 
 class OwnerAssistantQuery(BaseModel):
     question: str
@@ -51,10 +56,5 @@ async def owner_assistant_voice_reply(
     same docs as the text endpoint.
     """
     result = await owner_assistant_service.answer(Question, business_id=business_id)
-    safe = result.answer.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-    twiml = f"""
-<Response>
-  <Say voice="alice">{safe}</Say>
-</Response>
-""".strip()
-    return Response(content=twiml, media_type="text/xml")
+    twiml = _TWIML_SAY_REPLY.format(reply=escape(result.answer, quote=False))
+    return Response(content=twiml.encode("utf-8"), media_type="text/xml")
@@ -444,7 +444,7 @@ def qbo_sync_contacts(
     """Push customers/appointments into QuickBooks as customers + sales receipts."""
     status = _get_status(business_id)
     if not status.connected:
-        metrics.qbo_sync_errors += 1
+        metrics.incr("qbo_sync_errors")
         logger.warning(
             "qbo_sync_attempt_without_connection",
             extra={"business_id": business_id},
@@ -475,7 +475,7 @@ def qbo_sync_contacts(
     refresh_token = getattr(row, "qbo_refresh_token", None)
     realm_id = getattr(row, "qbo_realm_id", None)
     if not (access_token and refresh_token and realm_id):
-        metrics.qbo_sync_errors += 1
+        metrics.incr("qbo_sync_errors")
         raise HTTPException(
             status_code=400, detail="QuickBooks tokens are missing; reconnect."
         )
@@ -523,15 +523,15 @@ def qbo_sync_contacts(
         except HTTPException as exc:
             last_error = exc.detail if isinstance(exc.detail, str) else str(exc)
             if attempts >= 2:
-                metrics.qbo_sync_errors += 1
+                metrics.incr("qbo_sync_errors")
                 raise
             backoff = attempts * 0.25
             time.sleep(backoff)
         except Exception as exc:
             last_error = str(exc)
             if attempts >= 2:
-                metrics.qbo_sync_errors += 1
-                metrics.background_job_errors += 1
+                metrics.incr("qbo_sync_errors")
+                metrics.incr("background_job_errors")
                 logger.exception(
                     "qbo_sync_failed",
                     extra={"business_id": business_id, "error": last_error},
@@ -539,7 +539,7 @@ def qbo_sync_contacts(
                 raise HTTPException(status_code=502, detail="QuickBooks sync failed")
             time.sleep(attempts * 0.25)
 
-    metrics.qbo_sync_errors += 1
+    metrics.incr("qbo_sync_errors")
     raise HTTPException(status_code=502, detail=last_error or "QuickBooks sync failed")
 
 
@@ -560,14 +560,14 @@ def _background_sync(business_id: str, realm_id: str, access_token: str) -> None
             },
         )
     except HTTPException as exc:
-        metrics.qbo_sync_errors += 1
+        metrics.incr("qbo_sync_errors")
         logger.warning(
             "qbo_async_sync_failed",
             extra={"business_id": business_id, "detail": exc.detail},
         )
     except Exception as exc:
-        metrics.qbo_sync_errors += 1
-        metrics.background_job_errors += 1
+        metrics.incr("qbo_sync_errors")
+        metrics.incr("background_job_errors")
         logger.exception(
             "qbo_async_sync_exception",
             extra={"business_id": business_id, "error": str(exc)},
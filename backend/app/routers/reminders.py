@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends
 from ..deps import ensure_business_active
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
 from ..db_models import BusinessDB
-from ..metrics import BusinessSmsMetrics, metrics
+from ..metrics import metrics
 from ..repositories import appointments_repo, customers_repo
 from ..services import conversation
 from ..services.sms import sms_service
@@ -153,7 +153,7 @@ async def send_unbooked_lead_followups(
         )
         await sms_service.notify_customer(customer.phone, body, business_id=business_id)
         metrics.lead_followups_sent += 1
-        per = metrics.sms_by_business.setdefault(business_id, BusinessSmsMetrics())
+        per = metrics.sms_by_business[business_id]
         per.lead_followups_sent += 1
         seen_customers.add(conv.customer_id)
         sent += 1
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Query
 from ..deps import ensure_business_active
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
 from ..db_models import BusinessDB
-from ..metrics import BusinessSmsMetrics, metrics
+from ..metrics import metrics
 from ..repositories import appointments_repo, customers_repo
 from ..services.sms import sms_service
 from ..business_config import get_vertical_for_business, get_language_for_business
@@ -127,7 +127,7 @@ async def send_retention_campaign(
 
         # Track retention messages in per-tenant SMS metrics.
         metrics.lead_followups_sent += 0  # keep existing metric untouched
-        per = metrics.sms_by_business.setdefault(business_id, BusinessSmsMetrics())
+        per = metrics.sms_by_business[business_id]
         per.retention_messages_sent += 1
         sent += 1
 
@@ -1,10 +1,12 @@
 import logging
+from functools import partial
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from ..deps import ensure_business_active
-from ..metrics import BusinessVoiceSessionMetrics, metrics
+from ..metrics import metrics
 from ..repositories import conversations_repo, customers_repo
 from ..services import conversation, sessions
 from ..services import subscription as subscription_service
@@ -99,9 +101,7 @@ async def inbound_call(
         )
     # Track voice/telephony session usage.
     metrics.voice_session_requests += 1
-    per_tenant = metrics.voice_sessions_by_business.setdefault(
-        business_id, BusinessVoiceSessionMetrics()
-    )
+    per_tenant = metrics.voice_sessions_by_business[business_id]
     per_tenant.requests += 1
 
     session = sessions.session_store.create(
@@ -142,10 +142,7 @@ async def inbound_call(
         new_state = result.new_state
     except Exception:
         metrics.voice_session_errors += 1
-        per_err = metrics.voice_sessions_by_business.setdefault(
-            business_id, BusinessVoiceSessionMetrics()
-        )
-        per_err.errors += 1
+        per_tenant.errors += 1
         logger.exception(
             "telephony_inbound_unhandled_error",
             extra={
@@ -182,9 +179,13 @@ async def call_audio(payload: CallAudioRequest) -> CallAudioResponse:
     if not text and payload.audio:
         text = await conversation.speech_service.transcribe(payload.audio)
 
+    # The conversation manager builds its intent history from this transcript,
+    # so the caller's line is logged (off the event loop) before it runs.
     conv = conversations_repo.get_by_session(payload.session_id)
     if conv and text:
-        conversations_repo.append_message(conv.id, role="user", text=text)
+        await anyio.to_thread.run_sync(
+            partial(conversations_repo.append_message, conv.id, role="user", text=text)
+        )
 
     logger.info(
         "telephony_audio_input",
@@ -224,7 +225,14 @@ async def call_audio(payload: CallAudioRequest) -> CallAudioResponse:
         new_state = {"stage": "ERROR", "status": "FAILED"}
 
     if conv:
-        conversations_repo.append_message(conv.id, role="assistant", text=reply_text)
+        await anyio.to_thread.run_sync(
+            partial(
+                conversations_repo.append_message,
+                conv.id,
+                role="assistant",
+                text=reply_text,
+            )
+        )
 
     return CallAudioResponse(
         reply_text=reply_text,
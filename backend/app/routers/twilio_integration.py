@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 import base64
-import hashlib
+import binascii
 import hmac
-import io
 import json
 import os
+import re
 import struct
+import threading
 import time
-import wave
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache, partial
 from html import escape
+from urllib.parse import quote
 import logging
 
+import anyio
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Form,
     HTTPException,
     Query,
@@ -25,16 +30,13 @@ from fastapi import (
     status,
 )
 from pydantic import BaseModel
-from typing import Dict, TYPE_CHECKING
+from typing import Any, Awaitable, Callable, Dict, Mapping, TYPE_CHECKING, TypeVar
 
 from ..config import get_settings
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
-from ..db_models import BusinessDB
 from ..context import call_sid_ctx, message_sid_ctx
 from ..deps import DEFAULT_BUSINESS_ID, ensure_onboarding_ready
 from ..metrics import (
-    BusinessSmsMetrics,
-    BusinessTwilioMetrics,
     CallbackItem,
     metrics,
 )
@@ -47,12 +49,32 @@ from ..services import (
     subscription as subscription_service,
 )
 from ..services.idempotency import idempotency_store
+from ..services.owner_notifications import notify_owner_with_fallback
 from ..services.stt_tts import speech_service
 from ..services.sms import sms_service
-from ..business_config import get_language_for_business
-from ..services.twilio_state import PendingAction, twilio_state_store
+from ..business_config import (
+    BUSINESS_CACHE_TTL_SECONDS,
+    BUSINESS_STATUS_MAX_AGE_SECONDS,
+    business_snapshot_cached,
+    BusinessSnapshot,
+    get_business_snapshot,
+    get_language_for_business,
+)
+from ..services.twilio_state import (
+    PendingAction,
+    cached_sms_conversation_id,
+    remember_sms_conversation_id,
+    twilio_state_store,
+)
 from . import owner as owner_routes
 
+try:
+    # Media Streams send ~50 JSON frames per second per call; orjson parses
+    # them several times faster when it is installed.
+    from orjson import loads as _stream_json_loads
+except Exception:  # pragma: no cover - optional dependency
+    _stream_json_loads = json.loads
+
 if TYPE_CHECKING:
     from ..models import Appointment, Conversation
 
@@ -60,6 +82,31 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+T = TypeVar("T")
+
+# Owner IVR menu digits and normalized SMS keywords.
+_VALID_DTMF = frozenset({"1", "2", "3"})
+_OPT_OUT_KW = frozenset({"stop", "stopall", "unsubscribe", "end", "quit"})
+_OPT_IN_KW = frozenset({"start", "unstop"})
+_CONFIRM_KW = frozenset({"yes", "y", "confirm"})
+_DECLINE_KW = frozenset({"no", "n"})
+_CANCEL_KW = frozenset({"cancel", "cancel appointment", "cancel appt"})
+_RESCHEDULE_KW = frozenset({"reschedule", "change time", "change appointment"})
+
+# Normalized SMS body -> command, resolved with a single dict lookup.
+_SMS_COMMAND: Dict[str, str] = {
+    **dict.fromkeys(_OPT_OUT_KW, "OPT_OUT"),
+    **dict.fromkeys(_OPT_IN_KW, "OPT_IN"),
+    **dict.fromkeys(_CONFIRM_KW, "CONFIRM"),
+    **dict.fromkeys(_DECLINE_KW, "DECLINE"),
+    **dict.fromkeys(_CANCEL_KW, "CANCEL"),
+    **dict.fromkeys(_RESCHEDULE_KW, "RESCHEDULE"),
+}
+# Leading words of every command; other bodies skip full normalization.
+_SMS_COMMAND_FIRST_WORDS = frozenset(key.partition(" ")[0] for key in _SMS_COMMAND)
+# No command is longer than this many words, so longer bodies never match.
+_SMS_COMMAND_MAX_WORDS = max(key.count(" ") + 1 for key in _SMS_COMMAND)
+
 
 class TwilioStreamEvent(BaseModel):
     call_sid: str
@@ -90,8 +137,37 @@ def _check_twilio_replay(event_id: str, window_seconds: int) -> None:
         )
 
 
+def _twilio_signature_required() -> bool:
+    """Return whether inbound Twilio webhooks must be signature-checked.
+
+    Handlers call this synchronously before building the signed parameter
+    set, so the common unsigned setup skips that work and the verifier
+    coroutine entirely. Settings are re-read per call so reloads and test
+    overrides take effect.
+    """
+    sms_cfg = get_settings().sms
+    provider = (getattr(sms_cfg, "provider", "") or "").lower()
+    if provider == "stub":
+        return False
+    if getattr(sms_cfg, "verify_twilio_signatures", False):
+        return True
+    return provider == "twilio" and os.getenv("ENVIRONMENT", "dev").lower() == "prod"
+
+
+@lru_cache(maxsize=64)
+def _sorted_param_keys(keys: frozenset[str]) -> tuple[str, ...]:
+    """Return the signing order for a parameter set.
+
+    Twilio sends the same handful of field sets for each webhook, so the sort
+    is done once per shape.
+    """
+    return tuple(sorted(keys))
+
+
 async def _maybe_verify_twilio_signature(
-    request: Request, form_params: Dict[str, str]
+    request: Request,
+    form_params: Dict[str, str],
+    full_form: Mapping[str, Any] | None = None,
 ) -> None:
     """Optionally verify the Twilio signature on inbound webhooks.
 
@@ -99,19 +175,16 @@ async def _maybe_verify_twilio_signature(
     environment, this validates the X-Twilio-Signature header using the
     standard Twilio algorithm (URL + sorted query/body params). In production
     (ENVIRONMENT=prod) signatures are required when provider is Twilio.
+
+    Handlers gate the call on `_twilio_signature_required()`, which returns
+    before any other setting is read for the stub provider; once called, the
+    signature is always enforced. Handlers that already hold the parsed form
+    pass it as `full_form` so its string values are signed as-is instead of
+    re-reading and coercing it.
     """
-    settings = get_settings()
-    sms_cfg = settings.sms
-    env = os.getenv("ENVIRONMENT", "dev").lower()
-    provider = (getattr(sms_cfg, "provider", "") or "").lower()
+    sms_cfg = get_settings().sms
     auth_token = getattr(sms_cfg, "twilio_auth_token", None)
     replay_window = getattr(sms_cfg, "replay_protection_seconds", 300) or 300
-    require_sig = bool(
-        getattr(sms_cfg, "verify_twilio_signatures", False)
-        or (env == "prod" and provider == "twilio")
-    )
-    if provider == "stub" or not require_sig:
-        return
     if not auth_token:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -140,22 +213,25 @@ async def _maybe_verify_twilio_signature(
     params: Dict[str, str] = {}
     for key, value in request.query_params.multi_items():
         params[key] = value
-    try:
-        form = await request.form()
-    except Exception:
-        form = {}
-    for key, value in form.items():
-        params[str(key)] = str(value)
+    if full_form is not None:
+        params.update(full_form)
+    else:
+        try:
+            form = await request.form()
+        except Exception:
+            form = {}
+        for key, value in form.items():
+            params[str(key)] = str(value)
     # Include any explicitly provided form parameters as a final override to
     # keep behaviour stable with earlier revisions of this module.
     params.update(form_params)
 
-    data = url + "".join(f"{k}{params[k]}" for k in sorted(params.keys()))
-    digest = hmac.new(
-        sms_cfg.twilio_auth_token.encode("utf-8"),
-        data.encode("utf-8"),
-        hashlib.sha1,
-    ).digest()
+    # One-shot OpenSSL HMAC over the joined string; for webhook-sized payloads
+    # this beats copying a keyed HMAC object and feeding it field by field.
+    data = url + "".join(
+        [key + params[key] for key in _sorted_param_keys(frozenset(params))]
+    )
+    digest = hmac.digest(auth_token.encode("utf-8"), data.encode("utf-8"), "sha1")
     expected_sig = base64.b64encode(digest).decode("utf-8")
 
     if not hmac.compare_digest(expected_sig, twilio_sig):
@@ -222,32 +298,544 @@ def _get_business_name(business_id: str | None) -> str:
     default_name = conversation.DEFAULT_BUSINESS_NAME
     if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
         return default_name
-    session_db = SessionLocal()
-    try:
-        row = session_db.get(BusinessDB, business_id)
-    finally:
-        session_db.close()
-    if row is not None and getattr(row, "name", None):
-        return row.name
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.name:
+        return snapshot.name
     return default_name
 
 
+def _is_business_active(business_id: str | None) -> bool:
+    """Return False only when the tenant exists and is not ACTIVE."""
+    if not business_id or not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
+        return True
+    snapshot = get_business_snapshot(
+        business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+    )
+    return snapshot is None or (snapshot.status or "ACTIVE") == "ACTIVE"
+
+
+async def _run_blocking(func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a synchronous repository or DB call on the worker thread pool.
+
+    Keeps the event loop free for other webhooks while DB-backed repositories
+    wait on the database.
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+async def _load_business_snapshot(
+    business_id: str, max_age: float = BUSINESS_CACHE_TTL_SECONDS
+) -> BusinessSnapshot | None:
+    """Return the tenant snapshot, hopping to a worker thread only on a miss.
+
+    Warm turns are served from the business_config cache without touching
+    the thread pool; the DB query runs off the event loop when it is needed.
+    Handlers that reject suspended tenants pass the shorter status max_age.
+    """
+    if business_snapshot_cached(business_id, max_age):
+        return get_business_snapshot(business_id, max_age)
+    return await _run_blocking(get_business_snapshot, business_id, max_age)
+
+
+async def _notify_best_effort(
+    send: Callable[..., Awaitable[Any]],
+    /,
+    *args: Any,
+    log_event: str = "owner_notify_failed",
+    log_extra: Dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Await an SMS/email notification, logging instead of raising on failure.
+
+    Webhooks schedule this on the response's BackgroundTasks so Twilio gets
+    its TwiML without waiting on the notification provider.
+    """
+    try:
+        await send(*args, **kwargs)
+    except Exception:
+        logger.warning(log_event, exc_info=True, extra=log_extra)
+
+
+# Resolved <Say> attributes for the current SMS settings object, keyed by
+# whether the tenant language is Spanish. A settings reload returns a new
+# object, which resets the cache.
+_say_language_attr_cache: tuple[object | None, Dict[bool, str]] = (None, {})
+
+
 def _twilio_say_language_attr(language_code: str) -> str:
     """Return a TwiML language attribute for <Say> based on tenant language.
 
     The mapping is driven by SMS/Twilio settings so deployments can override
     the language codes without touching application code.
     """
-    settings = get_settings()
-    sms_cfg = settings.sms
-    lang: str | None
-    if language_code.lower().startswith("es"):
-        lang = getattr(sms_cfg, "twilio_say_language_es", None)
+    global _say_language_attr_cache
+    sms_cfg = get_settings().sms
+    cached_cfg, attrs = _say_language_attr_cache
+    if cached_cfg is not sms_cfg:
+        attrs = {}
+        _say_language_attr_cache = (sms_cfg, attrs)
+    is_es = language_code.lower().startswith("es")
+    attr = attrs.get(is_es)
+    if attr is None:
+        lang: str | None
+        if is_es:
+            lang = getattr(sms_cfg, "twilio_say_language_es", None)
+        else:
+            lang = getattr(sms_cfg, "twilio_say_language_default", None)
+        attr = f' language="{lang}"' if lang else ""
+        attrs[is_es] = attr
+    return attr
+
+
+# Dead-end TwiML documents only vary by language (and, for the voice
+# assistant error, by the configured <Say> language and voicemail action), so
+# the escaped copy is prepared once at import instead of on every request.
+_TWIML_ERROR_TEXT: Dict[tuple[str, str], str] = {
+    ("es", "voice_error"): escape(
+        "Lo siento, hubo un problema al manejar tu llamada. "
+        "Por favor cuelga e inténtalo de nuevo en unos minutos. "
+        "Si se trata de una emergencia que ponga en riesgo la vida, "
+        "cuelga ahora y llama al 911 o a tu número de emergencias local."
+    ),
+    ("en", "voice_error"): escape(
+        "Sorry, something went wrong while handling your call. "
+        "Please hang up and try again in a few minutes. "
+        "If this is a life-threatening emergency, hang up now and call 911 or your local emergency number."
+    ),
+    ("es", "owner_suspended"): escape(
+        "Este negocio está actualmente suspendido. "
+        "Por favor revisa tu panel de administración."
+    ),
+    ("en", "owner_suspended"): escape(
+        "This business is currently suspended. Please check your admin dashboard."
+    ),
+    ("es", "owner_mismatch"): escape(
+        "Esta línea está reservada para el dueño del negocio. "
+        "Si llegaste aquí por error, por favor cuelga."
+    ),
+    ("en", "owner_mismatch"): escape(
+        "This line is reserved for the business owner. "
+        "If you reached this by mistake, please hang up."
+    ),
+    ("en", "owner_error"): escape(
+        "Sorry, something went wrong while handling your call. "
+        "Please hang up and try again in a few minutes."
+    ),
+}
+
+# Response skeletons shared by the voice, owner IVR and SMS webhooks. Callers pass
+# already-escaped text; `lang` is the optional <Say> language attribute.
+_TWIML_SAY_GATHER_DTMF = (
+    '<Response><Say voice="alice"{lang}>{prompt}</Say>'
+    '<Gather input="dtmf" numDigits="1" action="{action}" method="POST" />'
+    "</Response>"
+)
+_TWIML_SAY_HANGUP = (
+    '<Response><Say voice="alice"{lang}>{prompt}</Say><Hangup/></Response>'
+)
+_TWIML_OWNER_FOLLOWUP = (
+    '<Pause length="1"/><Say voice="alice"{lang}>{followup}</Say>'
+    '<Gather input="dtmf" numDigits="1" action="{action}" method="POST" />'
+    "</Response>"
+)
+_TWIML_SAY_GATHER_SPEECH = (
+    '<Response><Say voice="alice"{lang}>{prompt}</Say>'
+    '<Gather input="speech" action="{action}" method="POST"{timeout} />'
+    "</Response>"
+)
+_TWIML_SAY_GATHER_SPEECH_DTMF = (
+    '<Response><Say voice="alice"{lang}>{prompt}</Say>'
+    '<Gather input="speech dtmf" numDigits="1" action="{action}" method="POST"'
+    "{timeout} /></Response>"
+)
+_TWIML_SAY_RECORD_HANGUP = (
+    '<Response><Say voice="alice"{lang}>{prompt}</Say>{record}<Hangup/></Response>'
+)
+_TWIML_STREAM_SAY = (
+    '<Response><Start><Stream url="{stream_url}" /></Start>'
+    '<Say voice="alice"{lang}>{prompt}</Say></Response>'
+)
+_TWIML_SAY = '<Response><Say voice="alice"{lang}>{prompt}</Say></Response>'
+# Opening half of a document whose tail (e.g. _TWIML_OWNER_FOLLOWUP) is
+# rendered separately.
+_TWIML_OPEN_SAY = '<Response><Say voice="alice"{lang}>{prompt}</Say>'
+_TWIML_RECORD_VOICEMAIL = (
+    '<Record action="{action}" method="POST" playBeep="true" timeout="5" />'
+)
+# Frames for replies built per request: only the escaped text is encoded
+# and joined in between, with no format() pass over the whole document.
+_TWIML_MESSAGE_OPEN = b"<Response><Message>"
+_TWIML_MESSAGE_CLOSE = b"</Message></Response>"
+_TWIML_BARE_SAY_OPEN = b"<Response><Say>"
+_TWIML_BARE_SAY_CLOSE = b"</Say></Response>"
+_TWIML_EMPTY = b"<Response/>"
+_TWIML_REJECTED = b"<Response></Response>"
+_FALLBACK_TWIML = (
+    b'<Response><Say voice="Polly.Joanna">We are unable to take your call at '
+    b"the moment. We will call you back shortly.</Say></Response>"
+)
+_TWIML_VOICEMAIL_RECEIVED = _TWIML_SAY.format(
+    lang="",
+    prompt=escape(
+        "Thank you. We received your message and will call you back shortly."
+    ),
+).encode("utf-8")
+
+# Fixed voice prompts (no-input re-prompts, hand-offs, acknowledgements),
+# escaped once.
+_VOICE_PROMPT_TEXT: Dict[tuple[str, str], str] = {
+    ("es", "voice_silent"): escape(
+        "No alcancAc a escucharte bien. Por favor di tu respuesta o marca 1 para sA- o 2 para no."
+    ),
+    ("en", "voice_silent"): escape(
+        "I'm having trouble hearing you. Please say your answer, or press 1 for yes or 2 for no."
+    ),
+    ("es", "voice_voicemail"): escape(
+        "Tengo problemas para escucharte. Te enviarAc al buzA3n de voz para que dejes tu nombre y direcciA3n."
+    ),
+    ("en", "voice_voicemail"): escape(
+        "I'm having trouble hearing you. I'm sending you to voicemail so you can leave your name and address."
+    ),
+    ("es", "assistant_silent"): escape(
+        "No escuchA© tu respuesta. Por favor di tu respuesta o presiona 1 para sA- o 2 para no."
+    ),
+    ("en", "assistant_silent"): escape(
+        "I didn't catch that. Please say your answer, or press 1 for yes or 2 for no."
+    ),
+    ("es", "assistant_voicemail"): escape(
+        "Tengo problemas para escucharte. Te transferirAc para que dejes un breve buzA3n de voz con tu nombre y direcciA3n."
+    ),
+    ("en", "assistant_voicemail"): escape(
+        "I'm having trouble hearing you. I'm sending you to voicemail so you can leave your name and address."
+    ),
+    ("en", "assistant_error"): escape(
+        "Sorry, something went wrong while handling your call. "
+        "Please hang up and try again later."
+    ),
+    ("en", "assistant_connecting"): escape("Connecting you to the assistant."),
+    ("es", "owner_summary_sent"): escape(
+        "De acuerdo, te he enviado este resumen por mensaje de texto. Adiós."
+    ),
+    ("en", "owner_summary_sent"): escape(
+        "Okay, I've sent this summary to you by text message. Goodbye."
+    ),
+}
+
+# Owner-line dead ends do not carry a <Say> language attribute, so the full
+# documents can be encoded up front.
+_TWIML_ERROR: Dict[tuple[str, str], bytes] = {
+    (lang, kind): (
+        f'<Response><Say voice="alice">{text}</Say><Hangup/></Response>'
+    ).encode("utf-8")
+    for (lang, kind), text in _TWIML_ERROR_TEXT.items()
+    if kind.startswith("owner_")
+}
+
+
+# Most reply text has nothing to escape; skip the rewrite for those strings.
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']").search
+
+
+def _fast_escape(text: str) -> str:
+    return escape(text) if _NEEDS_ESCAPE(text) else text
+
+
+def _twiml_message(text: str) -> bytes:
+    """Return an encoded <Message> reply; all SMS text is escaped here."""
+    return (
+        _TWIML_MESSAGE_OPEN + _fast_escape(text).encode("utf-8") + _TWIML_MESSAGE_CLOSE
+    )
+
+
+def _twiml_say(text: str) -> bytes:
+    """Return an encoded bare <Say> reply; the text is escaped here."""
+    return (
+        _TWIML_BARE_SAY_OPEN
+        + _fast_escape(text).encode("utf-8")
+        + _TWIML_BARE_SAY_CLOSE
+    )
+
+
+# Fixed SMS replies for the pending-action flow, encoded once per language.
+_SMS_STATIC_TEXT: Dict[tuple[str, str], str] = {
+    ("en", "noted"): "Thanks, noted.",
+    ("es", "noted"): "Gracias, anotado.",
+    ("en", "declined"): "Okay, keeping your current appointment.",
+    ("es", "declined"): "Listo, mantenemos tu cita actual.",
+    ("en", "remind"): "Please reply YES to confirm or NO to keep your current time.",
+    ("es", "remind"): "Responde SI para confirmar o NO para mantener tu hora actual.",
+    ("en", "rescheduled"): "Got it. We've marked your appointment for rescheduling.",
+    ("es", "rescheduled"): "Entendido. Hemos marcado tu cita para reprogramar.",
+    ("en", "error"): (
+        "Sorry, something went wrong while handling your message. "
+        "Please try again in a few minutes. "
+        "If this is a life-threatening emergency, call 911 or your local emergency number instead of texting."
+    ),
+    ("es", "error"): (
+        "Lo siento, hubo un problema al manejar tu mensaje. "
+        "Por favor inténtalo de nuevo en unos minutos. "
+        "Si se trata de una emergencia que ponga en riesgo la vida, "
+        "llama al 911 o a tu número de emergencias local en lugar de enviar un mensaje de texto."
+    ),
+}
+_SMS_STATIC_REPLY: Dict[tuple[str, str], bytes] = {
+    key: _twiml_message(text) for key, text in _SMS_STATIC_TEXT.items()
+}
+
+# SMS copy with per-request fields; filled with str.format(business_name=...)
+# or, for the appointment replies, str.format(when=...).
+_SMS_TEMPLATE_TEXT: Dict[tuple[str, str], str] = {
+    ("en", "missed_call"): (
+        "Sorry we couldn't finish your call with {business_name}. "
+        "If you still need help, please reply with a quick summary of the issue "
+        "and we'll follow up."
+    ),
+    ("es", "missed_call"): (
+        "Sentimos no haber podido completar tu llamada con {business_name}. "
+        "Si aun necesitas ayuda, respóndenos con un breve resumen del problema "
+        "y te contactaremos."
+    ),
+    ("en", "opted_out"): (
+        "You have opted out of SMS notifications from {business_name}. "
+        "Reply START to opt back in."
+    ),
+    ("es", "opted_out"): (
+        "Te has dado de baja de las notificaciones por SMS de {business_name}. "
+        "Responde START para volver a activarlas."
+    ),
+    ("en", "opted_in"): (
+        "You have been opted back in to SMS notifications from {business_name}."
+    ),
+    ("es", "opted_in"): (
+        "Has vuelto a activar las notificaciones por SMS de {business_name}."
+    ),
+    ("en", "no_appointment"): (
+        "We could not find an upcoming appointment linked to this number for "
+        "{business_name}. If this seems wrong, please call or text us with more details."
+    ),
+    ("es", "no_appointment"): (
+        "No pudimos encontrar una pr?xima cita vinculada a este n?mero. Si crees que "
+        "esto es un error, por favor llama o env?anos un mensaje de texto con m?s detalles."
+    ),
+    ("en", "cancelled"): "Your appointment on {when} has been cancelled.",
+    ("es", "cancelled"): "Tu cita el {when} ha sido cancelada.",
+    ("en", "cancel_prompt"): (
+        "Reply YES to cancel your appointment on {when}, or NO to keep it."
+    ),
+    ("es", "cancel_prompt"): (
+        "Responde SI para cancelar tu cita el {when}, o NO para mantenerla."
+    ),
+    ("en", "reschedule_prompt"): (
+        "Reply YES to mark your appointment on {when} for rescheduling, or NO to keep it."
+    ),
+    ("es", "reschedule_prompt"): (
+        "Responde SI para marcar tu cita el {when} para reprogramar, o NO para mantenerla."
+    ),
+    ("en", "confirmed"): "Thanks. Your upcoming appointment on {when} is confirmed.",
+    ("es", "confirmed"): "Gracias. Tu pr?xima cita el {when} ha sido confirmada.",
+}
+
+
+@lru_cache(maxsize=256)
+def _sms_no_appointment_reply(lang: str, business_name: str) -> bytes:
+    """Return the encoded "no upcoming appointment" reply for a tenant name."""
+    return _twiml_message(
+        _SMS_TEMPLATE_TEXT[(lang, "no_appointment")].format(business_name=business_name)
+    )
+
+
+# Media-stream no-input replies travel as JSON, so they are not escaped.
+_STREAM_PROMPT_TEXT: Dict[tuple[str, str], str] = {
+    ("en", "silent"): (
+        "I'm having trouble hearing you. Please say your answer or press 1 for yes or 2 for no."
+    ),
+    ("es", "silent"): (
+        "No alcanzo a escucharte bien. Por favor di tu respuesta o marca 1 para sí o 2 para no."
+    ),
+    ("en", "followup"): (
+        "I'm having trouble hearing you. We'll follow up shortly to finish scheduling."
+    ),
+    ("es", "followup"): (
+        "Tengo problemas para escucharte. Te enviaremos un seguimiento para programar tu servicio."
+    ),
+}
+
+
+def _twiml_lang(language_code: str) -> str:
+    """Collapse a tenant language code to the copy key used for TwiML text."""
+    return "es" if language_code == "es" else "en"
+
+
+@lru_cache(maxsize=32)
+def _say_prompt_twiml(prompt: str, say_language_attr: str) -> bytes:
+    """Return an encoded bare <Say> document for pre-escaped table copy."""
+    return _TWIML_SAY.format(lang=say_language_attr, prompt=prompt).encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _say_gather_retry_twiml(
+    prompt: str, say_language_attr: str, action: str, timeout: str
+) -> bytes:
+    """Return the encoded no-input re-prompt (<Say> + speech/DTMF <Gather>).
+
+    Like the voicemail hand-off below, `prompt` comes pre-escaped from
+    _VOICE_PROMPT_TEXT, so each (prompt, language, action) document is
+    formatted and encoded once.
+    """
+    return _TWIML_SAY_GATHER_SPEECH_DTMF.format(
+        lang=say_language_attr, prompt=prompt, action=action, timeout=timeout
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=128)
+def _say_record_hangup_twiml(
+    prompt: str, say_language_attr: str, record_action: str | None
+) -> bytes:
+    """Return an encoded <Say>, optional voicemail <Record>, <Hangup> document.
+
+    `prompt` is pre-escaped copy from the prompt tables, so the handful of
+    (prompt, language, voicemail action) variants are built once each. The
+    key includes the resolved <Say> attribute so a settings reload that
+    changes the configured languages produces a fresh document.
+    """
+    record_block = ""
+    if record_action:
+        record_block = _TWIML_RECORD_VOICEMAIL.format(action=record_action)
+    return _TWIML_SAY_RECORD_HANGUP.format(
+        lang=say_language_attr, prompt=prompt, record=record_block
+    ).encode("utf-8")
+
+
+def _voicemail_record_action(business_id: str, scoped: bool) -> str | None:
+    """Return the voicemail <Record> callback, or None when voicemail is off."""
+    if not getattr(get_settings().sms, "enable_voicemail", True):
+        return None
+    return _webhook_action(_VOICEMAIL_ACTION, business_id, scoped)
+
+
+_VOICE_ACTION = "/twilio/voice"
+_VOICE_ASSISTANT_ACTION = "/twilio/voice-assistant"
+_OWNER_VOICE_ACTION = "/twilio/owner-voice"
+_VOICEMAIL_ACTION = "/twilio/voicemail"
+
+
+@lru_cache(maxsize=4096)
+def _quote_business_id(business_id: str) -> str:
+    """URL-quote a tenant id once; ids repeat across every turn of a call."""
+    return quote(business_id, safe="")
+
+
+@lru_cache(maxsize=4096)
+def _webhook_action(path: str, business_id: str, scoped: bool, query: str = "") -> str:
+    """Return a Twilio callback URL, keeping ``business_id`` when scoped.
+
+    Tenants reached through a ``?business_id=`` webhook must get it back on
+    every <Gather>/<Record> action so follow-up turns stay routed to them.
+    The URL only depends on the arguments, so each turn after the first is a
+    cache hit.
+    """
+    if scoped:
+        tenant = f"business_id={_quote_business_id(business_id)}"
+        query = f"{tenant}&{query}" if query else tenant
+    return f"{path}?{query}" if query else path
+
+
+def _owner_voice_action(business_id: str, scoped: bool, query: str = "") -> str:
+    """Return the owner IVR Gather action, keeping the tenant when scoped."""
+    return _webhook_action(_OWNER_VOICE_ACTION, business_id, scoped, query)
+
+
+@lru_cache(maxsize=4096)
+def _build_menu_twiml(
+    language_code: str,
+    say_language_attr: str,
+    business_name: str,
+    scoped: bool,
+    business_id: str,
+) -> bytes:
+    """Return the encoded owner IVR main menu for a tenant.
+
+    Renamed businesses simply miss the cache; stale entries age out of the LRU.
+    """
+    if language_code == "es":
+        prompt = (
+            f"Hola, esta es la línea del dueño para {business_name}. "
+            "Para el horario de mañana, marca 1. "
+            "Para las citas de emergencia de los últimos siete días, marca 2. "
+            "Para un resumen de tu pipeline, marca 3."
+        )
     else:
-        lang = getattr(sms_cfg, "twilio_say_language_default", None)
-    if not lang:
-        return ""
-    return f' language="{lang}"'
+        prompt = (
+            f"Hello, this is the owner line for {business_name}. "
+            "For tomorrow's schedule, press 1. "
+            "For emergency appointments in the last seven days, press 2. "
+            "For your pipeline summary, press 3."
+        )
+    return _TWIML_SAY_GATHER_DTMF.format(
+        lang=say_language_attr,
+        prompt=_fast_escape(prompt),
+        action=_owner_voice_action(business_id, scoped),
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _build_invalid_selection_twiml(
+    language_code: str, say_language_attr: str, scoped: bool, business_id: str
+) -> bytes:
+    """Return the encoded re-prompt for an unrecognised owner menu digit."""
+    prompt = _owner_summary_for_selection(
+        "invalid",
+        business_id=business_id,
+        language_code=language_code,
+        business_name="",
+    )
+    return _TWIML_SAY_GATHER_DTMF.format(
+        lang=say_language_attr,
+        prompt=_fast_escape(prompt),
+        action=_owner_voice_action(business_id, scoped),
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
+def _build_followup_twiml(
+    selection: str,
+    language_code: str,
+    say_language_attr: str,
+    scoped: bool,
+    business_id: str,
+) -> bytes:
+    """Return the encoded tail read after an owner summary.
+
+    The summary itself depends on live data, so callers prepend its <Say>.
+    """
+    if language_code == "es":
+        followup_prompt = (
+            "Para escuchar otro resumen, marca 1. "
+            "Para recibir este resumen por mensaje de texto, marca 9. "
+            "También puedes colgar en cualquier momento."
+        )
+    else:
+        followup_prompt = (
+            "For another owner summary, press 1. "
+            "To receive this summary by text message, press 9. "
+            "Or you can hang up at any time."
+        )
+    return _TWIML_OWNER_FOLLOWUP.format(
+        lang=say_language_attr,
+        followup=_fast_escape(followup_prompt),
+        action=_owner_voice_action(
+            business_id, scoped, f"step=post&selection={selection}"
+        ),
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def _build_summary_sent_twiml(copy_lang: str, say_language_attr: str) -> bytes:
+    """Return the encoded goodbye played after texting the owner a summary."""
+    return _TWIML_SAY_HANGUP.format(
+        lang=say_language_attr,
+        prompt=_VOICE_PROMPT_TEXT[(copy_lang, "owner_summary_sent")],
+    ).encode("utf-8")
 
 
 def _build_stream_url(
@@ -283,17 +871,24 @@ def _build_stream_url(
 
 
 def _safe_int(value: object, default: int) -> int:
+    if type(value) is int:
+        return value
     try:
         return int(value)  # type: ignore[arg-type]
     except (TypeError, ValueError):
         return default
 
 
-def _stream_min_bytes(sample_rate: int, encoding: str, min_seconds: float) -> int:
+@lru_cache(maxsize=32)
+def _bytes_per_sample(encoding: str | None) -> int:
+    """Return 1 for mu-law stream encodings and 2 for 16-bit PCM."""
     encoding_norm = (encoding or "").lower()
-    bytes_per_sample = 1 if ("mulaw" in encoding_norm or "ulaw" in encoding_norm) else 2
+    return 1 if ("mulaw" in encoding_norm or "ulaw" in encoding_norm) else 2
+
+
+def _stream_min_bytes(sample_rate: int, encoding: str, min_seconds: float) -> int:
     safe_seconds = max(min_seconds, 0.1)
-    return max(1, int(sample_rate * bytes_per_sample * safe_seconds))
+    return max(1, int(sample_rate * _bytes_per_sample(encoding) * safe_seconds))
 
 
 # audioop was removed in Python 3.13; keep a local mu-law decoder for streaming.
@@ -313,44 +908,63 @@ def _build_mulaw_decode_table() -> tuple[int, ...]:
 
 
 _MULAW_DECODE_TABLE = _build_mulaw_decode_table()
+# Each mu-law byte pre-packed as its little-endian 16-bit WAV sample.
+_MULAW_PAIRS: tuple[bytes, ...] = tuple(
+    struct.pack("<h", sample) for sample in _MULAW_DECODE_TABLE
+)
 
 
-def _mulaw_to_pcm(payload: bytes) -> bytes:
+def _mulaw_to_pcm(payload: bytes | memoryview) -> bytes:
     if not payload:
         return b""
-    pcm = bytearray(len(payload) * 2)
-    for idx, byte_value in enumerate(payload):
-        struct.pack_into("<h", pcm, idx * 2, _MULAW_DECODE_TABLE[byte_value])
-    return bytes(pcm)
+    return b"".join(map(_MULAW_PAIRS.__getitem__, payload))
+
+
+@lru_cache(maxsize=16)
+def _wav_fmt_chunk(sample_rate: int, sample_width: int) -> bytes:
+    """Return the "WAVE" tag plus the mono PCM "fmt " chunk for a stream."""
+    return struct.pack(
+        "<4s4sIHHIIHH",
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        1,
+        sample_rate,
+        sample_rate * sample_width,
+        sample_width,
+        sample_width * 8,
+    )
 
 
-def _pcm_to_wav_bytes(
-    pcm_bytes: bytes, sample_rate: int, sample_width: int = 2
-) -> bytes:
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(1)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm_bytes)
-    return buffer.getvalue()
+def _wav_header(sample_rate: int, sample_width: int, data_len: int) -> bytes:
+    """Return the 44-byte RIFF header for `data_len` bytes of mono PCM."""
+    return (
+        struct.pack("<4sI", b"RIFF", 36 + data_len)
+        + _wav_fmt_chunk(sample_rate, sample_width)
+        + struct.pack("<4sI", b"data", data_len)
+    )
 
 
 def _twilio_payload_to_wav_base64(
-    payload: bytes, encoding: str, sample_rate: int
+    payload: bytes | memoryview, encoding: str, sample_rate: int
 ) -> str | None:
     if not payload:
         return None
-    encoding_norm = (encoding or "").lower()
-    pcm_bytes = payload
-    sample_width = 2
-    if "mulaw" in encoding_norm or "ulaw" in encoding_norm:
+    is_mulaw = _bytes_per_sample(encoding) == 1
+    data_len = len(payload) * 2 if is_mulaw else len(payload)
+    # Frame header and PCM in one buffer and encode it directly, rather than
+    # building separate PCM, WAV and header/body copies first.
+    wav = bytearray(44 + data_len)
+    wav[:44] = _wav_header(sample_rate, 2, data_len)
+    if is_mulaw:
         try:
-            pcm_bytes = _mulaw_to_pcm(payload)
+            wav[44:] = _mulaw_to_pcm(payload)
         except Exception:
             return None
-    wav_bytes = _pcm_to_wav_bytes(pcm_bytes, sample_rate, sample_width=sample_width)
-    return base64.b64encode(wav_bytes).decode("ascii")
+    else:
+        wav[44:] = payload
+    return base64.b64encode(wav).decode("ascii")
 
 
 def _find_next_appointment_for_phone(
@@ -362,26 +976,16 @@ def _find_next_appointment_for_phone(
     This is intentionally conservative: we only look for the earliest future
     appointment and ignore cancelled ones.
     """
-    from datetime import UTC, datetime as _dt  # local import to avoid cycles
-
-    now = _dt.now(UTC)
+    now = datetime.now(UTC)
+    # The DB repository resolves customer and appointment in one joined query.
+    by_phone = getattr(appointments_repo, "next_upcoming_for_phone", None)
+    if by_phone is not None:
+        return by_phone(phone, business_id, now)
     # Resolve customer first; if we cannot, bail out.
     customer = customers_repo.get_by_phone(phone, business_id=business_id)
     if not customer:
         return None
-    upcoming = []
-    for appt in appointments_repo.list_for_business(business_id):
-        if appt.customer_id != customer.id:
-            continue
-        if getattr(appt, "status", "").upper() == "CANCELLED":
-            continue
-        if appt.start_time <= now:
-            continue
-        upcoming.append(appt)
-    if not upcoming:
-        return None
-    upcoming.sort(key=lambda a: a.start_time)
-    return upcoming[0]
+    return appointments_repo.next_upcoming_for_customer(customer.id, business_id, now)
 
 
 def _format_appointment_time(appt) -> str:
@@ -391,27 +995,90 @@ def _format_appointment_time(appt) -> str:
     return when.strftime("%a %b %d at %I:%M %p UTC")
 
 
+# Striped locks so concurrent first messages from one phone create a single
+# conversation without serializing unrelated senders.
+_SMS_CONVERSATION_LOCKS = tuple(threading.Lock() for _ in range(32))
+
+
 def _ensure_sms_conversation(business_id: str, from_phone: str) -> Conversation | None:
-    """Return or create the SMS conversation for a customer/phone."""
+    """Return or create the SMS conversation for a customer/phone.
 
-    link = twilio_state_store.get_sms_conversation(business_id, from_phone)
-    conv = conversations_repo.get(link.conversation_id) if link else None
-    if conv:
+    The link lookup, conversation fetch and creation run as one critical
+    section per (business, phone), so callers need a single worker-thread hop.
+    """
+    lock_index = hash((business_id, from_phone)) % len(_SMS_CONVERSATION_LOCKS)
+    with _SMS_CONVERSATION_LOCKS[lock_index]:
+        link = twilio_state_store.get_sms_conversation(business_id, from_phone)
+        conv = conversations_repo.get(link.conversation_id) if link else None
+        if conv:
+            return conv
+        customer = customers_repo.get_by_phone(from_phone, business_id=business_id)
+        conv = conversations_repo.create(
+            channel="sms",
+            customer_id=customer.id if customer else None,
+            business_id=business_id,
+        )
+        twilio_state_store.set_sms_conversation(business_id, from_phone, conv.id)
         return conv
-    customer = customers_repo.get_by_phone(from_phone, business_id=business_id)
-    conv = conversations_repo.create(
-        channel="sms",
+
+
+async def _sms_conversation_id(business_id: str, from_phone: str) -> str | None:
+    """Return the SMS conversation id for a customer/phone, creating it if needed.
+
+    Repeat messages within the short L1 window skip the worker-thread hop.
+    """
+    conv_id = cached_sms_conversation_id(business_id, from_phone)
+    if conv_id is not None:
+        return conv_id
+    conv = await _run_blocking(_ensure_sms_conversation, business_id, from_phone)
+    if conv is None:
+        return None
+    remember_sms_conversation_id(business_id, from_phone, conv.id)
+    return conv.id
+
+
+def _create_call_conversation(
+    business_id: str, caller_phone: str | None, session_id: str
+) -> Conversation:
+    """Create the phone conversation for a new call session.
+
+    The customer lookup and the insert share one worker-thread hop so call
+    setup does not hold the event loop on the database.
+    """
+    customer = (
+        customers_repo.get_by_phone(caller_phone, business_id=business_id)
+        if caller_phone
+        else None
+    )
+    return conversations_repo.create(
+        channel="phone",
         customer_id=customer.id if customer else None,
+        session_id=session_id,
         business_id=business_id,
     )
-    twilio_state_store.set_sms_conversation(business_id, from_phone, conv.id)
-    return conv
 
 
-def _email_alerts_enabled(business_row: BusinessDB | None) -> bool:
-    if business_row is None:
+def _session_conversation_id(session: Any) -> str | None:
+    """Return the conversation id logged for a call session.
+
+    Handlers stash the id on the session when they create the conversation,
+    so continuation turns skip the repository lookup. Sessions persisted
+    before the field existed fall back to get_by_session once.
+    """
+    conv_id = getattr(session, "conversation_id", None)
+    if conv_id:
+        return conv_id
+    conv = conversations_repo.get_by_session(session.id)
+    if conv is None:
+        return None
+    session.conversation_id = conv.id
+    return conv.id
+
+
+def _email_alerts_enabled(business: BusinessSnapshot | None) -> bool:
+    if business is None:
         return True
-    val = getattr(business_row, "owner_email_alerts_enabled", None)
+    val = getattr(business, "owner_email_alerts_enabled", None)
     return True if val is None else bool(val)
 
 
@@ -419,7 +1086,7 @@ async def _maybe_alert_on_speech_circuit(
     business_id: str,
     owner_phone: str | None,
     owner_email: str | None,
-    business_row: BusinessDB | None,
+    business: BusinessSnapshot | None,
     call_sid: str | None = None,
 ) -> None:
     """Notify owners when the speech circuit is open to prompt troubleshooting."""
@@ -435,18 +1102,14 @@ async def _maybe_alert_on_speech_circuit(
     if last_error:
         base_message = f"Speech provider issue: {last_error}. Using fallback prompts."
     alert_sent = False
-    if owner_phone or (owner_email and _email_alerts_enabled(business_row)):
+    if owner_phone or (owner_email and _email_alerts_enabled(business)):
         try:
-            from ..services.owner_notifications import notify_owner_with_fallback
-
             result = await notify_owner_with_fallback(
                 business_id=business_id,
                 message=base_message,
                 subject="Speech provider degraded",
                 dedupe_key="speech_circuit_open",
-                send_email_copy=bool(
-                    owner_email and _email_alerts_enabled(business_row)
-                ),
+                send_email_copy=bool(owner_email and _email_alerts_enabled(business)),
             )
             alert_sent = result.delivered
         except Exception:
@@ -459,25 +1122,56 @@ async def _maybe_alert_on_speech_circuit(
         metrics.speech_alerted_businesses.add(business_id)
 
 
+# The owner IVR re-reads the same summaries as the owner moves through the
+# menu, so each one is reused for a short window instead of re-scanning the
+# tenant's appointments on every key press. Appointment writes do not
+# invalidate it, so a summary can lag new bookings by up to the TTL. The map
+# is bounded because business ids arrive from the webhook query string.
+OWNER_SUMMARY_TTL_SECONDS = 60.0
+_OWNER_SUMMARY_CACHE_MAX = 4096
+
+_owner_summary_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+_owner_summary_lock = threading.Lock()
+
+
+def invalidate_owner_summary_cache() -> None:
+    """Drop every cached owner IVR summary."""
+    with _owner_summary_lock:
+        _owner_summary_cache.clear()
+
+
+def _cached_owner_summary(kind: str, business_id: str, load: Callable[[], T]) -> T:
+    """Return the `kind` summary for a tenant, loading it at most once per TTL.
+
+    Summaries may be up to OWNER_SUMMARY_TTL_SECONDS stale.
+    """
+    now = time.monotonic()
+    key = (kind, business_id)
+    with _owner_summary_lock:
+        cached = _owner_summary_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                return cached[1]
+            del _owner_summary_cache[key]
+    value = load()
+    with _owner_summary_lock:
+        _owner_summary_cache[key] = (now + OWNER_SUMMARY_TTL_SECONDS, value)
+        _owner_summary_cache.move_to_end(key)
+        while len(_owner_summary_cache) > _OWNER_SUMMARY_CACHE_MAX:
+            _owner_summary_cache.popitem(last=False)
+    return value
+
+
 def _owner_emergency_counts_last_days(business_id: str, days: int) -> tuple[int, int]:
     """Return (total_appointments, emergency_appointments) for the last N days."""
-    now = datetime.now(UTC)
-    window = now - timedelta(days=days)
-    total = 0
-    emergency = 0
-    for appt in appointments_repo.list_for_business(business_id):
-        start_time = getattr(appt, "start_time", None)
-        if not start_time:
-            continue
-        if start_time < window or start_time > now:
-            continue
-        status = getattr(appt, "status", "SCHEDULED").upper()
-        if status not in {"SCHEDULED", "CONFIRMED"}:
-            continue
-        total += 1
-        if bool(getattr(appt, "is_emergency", False)):
-            emergency += 1
-    return total, emergency
+
+    def load() -> tuple[int, int]:
+        now = datetime.now(UTC)
+        return appointments_repo.active_counts_between(
+            business_id, now - timedelta(days=days), now
+        )
+
+    return _cached_owner_summary(f"emergency_{days}d", business_id, load)
 
 
 def _owner_summary_for_selection(
@@ -493,7 +1187,11 @@ def _owner_summary_for_selection(
     """
     # Tomorrow's schedule.
     if selection == "1":
-        schedule = owner_routes.tomorrow_schedule(business_id=business_id)
+        schedule = _cached_owner_summary(
+            "schedule",
+            business_id,
+            partial(owner_routes.tomorrow_schedule, business_id=business_id),
+        )
         if language_code == "es":
             appointments = list(schedule.appointments or [])
             if not appointments:
@@ -533,7 +1231,11 @@ def _owner_summary_for_selection(
 
     # Pipeline summary for the last 30 days.
     if selection == "3":
-        pipeline = owner_routes.owner_pipeline(business_id=business_id, days=30)
+        pipeline = _cached_owner_summary(
+            "pipeline_30d",
+            business_id,
+            partial(owner_routes.owner_pipeline, business_id=business_id, days=30),
+        )
         stages = pipeline.stages
         total_value = pipeline.total_estimated_value or 0.0
         if language_code == "es":
@@ -571,18 +1273,44 @@ def _owner_summary_for_selection(
     )
 
 
+# Twilio call statuses that end a call; tenants may add more via
+# BusinessDB.twilio_missed_statuses.
+_CALL_ENDED_STATUSES = frozenset(
+    {"completed", "canceled", "busy", "failed", "no-answer"}
+)
+
+
+@lru_cache(maxsize=256)
+def _tenant_missed_statuses(raw: str) -> frozenset[str]:
+    """Parse a tenant's comma-separated extra "missed" call statuses."""
+    return frozenset(p.strip().lower() for p in raw.split(",") if p.strip())
+
+
+def _is_duplicate_call_event(call_sid: str, event_id: str, call_status: str) -> bool:
+    """Return True (and log) when this terminal callback was already handled."""
+    link = twilio_state_store.get_call_session(call_sid)
+    if link is None or getattr(link, "last_event_id", None) != event_id:
+        return False
+    logger.info(
+        "twilio_webhook_duplicate",
+        extra={"call_sid": call_sid, "event_id": event_id, "status": call_status},
+    )
+    return True
+
+
 def _build_gather_twiml(
     reply_text: str,
     action: str,
     say_language_attr: str,
-) -> str:
-    safe_reply = escape(reply_text)
-    return f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-  <Gather input="speech" action="{action}" method="POST" speechTimeout="auto" />
-</Response>
-""".strip()
+    speech_timeout_auto: bool = True,
+) -> bytes:
+    """Return an encoded <Say> + speech <Gather> turn; the text is escaped here."""
+    return _TWIML_SAY_GATHER_SPEECH.format(
+        lang=say_language_attr,
+        prompt=_fast_escape(reply_text),
+        action=action,
+        timeout=' speechTimeout="auto"' if speech_timeout_auto else "",
+    ).encode("utf-8")
 
 
 @router.post("/voice", response_class=Response)
@@ -607,17 +1335,41 @@ async def twilio_voice(
     # tenant; otherwise we fall back to the default single-tenant ID.
     call_sid_ctx.set(CallSid)
     business_id = business_id_param or DEFAULT_BUSINESS_ID
-    business_row: BusinessDB | None = None
+    business: BusinessSnapshot | None = None
 
-    logger.info(
-        "twilio_voice_webhook",
-        extra={
-            "business_id": business_id,
-            "call_sid": CallSid,
-            "from": From,
-            "call_status": CallStatus,
-        },
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "twilio_voice_webhook",
+            extra={
+                "business_id": business_id,
+                "call_sid": CallSid,
+                "from": From,
+                "call_status": CallStatus,
+            },
+        )
+
+    # Optional signature verification.
+    if _twilio_signature_required():
+        # The form was parsed (and cached by Starlette) to bind the fields
+        # above; sign over it directly.
+        await _maybe_verify_twilio_signature(
+            request, {}, full_form=await request.form()
+        )
+
+    # Uptime pings and redelivered terminal callbacks are no-ops; answer them
+    # before any subscription, onboarding or tenant lookups.
+    if uptime_check_param:
+        return Response(content=_TWIML_EMPTY, media_type="text/xml")
+    event_id = request.headers.get("X-Twilio-EventId") or request.headers.get(
+        "Twilio-Event-Id"
     )
+    if (
+        event_id
+        and CallStatus
+        and CallStatus.lower() in _CALL_ENDED_STATUSES
+        and _is_duplicate_call_event(CallSid, event_id, CallStatus)
+    ):
+        return Response(content=_TWIML_EMPTY, media_type="text/xml")
 
     sub_state = await subscription_service.check_access(
         business_id, feature="calls", upcoming_calls=1, graceful=True
@@ -625,104 +1377,74 @@ async def twilio_voice(
     if sub_state.blocked:
         msg = sub_state.message or "Subscription inactive. Calls are paused."
         return Response(
-            content=f"<Response><Say>{escape(msg)}</Say></Response>",
+            content=_twiml_say(msg),
             media_type="text/xml",
             status_code=status.HTTP_200_OK,
         )
 
     # Track Twilio voice webhook usage.
     metrics.twilio_voice_requests += 1
-    per_tenant = metrics.twilio_by_business.setdefault(
-        business_id, BusinessTwilioMetrics()
-    )
+    per_tenant = metrics.twilio_by_business[business_id]
     per_tenant.voice_requests += 1
 
     # Enforce onboarding completion for telephony flows unless disabled in tests.
     await ensure_onboarding_ready(business_id)
 
-    # Resolve language once for this call so we can adjust TwiML voices and
-    # error messages when tenants are configured for Spanish.
-    language_code = get_language_for_business(business_id)
-    say_language_attr = _twilio_say_language_attr(language_code)
-
     owner_phone = None
     owner_email = None
     # If the business is suspended, reject early.
-    conv_id_for_log: str | None = None
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            business_row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if (
-            business_row is not None
-            and getattr(business_row, "status", "ACTIVE") != "ACTIVE"
-        ):
+        business = await _load_business_snapshot(
+            business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+        )
+        if business is not None and getattr(business, "status", "ACTIVE") != "ACTIVE":
             logger.warning(
                 "twilio_voice_business_suspended",
                 extra={"business_id": business_id, "call_sid": CallSid},
             )
             return Response(
-                content="<Response></Response>",
+                content=_TWIML_REJECTED,
                 media_type="text/xml",
                 status_code=status.HTTP_403_FORBIDDEN,
             )
-        if business_row is not None:
-            owner_phone = getattr(business_row, "owner_phone", None)
-            owner_email = getattr(business_row, "owner_email", None)
+        if business is not None:
+            owner_phone = getattr(business, "owner_phone", None)
+            owner_email = getattr(business, "owner_email", None)
 
-    await _maybe_alert_on_speech_circuit(
-        business_id, owner_phone, owner_email, business_row, call_sid=CallSid
-    )
-
-    # Optional signature verification.
-    form_params: Dict[str, str] = {"CallSid": CallSid}
-    if From is not None:
-        form_params["From"] = From
-    if CallStatus is not None:
-        form_params["CallStatus"] = CallStatus
-    if SpeechResult is not None:
-        form_params["SpeechResult"] = SpeechResult
-    await _maybe_verify_twilio_signature(request, form_params)
+    # Resolve language once for this call so we can adjust TwiML voices and
+    # error messages when tenants are configured for Spanish. The snapshot
+    # lookup above has already warmed the cache entry this reads from.
+    language_code = get_language_for_business(business_id)
+    say_language_attr = _twilio_say_language_attr(language_code)
+    copy_lang = _twiml_lang(language_code)
 
-    if uptime_check_param:
-        return Response(content="<Response/>", media_type="text/xml")
-    event_id = request.headers.get("X-Twilio-EventId") or request.headers.get(
-        "Twilio-Event-Id"
+    await _maybe_alert_on_speech_circuit(
+        business_id, owner_phone, owner_email, business, call_sid=CallSid
     )
 
     try:
         # If the call has ended, we can clean up and optionally enqueue a callback
         # or partial-lead follow-up SMS.
-        ended_statuses = {
-            "completed",
-            "canceled",
-            "busy",
-            "failed",
-            "no-answer",
-        }
         # Per-tenant configuration of which Twilio call statuses count as
-        # "missed" (and should be enqueued for callbacks). When not
-        # configured, fall back to a conservative default set.
-        if business_row is not None:
-            raw = getattr(business_row, "twilio_missed_statuses", None)
+        # "missed" (and should be enqueued for callbacks), on top of the
+        # conservative default set.
+        extra_statuses: frozenset[str] = frozenset()
+        if business is not None:
+            raw = getattr(business, "twilio_missed_statuses", None)
             if raw:
-                parts = [p.strip().lower() for p in str(raw).split(",") if p.strip()]
-                if parts:
-                    ended_statuses.update(parts)
-        if CallStatus and CallStatus.lower() in ended_statuses:
-            link = twilio_state_store.get_call_session(CallSid)
-            if link and event_id and getattr(link, "last_event_id", None) == event_id:
-                logger.info(
-                    "twilio_webhook_duplicate",
-                    extra={
-                        "call_sid": CallSid,
-                        "event_id": event_id,
-                        "status": CallStatus,
-                    },
-                )
-                return Response(content="<Response/>", media_type="text/xml")
+                extra_statuses = _tenant_missed_statuses(str(raw))
+        if CallStatus and (
+            CallStatus.lower() in _CALL_ENDED_STATUSES
+            or CallStatus.lower() in extra_statuses
+        ):
+            # Default terminal statuses were de-duplicated on entry; this
+            # covers tenant-configured extras.
+            if (
+                event_id
+                and CallStatus.lower() not in _CALL_ENDED_STATUSES
+                and _is_duplicate_call_event(CallSid, event_id, CallStatus)
+            ):
+                return Response(content=_TWIML_EMPTY, media_type="text/xml")
             link = twilio_state_store.clear_call_session(CallSid)
             session = None
             is_partial_lead = False
@@ -734,15 +1456,9 @@ async def twilio_voice(
                     if status_val not in conversation.ALLOWED_TERMINAL_STATUSES:
                         is_partial_lead = True
                 sessions.session_store.end(link.session_id)
-            from ..metrics import metrics as _metrics  # local import
-            from ..services.sms import sms_service  # local import to avoid cycles
-            from ..business_config import (  # local import
-                get_language_for_business as _get_language_for_business,
-            )
-
             phone = From or CallSid or ""
             now = datetime.now(UTC)
-            queue = _metrics.callbacks_by_business.setdefault(business_id, {})
+            queue = metrics.callbacks_by_business[business_id]
             existing = queue.get(phone)
             lead_source = getattr(session, "lead_source", None)
             reason_code = "PARTIAL_INTAKE" if is_partial_lead else "MISSED_CALL"
@@ -771,27 +1487,21 @@ async def twilio_voice(
             reason = "Partial intake" if is_partial_lead else "Missed call"
             when_str = now.strftime("%Y-%m-%d %H:%M UTC")
             owner_message = f"{reason} from {phone} at {when_str}."
+            # Follow-up messages go out after Twilio has its response.
+            notifications = BackgroundTasks()
             if owner_phone or owner_email:
-                try:
-                    from ..services.owner_notifications import (
-                        notify_owner_with_fallback,
-                    )
-
-                    await notify_owner_with_fallback(
-                        business_id=business_id,
-                        message=owner_message,
-                        subject="Missed call alert",
-                        dedupe_key=f"missed_call_{phone}",
-                        send_email_copy=bool(
-                            owner_email and _email_alerts_enabled(business_row)
-                        ),
-                    )
-                except Exception:
-                    logger.warning(
-                        "owner_notify_failed",
-                        exc_info=True,
-                        extra={"business_id": business_id, "reason": reason},
-                    )
+                notifications.add_task(
+                    _notify_best_effort,
+                    notify_owner_with_fallback,
+                    log_extra={"business_id": business_id, "reason": reason},
+                    business_id=business_id,
+                    message=owner_message,
+                    subject="Missed call alert",
+                    dedupe_key=f"missed_call_{phone}",
+                    send_email_copy=bool(
+                        owner_email and _email_alerts_enabled(business)
+                    ),
+                )
             if link:
                 twilio_state_store.set_call_session(
                     CallSid, link.session_id, state="ended", event_id=event_id
@@ -802,31 +1512,32 @@ async def twilio_voice(
             # for a quick summary so the team can follow up.
             if is_partial_lead and phone:
                 # Best-effort check for SMS opt-out.
-                customer = customers_repo.get_by_phone(phone, business_id=business_id)
+                customer = await _run_blocking(
+                    customers_repo.get_by_phone, phone, business_id=business_id
+                )
                 if not customer or not getattr(customer, "sms_opt_out", False):
-                    language_code = _get_language_for_business(business_id)
                     business_name = conversation.DEFAULT_BUSINESS_NAME
-                    if business_row is not None and getattr(business_row, "name", None):
-                        business_name = business_row.name  # type: ignore[assignment]
-                    if language_code == "es":
-                        body = (
-                            f"Sentimos no haber podido completar tu llamada con {business_name}. "
-                            "Si aun necesitas ayuda, respóndenos con un breve resumen del problema "
-                            "y te contactaremos."
-                        )
-                    else:
-                        body = (
-                            f"Sorry we couldn't finish your call with {business_name}. "
-                            "If you still need help, please reply with a quick summary of the issue "
-                            "and we'll follow up."
-                        )
-                    # Fire-and-forget SMS; errors are handled inside sms_service.
-                    await sms_service.notify_customer(
+                    if business is not None and getattr(business, "name", None):
+                        business_name = business.name  # type: ignore[assignment]
+                    body = _SMS_TEMPLATE_TEXT[(copy_lang, "missed_call")].format(
+                        business_name=business_name
+                    )
+                    notifications.add_task(
+                        _notify_best_effort,
+                        sms_service.notify_customer,
                         phone,
                         body,
+                        log_event="partial_lead_sms_failed",
+                        log_extra={"business_id": business_id},
                         business_id=business_id,
                     )
-            return Response(content="<Response/>", media_type="text/xml")
+            return Response(
+                content=_TWIML_EMPTY, media_type="text/xml", background=notifications
+            )
+
+        # Transcript lines recorded before the conversation manager runs are
+        # written together in one batch.
+        transcript: list[tuple[str, str]] = []
 
         # Get or create an internal session for this Twilio call.
         link = twilio_state_store.get_call_session(CallSid)
@@ -840,7 +1551,7 @@ async def twilio_voice(
                         "status": CallStatus,
                     },
                 )
-                return Response(content="<Response/>", media_type="text/xml")
+                return Response(content=_TWIML_EMPTY, media_type="text/xml")
             session = sessions.session_store.get(link.session_id)
             session_id = link.session_id
         else:
@@ -854,59 +1565,41 @@ async def twilio_voice(
                 CallSid, session_id, state="active", event_id=event_id
             )
             # Create a conversation record for logging.
-            customer = (
-                customers_repo.get_by_phone(From or "", business_id=business_id)
-                if From
-                else None
-            )
-            conv = conversations_repo.create(
-                channel="phone",
-                customer_id=customer.id if customer else None,
-                session_id=session_id,
-                business_id=business_id,
-            )
-            conv_id_for_log = conv.id
-            conversations_repo.append_message(
-                conv.id,
-                role="assistant",
-                text="Call started",
+            conv = await _run_blocking(
+                _create_call_conversation, business_id, From, session_id
             )
+            session.conversation_id = conv.id
+            transcript.append(("assistant", "Call started"))
 
         # Bridge Twilio's speech result into the conversation manager.
         text = SpeechResult or ""
         silent_turn = not (text and text.strip())
-        if silent_turn:
-            session.no_input_count = getattr(session, "no_input_count", 0) + 1  # type: ignore[attr-defined]
-        else:
-            session.no_input_count = 0  # type: ignore[attr-defined]
+        no_input_count = getattr(session, "no_input_count", 0) + 1 if silent_turn else 0
+        session.no_input_count = no_input_count  # type: ignore[attr-defined]
         if text:
-            conv = conversations_repo.get_by_session(session_id)
-            if conv:
-                conversations_repo.append_message(conv.id, role="user", text=text)
+            transcript.append(("user", text))
+        conv_id = _session_conversation_id(session)
+        if conv_id and transcript:
+            await _run_blocking(conversations_repo.append_messages, conv_id, transcript)
 
-        if silent_turn and getattr(session, "no_input_count", 0) == 1:
+        if no_input_count == 1:
             session.updated_at = datetime.now(UTC)
             sessions.session_store.save(session)
-            if language_code == "es":
-                prompt = "No alcancAc a escucharte bien. Por favor di tu respuesta o marca 1 para sA- o 2 para no."
-            else:
-                prompt = "I'm having trouble hearing you. Please say your answer, or press 1 for yes or 2 for no."
-            safe_reply = escape(prompt)
-            gather_action = (
-                f"/twilio/voice?business_id={business_id}"
-                if business_id_param
-                else "/twilio/voice"
+            gather_action = _webhook_action(
+                _VOICE_ACTION, business_id, bool(business_id_param)
             )
-            twiml = f"""
-  <Response>
-    <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-    <Gather input="speech dtmf" numDigits="1" action="{gather_action}" method="POST" />
-  </Response>
-  """.strip()
-            return Response(content=twiml, media_type="text/xml")
-
-        if silent_turn and getattr(session, "no_input_count", 0) >= 2:
-            queue = metrics.callbacks_by_business.setdefault(business_id, {})
+            return Response(
+                content=_say_gather_retry_twiml(
+                    _VOICE_PROMPT_TEXT[(copy_lang, "voice_silent")],
+                    say_language_attr,
+                    gather_action,
+                    "",
+                ),
+                media_type="text/xml",
+            )
+
+        if no_input_count >= 2:
+            queue = metrics.callbacks_by_business[business_id]
             now = datetime.now(UTC)
             phone = From or CallSid or ""
             existing = queue.get(phone)
@@ -932,61 +1625,52 @@ async def twilio_voice(
                     existing.last_result = None
             session.stage = "COMPLETED"
             session.status = "PENDING_FOLLOWUP"
-            session.updated_at = datetime.now(UTC)
+            session.updated_at = now
             sessions.session_store.save(session)
-            if language_code == "es":
-                reply_text = "Tengo problemas para escucharte. Te enviarAc al buzA3n de voz para que dejes tu nombre y direcciA3n."
-            else:
-                reply_text = "I'm having trouble hearing you. I'm sending you to voicemail so you can leave your name and address."
-            safe_reply = escape(reply_text)
-            allow_voicemail = getattr(get_settings().sms, "enable_voicemail", True)
-            record_block = ""
-            if allow_voicemail:
-                action = "/twilio/voicemail"
-                if business_id_param:
-                    action = f"{action}?business_id={business_id}"
-                record_block = f'<Record action="{action}" method="POST" playBeep="true" timeout="5" />'
-            twiml = f"""
-  <Response>
-    <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-    {record_block}
-    <Hangup/>
-  </Response>
-  """.strip()
-            return Response(content=twiml, media_type="text/xml")
+            return Response(
+                content=_say_record_hangup_twiml(
+                    _VOICE_PROMPT_TEXT[(copy_lang, "voice_voicemail")],
+                    say_language_attr,
+                    _voicemail_record_action(business_id, bool(business_id_param)),
+                ),
+                media_type="text/xml",
+            )
 
+        # Silent turns have returned above, so this turn logged the caller's
+        # line and conv_id came from the session.
         result = await conversation.conversation_manager.handle_input(
             session, text or None
         )
 
-        conv = conversations_repo.get_by_session(session_id)
-        conv_id = conv.id if conv else conv_id_for_log
+        # The reply is logged after the TwiML is sent; the caller does not
+        # need to wait on the write.
+        transcript_writes = BackgroundTasks()
         if conv_id:
-            conversations_repo.append_message(
-                conv_id, role="assistant", text=result.reply_text
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=result.reply_text,
             )
 
         # Build TwiML response. Preserve the business_id query parameter on the
         # <Gather> action when present so subsequent turns stay routed to the
         # same tenant.
-        safe_reply = escape(result.reply_text)
-        if business_id_param:
-            gather_action = f"/twilio/voice?business_id={business_id}"
-        else:
-            gather_action = "/twilio/voice"
-        twiml = f"""
-  <Response>
-    <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-    <Gather input="speech" action="{gather_action}" method="POST" />
-  </Response>
-  """.strip()
-        return Response(content=twiml, media_type="text/xml")
+        gather_action = _webhook_action(
+            _VOICE_ACTION, business_id, bool(business_id_param)
+        )
+        twiml = _build_gather_twiml(
+            result.reply_text,
+            gather_action,
+            say_language_attr,
+            speech_timeout_auto=False,
+        )
+        return Response(
+            content=twiml, media_type="text/xml", background=transcript_writes
+        )
     except Exception:  # pragma: no cover - defensive
         # Track Twilio voice errors globally and per tenant.
         metrics.twilio_voice_errors += 1
-        per_tenant = metrics.twilio_by_business.setdefault(
-            business_id, BusinessTwilioMetrics()
-        )
         per_tenant.voice_errors += 1
         logger.exception(
             "twilio_voice_unhandled_error",
@@ -997,36 +1681,14 @@ async def twilio_voice(
                 "call_status": CallStatus,
             },
         )
-        if language_code == "es":
-            message = (
-                "Lo siento, hubo un problema al manejar tu llamada. "
-                "Por favor cuelga e inténtalo de nuevo en unos minutos. "
-                "Si se trata de una emergencia que ponga en riesgo la vida, "
-                "cuelga ahora y llama al 911 o a tu número de emergencias local."
-            )
-        else:
-            message = (
-                "Sorry, something went wrong while handling your call. "
-                "Please hang up and try again in a few minutes. "
-                "If this is a life-threatening emergency, hang up now and call 911 or your local emergency number."
-            )
-        safe_reply = escape(message)
-        settings = get_settings()
-        allow_voicemail = getattr(settings.sms, "enable_voicemail", True)
-        record_block = ""
-        if allow_voicemail:
-            action = "/twilio/voicemail"
-            if business_id_param:
-                action = f"{action}?business_id={business_id}"
-            record_block = f'<Record action="{action}" method="POST" playBeep="true" timeout="5" />'
-        twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-  {record_block}
-  <Hangup/>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
+        return Response(
+            content=_say_record_hangup_twiml(
+                _TWIML_ERROR_TEXT[(copy_lang, "voice_error")],
+                say_language_attr,
+                _voicemail_record_action(business_id, bool(business_id_param)),
+            ),
+            media_type="text/xml",
+        )
 
 
 @router.post("/owner-voice", response_class=Response)
@@ -1048,82 +1710,59 @@ async def twilio_owner_voice(
     """
     call_sid_ctx.set(CallSid)
     business_id = business_id_param or DEFAULT_BUSINESS_ID
+    # Load the tenant row first, off the event loop on a cache miss, so the
+    # language, status and name lookups below are all served from the cache.
+    business: BusinessSnapshot | None = None
+    if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
+        business = await _load_business_snapshot(
+            business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+        )
     language_code = get_language_for_business(business_id)
+    copy_lang = _twiml_lang(language_code)
 
-    logger.info(
-        "twilio_owner_voice_webhook",
-        extra={
-            "business_id": business_id,
-            "call_sid": CallSid,
-            "from": From,
-            "digits": Digits,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "twilio_owner_voice_webhook",
+            extra={
+                "business_id": business_id,
+                "call_sid": CallSid,
+                "from": From,
+                "digits": Digits,
+            },
+        )
 
     # Track Twilio voice webhook usage (owner line shares the same counters).
     metrics.twilio_voice_requests += 1
-    per_tenant = metrics.twilio_by_business.setdefault(
-        business_id, BusinessTwilioMetrics()
-    )
+    per_tenant = metrics.twilio_by_business[business_id]
     per_tenant.voice_requests += 1
 
     # Optional signature verification.
-    form_params: Dict[str, str] = {"CallSid": CallSid}
-    if From is not None:
-        form_params["From"] = From
-    if Digits is not None:
-        form_params["Digits"] = Digits
-    await _maybe_verify_twilio_signature(request, form_params)
+    if _twilio_signature_required():
+        form_params: Dict[str, str] = {"CallSid": CallSid}
+        if From is not None:
+            form_params["From"] = From
+        if Digits is not None:
+            form_params["Digits"] = Digits
+        await _maybe_verify_twilio_signature(request, form_params)
 
     # Best-effort owner phone validation and tenant status check.
-    business_name = _get_business_name(business_id)
-    if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if row is not None:
-            status_value = getattr(row, "status", "ACTIVE")
-            owner_phone = getattr(row, "owner_phone", None)
-            if status_value != "ACTIVE":
-                if language_code == "es":
-                    safe_reply = escape(
-                        "Este negocio está actualmente suspendido. "
-                        "Por favor revisa tu panel de administración."
-                    )
-                else:
-                    safe_reply = escape(
-                        "This business is currently suspended. Please check your admin dashboard."
-                    )
-                twiml = f"""
-<Response>
-  <Say voice="alice">{safe_reply}</Say>
-  <Hangup/>
-</Response>
-""".strip()
-                return Response(content=twiml, media_type="text/xml")
-            require_owner_match = (
-                os.getenv("OWNER_VOICE_REQUIRE_MATCH", "false").lower() == "true"
+    if business is not None:
+        status_value = getattr(business, "status", "ACTIVE")
+        owner_phone = getattr(business, "owner_phone", None)
+        if status_value != "ACTIVE":
+            return Response(
+                content=_TWIML_ERROR[(copy_lang, "owner_suspended")],
+                media_type="text/xml",
             )
-            if require_owner_match and owner_phone and From and From != owner_phone:
-                if language_code == "es":
-                    safe_reply = escape(
-                        "Esta línea está reservada para el dueño del negocio. "
-                        "Si llegaste aquí por error, por favor cuelga."
-                    )
-                else:
-                    safe_reply = escape(
-                        "This line is reserved for the business owner. "
-                        "If you reached this by mistake, please hang up."
-                    )
-                twiml = f"""
-<Response>
-  <Say voice="alice">{safe_reply}</Say>
-  <Hangup/>
-</Response>
-""".strip()
-                return Response(content=twiml, media_type="text/xml")
+        require_owner_match = getattr(
+            get_settings().telephony, "owner_voice_require_match", False
+        )
+        if require_owner_match and owner_phone and From and From != owner_phone:
+            return Response(
+                content=_TWIML_ERROR[(copy_lang, "owner_mismatch")],
+                media_type="text/xml",
+            )
+    business_name = _get_business_name(business_id)
 
     try:
         step = (step_param or "").strip().lower() or "menu"
@@ -1140,34 +1779,17 @@ async def twilio_owner_voice(
                 followup = (Digits or "").strip()
                 if followup == "1":
                     # Return to the main menu so the owner can ask another question.
-                    safe_name = escape(business_name)
-                    if business_id_param:
-                        gather_action = f"/twilio/owner-voice?business_id={business_id}"
-                    else:
-                        gather_action = "/twilio/owner-voice"
-                    if language_code == "es":
-                        prompt = (
-                            f"Hola, esta es la línea del dueño para {safe_name}. "
-                            "Para el horario de mañana, marca 1. "
-                            "Para las citas de emergencia de los últimos siete días, marca 2. "
-                            "Para un resumen de tu pipeline, marca 3."
-                        )
-                    else:
-                        prompt = (
-                            f"Hello, this is the owner line for {safe_name}. "
-                            "For tomorrow's schedule, press 1. "
-                            "For emergency appointments in the last seven days, press 2. "
-                            "For your pipeline summary, press 3."
-                        )
-                    safe_prompt = escape(prompt)
-                    twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_prompt}</Say>
-  <Gather input="dtmf" numDigits="1" action="{gather_action}" method="POST" />
-</Response>
-""".strip()
-                    return Response(content=twiml, media_type="text/xml")
-                if followup == "9" and selection_ctx in {"1", "2", "3"} and From:
+                    return Response(
+                        content=_build_menu_twiml(
+                            language_code,
+                            say_language_attr,
+                            business_name,
+                            bool(business_id_param),
+                            business_id,
+                        ),
+                        media_type="text/xml",
+                    )
+                if followup == "9" and selection_ctx in _VALID_DTMF and From:
                     # Send the same summary via SMS to the owner.
                     summary_text = _owner_summary_for_selection(
                         selection_ctx,
@@ -1175,82 +1797,50 @@ async def twilio_owner_voice(
                         language_code=language_code,
                         business_name=business_name,
                     )
-                    from ..services.owner_notifications import (
-                        notify_owner_with_fallback,
-                    )
 
-                    await notify_owner_with_fallback(
+                    summary_sms = BackgroundTasks()
+                    summary_sms.add_task(
+                        _notify_best_effort,
+                        notify_owner_with_fallback,
+                        log_extra={"business_id": business_id},
                         business_id=business_id,
                         message=summary_text,
                         subject="Owner summary",
                         dedupe_key=f"summary_{selection_ctx}",
                     )
-                    if language_code == "es":
-                        ack = "De acuerdo, te he enviado este resumen por mensaje de texto. Adiós."
-                    else:
-                        ack = "Okay, I've sent this summary to you by text message. Goodbye."
-                    safe_ack = escape(ack)
-                    twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_ack}</Say>
-  <Hangup/>
-</Response>
-""".strip()
-                    return Response(content=twiml, media_type="text/xml")
+                    return Response(
+                        content=_build_summary_sent_twiml(copy_lang, say_language_attr),
+                        media_type="text/xml",
+                        background=summary_sms,
+                    )
                 # Unknown follow-up choice; fall through to re-present the menu.
                 step = "menu"
 
         # If no selection yet (or we fell back from post-step), present the menu.
         if step == "menu" and not Digits:
-            safe_name = escape(business_name)
-            if business_id_param:
-                gather_action = f"/twilio/owner-voice?business_id={business_id}"
-            else:
-                gather_action = "/twilio/owner-voice"
-            if language_code == "es":
-                prompt = (
-                    f"Hola, esta es la línea del dueño para {safe_name}. "
-                    "Para el horario de mañana, marca 1. "
-                    "Para las citas de emergencia de los últimos siete días, marca 2. "
-                    "Para un resumen de tu pipeline, marca 3."
-                )
-            else:
-                prompt = (
-                    f"Hello, this is the owner line for {safe_name}. "
-                    "For tomorrow's schedule, press 1. "
-                    "For emergency appointments in the last seven days, press 2. "
-                    "For your pipeline summary, press 3."
-                )
-            safe_prompt = escape(prompt)
-            twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_prompt}</Say>
-  <Gather input="dtmf" numDigits="1" action="{gather_action}" method="POST" />
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
+            return Response(
+                content=_build_menu_twiml(
+                    language_code,
+                    say_language_attr,
+                    business_name,
+                    bool(business_id_param),
+                    business_id,
+                ),
+                media_type="text/xml",
+            )
 
         # Handle primary menu selections.
         selection = (Digits or "").strip()
-        if selection not in {"1", "2", "3"}:
-            if business_id_param:
-                gather_action = f"/twilio/owner-voice?business_id={business_id}"
-            else:
-                gather_action = "/twilio/owner-voice"
-            invalid_msg = _owner_summary_for_selection(
-                "invalid",
-                business_id=business_id,
-                language_code=language_code,
-                business_name=business_name,
+        if selection not in _VALID_DTMF:
+            return Response(
+                content=_build_invalid_selection_twiml(
+                    language_code,
+                    say_language_attr,
+                    bool(business_id_param),
+                    business_id,
+                ),
+                media_type="text/xml",
             )
-            safe_invalid = escape(invalid_msg)
-            twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_invalid}</Say>
-  <Gather input="dtmf" numDigits="1" action="{gather_action}" method="POST" />
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
 
         reply_text = _owner_summary_for_selection(
             selection,
@@ -1258,45 +1848,25 @@ async def twilio_owner_voice(
             language_code=language_code,
             business_name=business_name,
         )
-        safe_reply = escape(reply_text)
-
-        # After reading the summary, allow the owner to either ask another
-        # question or have the summary sent by SMS.
-        if business_id_param:
-            gather_action = (
-                f"/twilio/owner-voice?business_id={business_id}"
-                f"&step=post&selection={selection}"
-            )
-        else:
-            gather_action = f"/twilio/owner-voice?step=post&selection={selection}"
-        if language_code == "es":
-            followup_prompt = (
-                "Para escuchar otro resumen, marca 1. "
-                "Para recibir este resumen por mensaje de texto, marca 9. "
-                "También puedes colgar en cualquier momento."
-            )
-        else:
-            followup_prompt = (
-                "For another owner summary, press 1. "
-                "To receive this summary by text message, press 9. "
-                "Or you can hang up at any time."
-            )
-        safe_followup = escape(followup_prompt)
-        twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-  <Pause length="1"/>
-  <Say voice="alice"{say_language_attr}>{safe_followup}</Say>
-  <Gather input="dtmf" numDigits="1" action="{gather_action}" method="POST" />
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
+        safe_reply = _fast_escape(reply_text)
+
+        # After reading the summary, allow the owner to either ask another
+        # question or have the summary sent by SMS.
+        summary_say = _TWIML_OPEN_SAY.format(lang=say_language_attr, prompt=safe_reply)
+        return Response(
+            content=summary_say.encode("utf-8")
+            + _build_followup_twiml(
+                selection,
+                language_code,
+                say_language_attr,
+                bool(business_id_param),
+                business_id,
+            ),
+            media_type="text/xml",
+        )
     except Exception:  # pragma: no cover - defensive
         metrics.twilio_voice_errors += 1
-        per_err = metrics.twilio_by_business.setdefault(
-            business_id, BusinessTwilioMetrics()
-        )
-        per_err.voice_errors += 1
+        per_tenant.voice_errors += 1
         logger.exception(
             "twilio_owner_voice_unhandled_error",
             extra={
@@ -1306,17 +1876,9 @@ async def twilio_owner_voice(
                 "digits": Digits,
             },
         )
-        safe_reply = escape(
-            "Sorry, something went wrong while handling your call. "
-            "Please hang up and try again in a few minutes."
+        return Response(
+            content=_TWIML_ERROR[("en", "owner_error")], media_type="text/xml"
         )
-        twiml = f"""
-<Response>
-  <Say voice="alice">{safe_reply}</Say>
-  <Hangup/>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
 
 
 @router.post("/voice-assistant", response_class=Response)
@@ -1344,89 +1906,81 @@ async def twilio_voice_assistant(
         getattr(settings.telephony, "twilio_streaming_enabled", False)
     )
 
+    # Optional signature verification.
+    if _twilio_signature_required():
+        form_params: Dict[str, str] = {"CallSid": CallSid}
+        if From is not None:
+            form_params["From"] = From
+        if CallStatus is not None:
+            form_params["CallStatus"] = CallStatus
+        if SpeechResult is not None:
+            form_params["SpeechResult"] = SpeechResult
+        await _maybe_verify_twilio_signature(request, form_params)
+
+    # Uptime pings are no-ops; answer them before any tenant lookups.
+    if uptime_check_param:
+        return Response(content=_TWIML_EMPTY, media_type="text/xml")
+
     sub_state = await subscription_service.check_access(
         business_id, feature="calls", upcoming_calls=1, graceful=True
     )
     if sub_state.blocked:
         msg = sub_state.message or "Subscription inactive. Calls are paused."
         return Response(
-            content=f"<Response><Say>{escape(msg)}</Say></Response>",
+            content=_twiml_say(msg),
             media_type="text/xml",
             status_code=status.HTTP_200_OK,
         )
     metrics.twilio_voice_requests += 1
-    per_tenant = metrics.twilio_by_business.setdefault(
-        business_id, BusinessTwilioMetrics()
-    )
+    per_tenant = metrics.twilio_by_business[business_id]
     per_tenant.voice_requests += 1
 
     await ensure_onboarding_ready(business_id)
 
-    business_row: BusinessDB | None = None
+    business: BusinessSnapshot | None = None
     owner_phone = None
     owner_email = None
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            business_row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if business_row is not None:
-            owner_phone = getattr(business_row, "owner_phone", None)
-            owner_email = getattr(business_row, "owner_email", None)
+        business = await _load_business_snapshot(business_id)
+        if business is not None:
+            owner_phone = getattr(business, "owner_phone", None)
+            owner_email = getattr(business, "owner_email", None)
 
     await _maybe_alert_on_speech_circuit(
-        business_id, owner_phone, owner_email, business_row, call_sid=CallSid
+        business_id, owner_phone, owner_email, business, call_sid=CallSid
     )
 
-    # Optional signature verification.
-    form_params: Dict[str, str] = {"CallSid": CallSid}
-    if From is not None:
-        form_params["From"] = From
-    if CallStatus is not None:
-        form_params["CallStatus"] = CallStatus
-    if SpeechResult is not None:
-        form_params["SpeechResult"] = SpeechResult
-    await _maybe_verify_twilio_signature(request, form_params)
-
-    if uptime_check_param:
-        return Response(content="<Response/>", media_type="text/xml")
-
     # Handle call completion quickly and enqueue a callback follow-up.
-    if CallStatus and CallStatus.lower() in {
-        "completed",
-        "canceled",
-        "busy",
-        "failed",
-        "no-answer",
-    }:
+    if CallStatus and CallStatus.lower() in _CALL_ENDED_STATUSES:
         link = twilio_state_store.clear_call_session(CallSid)
         if link:
             sessions.session_store.end(link.session_id)
         # Record missed/partial call for owner follow-up.
         phone = From or CallSid or ""
-        queue = metrics.callbacks_by_business.setdefault(business_id, {})
+        queue = metrics.callbacks_by_business[business_id]
         existing = queue.get(phone)
+        now = datetime.now(UTC)
         if existing is None:
             queue[phone] = CallbackItem(
                 phone=phone,
-                first_seen=datetime.now(UTC),
-                last_seen=datetime.now(UTC),
+                first_seen=now,
+                last_seen=now,
                 count=1,
                 channel="phone",
                 reason="MISSED_CALL",
             )
         else:
-            existing.last_seen = datetime.now(UTC)
+            existing.last_seen = now
             existing.count += 1
             if getattr(existing, "status", "PENDING").upper() != "PENDING":
                 existing.status = "PENDING"
                 existing.last_result = None
-        return Response(content="<Response/>", media_type="text/xml")
+        return Response(content=_TWIML_EMPTY, media_type="text/xml")
 
     # Resolve language for <Say>.
     language_code = get_language_for_business(business_id)
     say_language_attr = _twilio_say_language_attr(language_code)
+    copy_lang = _twiml_lang(language_code)
 
     # Get or create the assistant session for this call.
     link = twilio_state_store.get_call_session(CallSid)
@@ -1440,51 +1994,40 @@ async def twilio_voice_assistant(
             lead_source=lead_source_param,
         )
         twilio_state_store.set_call_session(CallSid, session.id)
-        customer = (
-            customers_repo.get_by_phone(From, business_id=business_id) if From else None
-        )
-        conversations_repo.create(
-            channel="phone",
-            customer_id=customer.id if customer else None,
-            session_id=session.id,
-            business_id=business_id,
+        conv = await _run_blocking(
+            _create_call_conversation, business_id, From, session.id
         )
+        session.conversation_id = conv.id
 
     # Route speech input into the assistant.
     text = SpeechResult.strip() if SpeechResult else None
     silent_turn = not (text and text.strip())
-    if silent_turn:
-        count = getattr(session, "no_input_count", 0) + 1
-        session.no_input_count = count  # type: ignore[attr-defined]
-    else:
-        session.no_input_count = 0  # type: ignore[attr-defined]
-    conv = conversations_repo.get_by_session(session.id)
-    if conv and text:
-        conversations_repo.append_message(conv.id, role="user", text=text)
+    no_input_count = getattr(session, "no_input_count", 0) + 1 if silent_turn else 0
+    session.no_input_count = no_input_count  # type: ignore[attr-defined]
+    conv_id = _session_conversation_id(session)
+    if conv_id and text:
+        await _run_blocking(
+            conversations_repo.append_message, conv_id, role="user", text=text
+        )
 
-    if silent_turn and getattr(session, "no_input_count", 0) == 1:
+    if no_input_count == 1:
         session.updated_at = datetime.now(UTC)
         sessions.session_store.save(session)
-        if language_code == "es":
-            reply_text = "No escuchA© tu respuesta. Por favor di tu respuesta o presiona 1 para sA- o 2 para no."
-        else:
-            reply_text = "I didn't catch that. Please say your answer, or press 1 for yes or 2 for no."
-        safe_reply = escape(reply_text)
-        gather_action = (
-            f"/twilio/voice-assistant?business_id={business_id}"
-            if business_id_param
-            else "/twilio/voice-assistant"
-        )
-        twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-  <Gather input="speech dtmf" numDigits="1" action="{gather_action}" method="POST" speechTimeout="auto" />
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
-
-    if silent_turn and getattr(session, "no_input_count", 0) >= 2:
-        queue = metrics.callbacks_by_business.setdefault(business_id, {})
+        gather_action = _webhook_action(
+            _VOICE_ASSISTANT_ACTION, business_id, bool(business_id_param)
+        )
+        return Response(
+            content=_say_gather_retry_twiml(
+                _VOICE_PROMPT_TEXT[(copy_lang, "assistant_silent")],
+                say_language_attr,
+                gather_action,
+                ' speechTimeout="auto"',
+            ),
+            media_type="text/xml",
+        )
+
+    if no_input_count >= 2:
+        queue = metrics.callbacks_by_business[business_id]
         now = datetime.now(UTC)
         phone = From or CallSid or ""
         existing = queue.get(phone)
@@ -1507,35 +2050,28 @@ async def twilio_voice_assistant(
 
         session.stage = "COMPLETED"
         session.status = "PENDING_FOLLOWUP"
-        session.updated_at = datetime.now(UTC)
+        session.updated_at = now
         sessions.session_store.save(session)
-        if language_code == "es":
-            reply_text = "Tengo problemas para escucharte. Te transferirAc para que dejes un breve buzA3n de voz con tu nombre y direcciA3n."
-        else:
-            reply_text = "I'm having trouble hearing you. I'm sending you to voicemail so you can leave your name and address."
-        safe_reply = escape(reply_text)
-        allow_voicemail = getattr(get_settings().sms, "enable_voicemail", True)
-        record_block = ""
-        if allow_voicemail:
-            action = "/twilio/voicemail"
-            if business_id_param:
-                action = f"{action}?business_id={business_id}"
-            record_block = f'<Record action="{action}" method="POST" playBeep="true" timeout="5" />'
-        twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-  {record_block}
-  <Hangup/>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
+        return Response(
+            content=_say_record_hangup_twiml(
+                _VOICE_PROMPT_TEXT[(copy_lang, "assistant_voicemail")],
+                say_language_attr,
+                _voicemail_record_action(business_id, bool(business_id_param)),
+            ),
+            media_type="text/xml",
+        )
 
     try:
         result = await conversation.conversation_manager.handle_input(session, text)
         reply_text = result.reply_text
-        if conv:
-            conversations_repo.append_message(
-                conv.id, role="assistant", text=reply_text
+        # The reply is logged after the TwiML is sent.
+        transcript_writes = BackgroundTasks()
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=reply_text,
             )
             # Notify the owner when a new appointment gets booked via voice.
             appointments = getattr(result, "appointments", []) or []
@@ -1548,63 +2084,54 @@ async def twilio_voice_assistant(
                 cust_name = cust.name if cust else "Customer"
                 service = getattr(appt, "service_type", None) or "service"
                 body = f"New voice booking: {cust_name} on {when} ({service})."
-                try:
-                    from ..services.owner_notifications import (
-                        notify_owner_with_fallback,
-                    )
 
-                    await notify_owner_with_fallback(
-                        business_id=business_id,
-                        message=body,
-                        subject="New voice booking",
-                        dedupe_key=f"voice_booking_{appt.id}",
-                    )
-                except Exception:
-                    logger.warning(
-                        "owner_notify_failed",
-                        exc_info=True,
-                        extra={"business_id": business_id},
-                    )
+                transcript_writes.add_task(
+                    _notify_best_effort,
+                    notify_owner_with_fallback,
+                    log_extra={"business_id": business_id},
+                    business_id=business_id,
+                    message=body,
+                    subject="New voice booking",
+                    dedupe_key=f"voice_booking_{appt.id}",
+                )
         if stream_enabled:
             stream_url = _build_stream_url(
                 request, CallSid, business_id, lead_source_param, From
             )
-            safe_reply = escape(reply_text or "Connecting you to the assistant.")
-            twiml = f"""
-<Response>
-  <Start>
-    <Stream url="{stream_url}" />
-  </Start>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
-        if business_id_param:
-            gather_action = f"/twilio/voice-assistant?business_id={business_id}"
-        else:
-            gather_action = "/twilio/voice-assistant"
+            twiml = _TWIML_STREAM_SAY.format(
+                stream_url=stream_url,
+                lang=say_language_attr,
+                prompt=(
+                    _fast_escape(reply_text)
+                    if reply_text
+                    else _VOICE_PROMPT_TEXT[("en", "assistant_connecting")]
+                ),
+            )
+            return Response(
+                content=twiml.encode("utf-8"),
+                media_type="text/xml",
+                background=transcript_writes,
+            )
+        gather_action = _webhook_action(
+            _VOICE_ASSISTANT_ACTION, business_id, bool(business_id_param)
+        )
         twiml = _build_gather_twiml(reply_text, gather_action, say_language_attr)
-        return Response(content=twiml, media_type="text/xml")
+        return Response(
+            content=twiml, media_type="text/xml", background=transcript_writes
+        )
     except Exception:  # pragma: no cover - defensive
         metrics.twilio_voice_errors += 1
-        per_err = metrics.twilio_by_business.setdefault(
-            business_id, BusinessTwilioMetrics()
-        )
-        per_err.voice_errors += 1
+        per_tenant.voice_errors += 1
         logger.exception(
             "twilio_voice_assistant_unhandled_error",
             extra={"business_id": business_id, "call_sid": CallSid},
         )
-        safe_reply = escape(
-            "Sorry, something went wrong while handling your call. "
-            "Please hang up and try again later."
+        return Response(
+            content=_say_prompt_twiml(
+                _VOICE_PROMPT_TEXT[("en", "assistant_error")], say_language_attr
+            ),
+            media_type="text/xml",
         )
-        twiml = f"""
-<Response>
-  <Say voice="alice"{say_language_attr}>{safe_reply}</Say>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
 
 
 @router.websocket("/voice-stream")
@@ -1634,24 +2161,38 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
     min_seconds = float(
         getattr(settings.telephony, "twilio_stream_min_seconds", 1.0) or 1.0
     )
-    buffer = bytearray()
+    # Utterance audio is written into one reusable buffer behind a cursor; a
+    # flush reads it through a memoryview and rewinds instead of reallocating.
+    min_bytes = _stream_min_bytes(sample_rate, encoding, min_seconds)
+    buffer = bytearray(min_bytes * 2)
+    buffered = 0
 
     async def flush_buffer() -> str | None:
-        nonlocal buffer
-        if not buffer:
+        nonlocal buffered
+        if not buffered:
             return None
-        audio_b64 = _twilio_payload_to_wav_base64(bytes(buffer), encoding, sample_rate)
-        buffer = bytearray()
+        with memoryview(buffer) as view:
+            audio_b64 = _twilio_payload_to_wav_base64(
+                view[:buffered], encoding, sample_rate
+            )
+        buffered = 0
         if not audio_b64:
             return None
         transcript = await speech_service.transcribe(audio_b64)
         transcript = (transcript or "").strip()
         return transcript or None
 
+    async def dispatch(event: TwilioStreamEvent) -> None:
+        # Run the deferred transcript writes before the next frame so the
+        # stored conversation keeps the same order as the call.
+        transcript_writes = BackgroundTasks()
+        await twilio_voice_stream(event, transcript_writes)
+        await transcript_writes()
+
     async def handle_transcript(text: str) -> None:
         if not text or not call_sid:
             return
-        await twilio_voice_stream(
+        await dispatch(
             TwilioStreamEvent(
                 call_sid=call_sid,
                 stream_sid=stream_sid,
@@ -1666,7 +2207,7 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
     async def handle_start() -> None:
         if not call_sid:
             return
-        await twilio_voice_stream(
+        await dispatch(
             TwilioStreamEvent(
                 call_sid=call_sid,
                 stream_sid=stream_sid,
@@ -1680,7 +2221,7 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
     async def handle_stop() -> None:
         if not call_sid:
             return
-        await twilio_voice_stream(
+        await dispatch(
             TwilioStreamEvent(
                 call_sid=call_sid,
                 stream_sid=stream_sid,
@@ -1698,7 +2239,7 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
             except WebSocketDisconnect:
                 break
             try:
-                payload = json.loads(message)
+                payload = _stream_json_loads(message)
             except json.JSONDecodeError:
                 logger.warning("twilio_stream_invalid_json")
                 continue
@@ -1711,6 +2252,7 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
                 media_format = start.get("mediaFormat") or {}
                 encoding = media_format.get("encoding") or encoding
                 sample_rate = _safe_int(media_format.get("sampleRate"), sample_rate)
+                min_bytes = _stream_min_bytes(sample_rate, encoding, min_seconds)
                 custom_params = start.get("customParameters") or {}
                 if not from_number:
                     from_number = custom_params.get("from_number") or custom_params.get(
@@ -1728,13 +2270,16 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
                 if not raw_payload:
                     continue
                 try:
-                    audio_bytes = base64.b64decode(raw_payload)
+                    audio_bytes = binascii.a2b_base64(raw_payload)
                 except Exception:
                     logger.warning("twilio_stream_payload_decode_failed")
                     continue
-                buffer.extend(audio_bytes)
-                min_bytes = _stream_min_bytes(sample_rate, encoding, min_seconds)
-                if len(buffer) >= min_bytes:
+                end = buffered + len(audio_bytes)
+                if end > len(buffer):
+                    buffer.extend(bytes(max(end, min_bytes * 2) - len(buffer)))
+                buffer[buffered:end] = audio_bytes
+                buffered = end
+                if buffered >= min_bytes:
                     transcript = await flush_buffer()
                     if transcript:
                         await handle_transcript(transcript)
@@ -1758,8 +2303,13 @@ async def twilio_voice_stream_websocket(websocket: WebSocket) -> None:
 @router.post("/voice-stream", response_model=TwilioStreamResponse)
 async def twilio_voice_stream(
     payload: TwilioStreamEvent,
+    transcript_writes: BackgroundTasks,
 ) -> TwilioStreamResponse:
-    """Handle Twilio media stream events and route transcripts to the assistant."""
+    """Handle Twilio media stream events and route transcripts to the assistant.
+
+    Assistant replies and stop-event notifications are scheduled on
+    ``transcript_writes`` and run after the response is sent.
+    """
     settings = get_settings()
     if not getattr(settings.telephony, "twilio_streaming_enabled", False):
         return TwilioStreamResponse(
@@ -1769,27 +2319,22 @@ async def twilio_voice_stream(
     business_id = payload.business_id or DEFAULT_BUSINESS_ID
     owner_phone = None
     owner_email = None
-    business_row: BusinessDB | None = None
+    business: BusinessSnapshot | None = None
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            business_row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if business_row is not None:
-            owner_phone = getattr(business_row, "owner_phone", None)
-            owner_email = getattr(business_row, "owner_email", None)
+        business = await _load_business_snapshot(business_id)
+        if business is not None:
+            owner_phone = getattr(business, "owner_phone", None)
+            owner_email = getattr(business, "owner_email", None)
 
     language_code = get_language_for_business(business_id)
+    copy_lang = _twiml_lang(language_code)
 
     await _maybe_alert_on_speech_circuit(
-        business_id, owner_phone, owner_email, business_row, call_sid=payload.call_sid
+        business_id, owner_phone, owner_email, business, call_sid=payload.call_sid
     )
 
     metrics.twilio_voice_requests += 1
-    per_tenant = metrics.twilio_by_business.setdefault(
-        business_id, BusinessTwilioMetrics()
-    )
+    per_tenant = metrics.twilio_by_business[business_id]
     per_tenant.voice_requests += 1
 
     link = twilio_state_store.get_call_session(payload.call_sid)
@@ -1811,27 +2356,21 @@ async def twilio_voice_stream(
             lead_source=payload.lead_source,
         )
         twilio_state_store.set_call_session(payload.call_sid, session_obj.id)
-        customer = (
-            customers_repo.get_by_phone(payload.from_number, business_id=business_id)
-            if payload.from_number
-            else None
-        )
-        conversations_repo.create(
-            channel="phone",
-            customer_id=customer.id if customer else None,
-            session_id=session_obj.id,
-            business_id=business_id,
+        conv = await _run_blocking(
+            _create_call_conversation, business_id, payload.from_number, session_obj.id
         )
+        session_obj.conversation_id = conv.id
 
     event = (payload.event or "").lower()
+    # Shared by the stop and repeated-silence callback entries below.
+    lead_source = session_obj.lead_source or payload.lead_source
     if event == "stop":
-        status_val = (getattr(session_obj, "status", "") or "").upper()
+        status_val = (session_obj.status or "").upper()
         is_partial_lead = status_val not in conversation.ALLOWED_TERMINAL_STATUSES
         phone = payload.from_number or ""
-        lead_source = getattr(session_obj, "lead_source", None) or payload.lead_source
-        if phone and (is_partial_lead or not session_obj):
+        if phone and is_partial_lead:
             now = datetime.now(UTC)
-            queue = metrics.callbacks_by_business.setdefault(business_id, {})
+            queue = metrics.callbacks_by_business[business_id]
             existing = queue.get(phone)
             reason = "PARTIAL_INTAKE" if is_partial_lead else "MISSED_CALL"
             if existing is None:
@@ -1856,50 +2395,42 @@ async def twilio_voice_stream(
                     existing.last_result = None
 
             owner_message = f"{'Partial intake' if is_partial_lead else 'Missed call'} from {phone} at {now.strftime('%Y-%m-%d %H:%M UTC')}."
+            # Follow-up messages go out after the stop event is answered.
             if owner_phone or owner_email:
-                try:
-                    from ..services.owner_notifications import (
-                        notify_owner_with_fallback,
-                    )
-
-                    await notify_owner_with_fallback(
-                        business_id=business_id,
-                        message=owner_message,
-                        subject="Missed call alert",
-                        dedupe_key=f"stream_missed_{phone}",
-                        send_email_copy=bool(owner_email),
-                    )
-                except Exception:
-                    logger.warning(
-                        "twilio_stream_owner_sms_failed",
-                        exc_info=True,
-                        extra={
-                            "business_id": business_id,
-                            "call_sid": payload.call_sid,
-                        },
-                    )
+                transcript_writes.add_task(
+                    _notify_best_effort,
+                    notify_owner_with_fallback,
+                    log_event="twilio_stream_owner_sms_failed",
+                    log_extra={
+                        "business_id": business_id,
+                        "call_sid": payload.call_sid,
+                    },
+                    business_id=business_id,
+                    message=owner_message,
+                    subject="Missed call alert",
+                    dedupe_key=f"stream_missed_{phone}",
+                    send_email_copy=bool(owner_email),
+                )
 
             if is_partial_lead and phone:
-                customer = customers_repo.get_by_phone(phone, business_id=business_id)
+                customer = await _run_blocking(
+                    customers_repo.get_by_phone, phone, business_id=business_id
+                )
                 if not customer or not getattr(customer, "sms_opt_out", False):
-                    language_code = get_language_for_business(business_id)
                     business_name = conversation.DEFAULT_BUSINESS_NAME
-                    if business_row is not None and getattr(business_row, "name", None):
-                        business_name = business_row.name  # type: ignore[assignment]
-                    if language_code == "es":
-                        body = (
-                            f"Sentimos no haber podido completar tu llamada con {business_name}. "
-                            "Si aAºn necesitas ayuda, respóndenos con un breve resumen del problema "
-                            "y te contactaremos."
-                        )
-                    else:
-                        body = (
-                            f"Sorry we couldn't finish your call with {business_name}. "
-                            "If you still need help, please reply with a quick summary of the issue "
-                            "and we'll follow up."
-                        )
-                    await sms_service.notify_customer(
-                        phone, body, business_id=business_id
+                    if business is not None and getattr(business, "name", None):
+                        business_name = business.name  # type: ignore[assignment]
+                    body = _SMS_TEMPLATE_TEXT[(copy_lang, "missed_call")].format(
+                        business_name=business_name
+                    )
+                    transcript_writes.add_task(
+                        _notify_best_effort,
+                        sms_service.notify_customer,
+                        phone,
+                        body,
+                        log_event="partial_lead_sms_failed",
+                        log_extra={"business_id": business_id},
+                        business_id=business_id,
                     )
         twilio_state_store.clear_call_session(payload.call_sid)
         sessions.session_store.end(session_obj.id)
@@ -1910,34 +2441,33 @@ async def twilio_voice_stream(
             completed=True,
         )
 
-    conv = conversations_repo.get_by_session(session_obj.id)
+    conv_id = _session_conversation_id(session_obj)
     transcript = (payload.transcript or "").strip()
     reply_text: str | None = None
     silent_turn = event == "media" and not transcript
-    if silent_turn:
-        session_obj.no_input_count = getattr(session_obj, "no_input_count", 0) + 1  # type: ignore[attr-defined]
-    else:
-        session_obj.no_input_count = 0  # type: ignore[attr-defined]
-    if silent_turn and getattr(session_obj, "no_input_count", 0) == 1:
+    no_input_count = session_obj.no_input_count + 1 if silent_turn else 0
+    session_obj.no_input_count = no_input_count
+    if no_input_count == 1:
         session_obj.updated_at = datetime.now(UTC)
         sessions.session_store.save(session_obj)
-        if language_code == "es":
-            prompt = "No alcanzo a escucharte bien. Por favor di tu respuesta o marca 1 para sí o 2 para no."
-        else:
-            prompt = "I'm having trouble hearing you. Please say your answer or press 1 for yes or 2 for no."
-        if conv:
-            conversations_repo.append_message(conv.id, role="assistant", text=prompt)
+        prompt = _STREAM_PROMPT_TEXT[(copy_lang, "silent")]
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=prompt,
+            )
         return TwilioStreamResponse(
             status="ok",
             session_id=session_obj.id,
             reply_text=prompt,
             completed=False,
         )
-    if silent_turn and getattr(session_obj, "no_input_count", 0) >= 2:
-        queue = metrics.callbacks_by_business.setdefault(business_id, {})
+    if no_input_count >= 2:
+        queue = metrics.callbacks_by_business[business_id]
         now = datetime.now(UTC)
         phone = payload.from_number or payload.call_sid or ""
-        lead_source = getattr(session_obj, "lead_source", None) or payload.lead_source
         existing = queue.get(phone)
         if existing is None:
             queue[phone] = CallbackItem(
@@ -1960,16 +2490,15 @@ async def twilio_voice_stream(
                 existing.last_result = None
         session_obj.stage = "COMPLETED"
         session_obj.status = "PENDING_FOLLOWUP"
-        session_obj.updated_at = datetime.now(UTC)
+        session_obj.updated_at = now
         sessions.session_store.save(session_obj)
-        fallback_reply = (
-            "Tengo problemas para escucharte. Te enviaremos un seguimiento para programar tu servicio."
-            if language_code == "es"
-            else "I'm having trouble hearing you. We'll follow up shortly to finish scheduling."
-        )
-        if conv:
-            conversations_repo.append_message(
-                conv.id, role="assistant", text=fallback_reply
+        fallback_reply = _STREAM_PROMPT_TEXT[(copy_lang, "followup")]
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=fallback_reply,
             )
         return TwilioStreamResponse(
             status="ok",
@@ -1980,20 +2509,31 @@ async def twilio_voice_stream(
     if event in {"start", "connected"} and not transcript:
         result = await conversation.conversation_manager.handle_input(session_obj, None)
         reply_text = result.reply_text
-        if conv:
-            conversations_repo.append_message(
-                conv.id, role="assistant", text=reply_text
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=reply_text,
             )
     elif transcript:
-        if conv:
-            conversations_repo.append_message(conv.id, role="user", text=transcript)
+        if conv_id:
+            await _run_blocking(
+                conversations_repo.append_message,
+                conv_id,
+                role="user",
+                text=transcript,
+            )
         result = await conversation.conversation_manager.handle_input(
             session_obj, transcript
         )
         reply_text = result.reply_text
-        if conv:
-            conversations_repo.append_message(
-                conv.id, role="assistant", text=reply_text
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message,
+                conv_id,
+                role="assistant",
+                text=reply_text,
             )
     return TwilioStreamResponse(
         status="ok",
@@ -2020,311 +2560,248 @@ async def twilio_sms(
     message_sid_ctx.set(MessageSid)
     business_id = business_id_param or DEFAULT_BUSINESS_ID
 
-    logger.info(
-        "twilio_sms_webhook",
-        extra={
-            "business_id": business_id,
-            "from": From,
-            "message_sid": MessageSid,
-        },
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "twilio_sms_webhook",
+            extra={
+                "business_id": business_id,
+                "from": From,
+                "message_sid": MessageSid,
+            },
+        )
 
     # Track Twilio SMS webhook usage.
     metrics.twilio_sms_requests += 1
-    per_tenant = metrics.twilio_by_business.setdefault(
-        business_id, BusinessTwilioMetrics()
-    )
+    per_tenant = metrics.twilio_by_business[business_id]
     per_tenant.sms_requests += 1
+    per_sms = metrics.sms_by_business[business_id]
+
+    # Load the tenant row once, off the event loop on a cache miss, so the
+    # language, status and name lookups below are served from the cache.
+    business = await _load_business_snapshot(
+        business_id, max_age=BUSINESS_STATUS_MAX_AGE_SECONDS
+    )
+    business_name = conversation.DEFAULT_BUSINESS_NAME
+    if business is not None and business.name:
+        business_name = business.name
 
     # Resolve language for this business for outgoing SMS copy and error
     # handling so emergency guidance is localized when tenants are Spanish.
     language_code = get_language_for_business(business_id)
+    copy_lang = _twiml_lang(language_code)
 
     # If the business is suspended, reject early.
-    if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if row is not None and getattr(row, "status", "ACTIVE") != "ACTIVE":
-            return Response(
-                content="<Response></Response>",
-                media_type="text/xml",
-                status_code=status.HTTP_403_FORBIDDEN,
-            )
+    if not _is_business_active(business_id):
+        return Response(
+            content=_TWIML_REJECTED,
+            media_type="text/xml",
+            status_code=status.HTTP_403_FORBIDDEN,
+        )
 
     # Optional signature verification.
-    form_params: Dict[str, str] = {"From": From, "Body": Body}
-    await _maybe_verify_twilio_signature(request, form_params)
-
+    if _twilio_signature_required():
+        form_params: Dict[str, str] = {"From": From, "Body": Body}
+        await _maybe_verify_twilio_signature(request, form_params)
+
+    # Transcript writes run after the TwiML is sent; the caller does not need
+    # to wait on them.
+    transcript_writes = BackgroundTasks()
+    conv_id: str | None = None
     try:
-        normalized_body = Body.strip().lower()
-        opt_out_keywords = {"stop", "stopall", "unsubscribe", "end", "quit"}
-        opt_in_keywords = {"start", "unstop"}
-        confirm_keywords = {"yes", "y", "confirm"}
-        decline_keywords = {"no", "n"}
-        cancel_intent_keywords = {"cancel", "cancel appointment", "cancel appt"}
-        reschedule_keywords = {"reschedule", "change time", "change appointment"}
-        per_sms = metrics.sms_by_business.setdefault(business_id, BusinessSmsMetrics())
+        # Split at most one word past the longest command: bodies that are too
+        # long or start with a non-command word skip the lookup entirely, and
+        # internal whitespace is collapsed so "change  time" matches.
+        words = Body.split(None, _SMS_COMMAND_MAX_WORDS)
+        command = None
+        if (
+            0 < len(words) <= _SMS_COMMAND_MAX_WORDS
+            and words[0].lower() in _SMS_COMMAND_FIRST_WORDS
+        ):
+            command = _SMS_COMMAND.get(" ".join(words).lower())
         pending_action = twilio_state_store.get_pending_action(business_id, From)
 
-        if normalized_body in opt_out_keywords:
+        if command == "OPT_OUT":
             # Mark this customer/phone as opted out of SMS.
-            business_name = _get_business_name(business_id)
-            customer = customers_repo.get_by_phone(From, business_id=business_id)
+            customer = await _run_blocking(
+                customers_repo.get_by_phone, From, business_id=business_id
+            )
             if customer:
-                customers_repo.set_sms_opt_out(
-                    From, business_id=business_id, opt_out=True
+                await _run_blocking(
+                    customers_repo.set_sms_opt_out,
+                    From,
+                    business_id=business_id,
+                    opt_out=True,
                 )
             # Track opt-out event in per-tenant SMS metrics.
-            per_sms = metrics.sms_by_business.setdefault(
-                business_id, BusinessSmsMetrics()
-            )
             per_sms.sms_opt_out_events += 1
             # Simple confirmation message; do not route into the assistant.
-            if language_code == "es":
-                safe_reply = escape(
-                    f"Te has dado de baja de las notificaciones por SMS de {business_name}. "
-                    "Responde START para volver a activarlas."
-                )
-            else:
-                safe_reply = escape(
-                    f"You have opted out of SMS notifications from {business_name}. "
-                    "Reply START to opt back in."
-                )
-            twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
-
-        if normalized_body in opt_in_keywords:
+            reply = _SMS_TEMPLATE_TEXT[(copy_lang, "opted_out")].format(
+                business_name=business_name
+            )
+            return Response(
+                content=_twiml_message(reply),
+                media_type="text/xml",
+            )
+
+        if command == "OPT_IN":
             # Clear any opt-out flag for this customer/phone.
-            business_name = _get_business_name(business_id)
-            customer = customers_repo.get_by_phone(From, business_id=business_id)
+            customer = await _run_blocking(
+                customers_repo.get_by_phone, From, business_id=business_id
+            )
             if customer:
-                customers_repo.set_sms_opt_out(
-                    From, business_id=business_id, opt_out=False
+                await _run_blocking(
+                    customers_repo.set_sms_opt_out,
+                    From,
+                    business_id=business_id,
+                    opt_out=False,
                 )
             # Track opt-in event in per-tenant SMS metrics.
-            per_sms = metrics.sms_by_business.setdefault(
-                business_id, BusinessSmsMetrics()
-            )
             per_sms.sms_opt_in_events += 1
-            if language_code == "es":
-                safe_reply = escape(
-                    f"Has vuelto a activar las notificaciones por SMS de {business_name}."
-                )
-            else:
-                safe_reply = escape(
-                    f"You have been opted back in to SMS notifications from {business_name}."
-                )
-            twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
+            reply = _SMS_TEMPLATE_TEXT[(copy_lang, "opted_in")].format(
+                business_name=business_name
+            )
+            return Response(
+                content=_twiml_message(reply),
+                media_type="text/xml",
+            )
 
         if pending_action:
-            appt = appointments_repo.get(pending_action.appointment_id)
-            when_str = _format_appointment_time(appt) if appt else ""
-            conv = _ensure_sms_conversation(business_id, From)
-            if normalized_body in confirm_keywords:
+            appt = await _run_blocking(
+                appointments_repo.get, pending_action.appointment_id
+            )
+            conv_id = await _sms_conversation_id(business_id, From)
+            if command == "CONFIRM":
                 if pending_action.action == "cancel" and appt:
+                    when_str = _format_appointment_time(appt)
                     await appointment_actions.cancel_appointment(
                         appointment_id=appt.id,
                         business_id=business_id,
                         actor="customer_sms",
-                        conversation_id=conv.id if conv else None,
+                        conversation_id=conv_id,
                         notify_customer=False,
                     )
                     per_sms.sms_cancellations_via_sms += 1
-                    safe_reply = escape(
-                        f"Your appointment on {when_str} has been cancelled."
-                        if language_code != "es"
-                        else f"Tu cita el {when_str} ha sido cancelada."
+                    reply = _SMS_TEMPLATE_TEXT[(copy_lang, "cancelled")].format(
+                        when=when_str
                     )
                 elif pending_action.action == "reschedule" and appt:
                     await appointment_actions.mark_pending_reschedule(
                         appointment_id=appt.id,
                         business_id=business_id,
                         actor="customer_sms",
-                        conversation_id=conv.id if conv else None,
+                        conversation_id=conv_id,
                     )
                     per_sms.sms_reschedules_via_sms += 1
-                    safe_reply = escape(
-                        "Got it. We've marked your appointment for rescheduling."
-                        if language_code != "es"
-                        else "Entendido. Hemos marcado tu cita para reprogramar."
-                    )
+                    reply = _SMS_STATIC_TEXT[(copy_lang, "rescheduled")]
                 else:
-                    safe_reply = escape(
-                        "Thanks, noted."
-                        if language_code != "es"
-                        else "Gracias, anotado."
+                    twilio_state_store.clear_pending_action(business_id, From)
+                    return Response(
+                        content=_SMS_STATIC_REPLY[(copy_lang, "noted")],
+                        media_type="text/xml",
                     )
                 twilio_state_store.clear_pending_action(business_id, From)
-                twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-                return Response(content=twiml, media_type="text/xml")
-            if normalized_body in decline_keywords:
+                return Response(
+                    content=_twiml_message(reply),
+                    media_type="text/xml",
+                )
+            if command == "DECLINE":
                 twilio_state_store.clear_pending_action(business_id, From)
-                safe_reply = escape(
-                    "Okay, keeping your current appointment."
-                    if language_code != "es"
-                    else "Listo, mantenemos tu cita actual."
+                return Response(
+                    content=_SMS_STATIC_REPLY[(copy_lang, "declined")],
+                    media_type="text/xml",
                 )
-                twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-                return Response(content=twiml, media_type="text/xml")
-            remind = escape(
-                "Please reply YES to confirm or NO to keep your current time."
-                if language_code != "es"
-                else "Responde SI para confirmar o NO para mantener tu hora actual."
+            return Response(
+                content=_SMS_STATIC_REPLY[(copy_lang, "remind")],
+                media_type="text/xml",
             )
-            twiml = f"""
-<Response>
-  <Message>{remind}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml, media_type="text/xml")
 
         # Cancellation intent requires explicit confirmation.
-        if normalized_body in cancel_intent_keywords:
-            appt = _find_next_appointment_for_phone(From, business_id)
-            if appt is not None:
-                when_str = _format_appointment_time(appt)
-                twilio_state_store.set_pending_action(
-                    business_id,
-                    From,
-                    PendingAction(
-                        action="cancel",
-                        appointment_id=appt.id,
-                        business_id=business_id,
-                        created_at=datetime.now(UTC),
-                    ),
-                )
-                safe_reply = escape(
-                    f"Reply YES to cancel your appointment on {when_str}, or NO to keep it."
-                    if language_code != "es"
-                    else f"Responde SI para cancelar tu cita el {when_str}, o NO para mantenerla."
-                )
-            else:
-                business_name = _get_business_name(business_id)
-                safe_reply = escape(
-                    "We could not find an upcoming appointment linked to this number for "
-                    f"{business_name}. If this seems wrong, please call or text us with more details."
-                    if language_code != "es"
-                    else "No pudimos encontrar una pr?xima cita vinculada a este n?mero. Si crees que esto es un error, por favor llama o env?anos un mensaje de texto con m?s detalles."
+        if command == "CANCEL":
+            appt = await _run_blocking(
+                _find_next_appointment_for_phone, From, business_id
+            )
+            if appt is None:
+                return Response(
+                    content=_sms_no_appointment_reply(copy_lang, business_name),
+                    media_type="text/xml",
                 )
-            twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml.strip(), media_type="text/xml")
+            when_str = _format_appointment_time(appt)
+            twilio_state_store.set_pending_action(
+                business_id,
+                From,
+                PendingAction(
+                    action="cancel",
+                    appointment_id=appt.id,
+                    business_id=business_id,
+                    created_at=datetime.now(UTC),
+                ),
+            )
+            reply = _SMS_TEMPLATE_TEXT[(copy_lang, "cancel_prompt")].format(
+                when=when_str
+            )
+            return Response(
+                content=_twiml_message(reply),
+                media_type="text/xml",
+            )
 
         # Reschedule intent requires confirmation to avoid accidental changes.
-        if normalized_body in reschedule_keywords:
-            appt = _find_next_appointment_for_phone(From, business_id)
-            if appt is not None:
-                when_str = _format_appointment_time(appt)
-                twilio_state_store.set_pending_action(
-                    business_id,
-                    From,
-                    PendingAction(
-                        action="reschedule",
-                        appointment_id=appt.id,
-                        business_id=business_id,
-                        created_at=datetime.now(UTC),
-                    ),
-                )
-                safe_reply = escape(
-                    f"Reply YES to mark your appointment on {when_str} for rescheduling, or NO to keep it."
-                    if language_code != "es"
-                    else f"Responde SI para marcar tu cita el {when_str} para reprogramar, o NO para mantenerla."
-                )
-            else:
-                business_name = _get_business_name(business_id)
-                safe_reply = escape(
-                    "We could not find an upcoming appointment linked to this number for "
-                    f"{business_name}. If this seems wrong, please call or text us with more details."
-                    if language_code != "es"
-                    else "No pudimos encontrar una pr?xima cita vinculada a este n?mero. Si crees que esto es un error, por favor llama o env?anos un mensaje de texto con m?s detalles."
+        if command == "RESCHEDULE":
+            appt = await _run_blocking(
+                _find_next_appointment_for_phone, From, business_id
+            )
+            if appt is None:
+                return Response(
+                    content=_sms_no_appointment_reply(copy_lang, business_name),
+                    media_type="text/xml",
                 )
-            twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml.strip(), media_type="text/xml")
+            when_str = _format_appointment_time(appt)
+            twilio_state_store.set_pending_action(
+                business_id,
+                From,
+                PendingAction(
+                    action="reschedule",
+                    appointment_id=appt.id,
+                    business_id=business_id,
+                    created_at=datetime.now(UTC),
+                ),
+            )
+            reply = _SMS_TEMPLATE_TEXT[(copy_lang, "reschedule_prompt")].format(
+                when=when_str
+            )
+            return Response(
+                content=_twiml_message(reply),
+                media_type="text/xml",
+            )
 
         # Simple confirmation for upcoming appointments when there is no pending action.
-        if normalized_body in confirm_keywords:
-            appt = _find_next_appointment_for_phone(From, business_id)
-            if appt is not None:
-                when_str = _format_appointment_time(appt)
-                current_stage = getattr(appt, "job_stage", None)
-                new_stage = current_stage or "Booked"
-                appointments_repo.update(
-                    appt.id, status="CONFIRMED", job_stage=new_stage
-                )
-                per_sms.sms_confirmations_via_sms += 1
-                safe_reply = escape(
-                    f"Gracias. Tu pr?xima cita el {when_str} ha sido confirmada."
-                    if language_code == "es"
-                    else f"Thanks. Your upcoming appointment on {when_str} is confirmed."
-                )
-            else:
-                business_name = _get_business_name(business_id)
-                safe_reply = escape(
-                    "We could not find an upcoming appointment linked to this number for "
-                    f"{business_name}. If this seems wrong, please call or text us with more details."
-                    if language_code != "es"
-                    else "No pudimos encontrar una pr?xima cita vinculada a este n?mero. Si crees que esto es un error, por favor llama o env?anos un mensaje de texto con m?s detalles."
+        if command == "CONFIRM":
+            appt = await _run_blocking(
+                _find_next_appointment_for_phone, From, business_id
+            )
+            if appt is None:
+                return Response(
+                    content=_sms_no_appointment_reply(copy_lang, business_name),
+                    media_type="text/xml",
                 )
-            twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-            return Response(content=twiml.strip(), media_type="text/xml")
-        from_phone = From or ""
-        link = twilio_state_store.get_sms_conversation(business_id, from_phone)
-        if link:
-            conv = conversations_repo.get(link.conversation_id)
-            conv_id = link.conversation_id if conv else None
-        else:
-            customer = customers_repo.get_by_phone(From, business_id=business_id)
-            conv = conversations_repo.create(
-                channel="sms",
-                customer_id=customer.id if customer else None,
-                business_id=business_id,
+            when_str = _format_appointment_time(appt)
+            current_stage = getattr(appt, "job_stage", None)
+            new_stage = current_stage or "Booked"
+            await _run_blocking(
+                appointments_repo.update,
+                appt.id,
+                status="CONFIRMED",
+                job_stage=new_stage,
             )
-            conv_id = conv.id
-            twilio_state_store.set_sms_conversation(
-                business_id,
-                from_phone,
-                conv_id,
+            per_sms.sms_confirmations_via_sms += 1
+            reply = _SMS_TEMPLATE_TEXT[(copy_lang, "confirmed")].format(when=when_str)
+            return Response(
+                content=_twiml_message(reply),
+                media_type="text/xml",
             )
-
-        # Log user message.
-        if conv_id:
-            conversations_repo.append_message(conv_id, role="user", text=Body)
+        conv_id = await _sms_conversation_id(business_id, From or "")
 
         # Reuse the conversation manager by synthesizing a CallSession.
-        from ..services.sessions import CallSession  # local import to avoid cycles
-
-        session = CallSession(
+        session = sessions.CallSession(
             id=conv_id or "",
             caller_phone=From,
             business_id=business_id,
@@ -2332,19 +2809,23 @@ async def twilio_sms(
             lead_source=lead_source_param,
         )
         result = await conversation.conversation_manager.handle_input(session, Body)
+        content = _twiml_message(result.reply_text)
 
+        # Log the user line and the reply in one write. SMS conversations are
+        # not keyed by a call session, so the manager reads no transcript
+        # history for them and the caller's line can follow the reply.
         if conv_id:
-            conversations_repo.append_message(
-                conv_id, role="assistant", text=result.reply_text
+            transcript_writes.add_task(
+                conversations_repo.append_messages,
+                conv_id,
+                [("user", Body), ("assistant", result.reply_text)],
             )
 
-        safe_reply = escape(result.reply_text)
-        twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
+        return Response(
+            content=content,
+            media_type="text/xml",
+            background=transcript_writes,
+        )
     except Exception:  # pragma: no cover - defensive
         logger.exception(
             "twilio_sms_unhandled_error",
@@ -2353,39 +2834,56 @@ async def twilio_sms(
                 "from": From,
             },
         )
-        if language_code == "es":
-            message = (
-                "Lo siento, hubo un problema al manejar tu mensaje. "
-                "Por favor inténtalo de nuevo en unos minutos. "
-                "Si se trata de una emergencia que ponga en riesgo la vida, "
-                "llama al 911 o a tu número de emergencias local en lugar de enviar un mensaje de texto."
-            )
-        else:
-            message = (
-                "Sorry, something went wrong while handling your message. "
-                "Please try again in a few minutes. "
-                "If this is a life-threatening emergency, call 911 or your local emergency number instead of texting."
-            )
-        safe_reply = escape(message)
         # Track Twilio SMS errors globally and per tenant.
         metrics.twilio_sms_errors += 1
-        per_tenant = metrics.twilio_by_business.setdefault(
-            business_id, BusinessTwilioMetrics()
-        )
         per_tenant.sms_errors += 1
-        twiml = f"""
-<Response>
-  <Message>{safe_reply}</Message>
-</Response>
-""".strip()
-        return Response(content=twiml, media_type="text/xml")
+        # Keep the caller's message even though the assistant did not reply.
+        if conv_id:
+            transcript_writes.add_task(
+                conversations_repo.append_message, conv_id, role="user", text=Body
+            )
+        return Response(
+            content=_SMS_STATIC_REPLY[(copy_lang, "error")],
+            media_type="text/xml",
+            background=transcript_writes,
+        )
+
+
+# Status-callback keys this process has already accepted, so repeat
+# deliveries are answered without a state-store round trip. Entries follow
+# the store's one-hour call-session TTL and the oldest are evicted first.
+_STATUS_SEEN: OrderedDict[str, float] = OrderedDict()
+_STATUS_SEEN_MAX = 50_000
+_STATUS_SEEN_TTL_SECONDS = 3600.0
+_STATUS_SEEN_LOCK = threading.Lock()
+
+
+def _status_seen_locally(cache_key: str) -> bool:
+    now = time.monotonic()
+    with _STATUS_SEEN_LOCK:
+        seen_at = _STATUS_SEEN.get(cache_key)
+        if seen_at is None:
+            return False
+        if now - seen_at >= _STATUS_SEEN_TTL_SECONDS:
+            del _STATUS_SEEN[cache_key]
+            return False
+        return True
+
+
+def _remember_status(cache_key: str) -> None:
+    with _STATUS_SEEN_LOCK:
+        _STATUS_SEEN[cache_key] = time.monotonic()
+        _STATUS_SEEN.move_to_end(cache_key)
+        while len(_STATUS_SEEN) > _STATUS_SEEN_MAX:
+            _STATUS_SEEN.popitem(last=False)
 
 
 @router.post("/status-callback")
 async def twilio_status_callback(request: Request) -> dict:
     """Capture Twilio delivery status callbacks for observability."""
     form_params = await request.form()
-    await _maybe_verify_twilio_signature(request, form_params)
+    if _twilio_signature_required():
+        await _maybe_verify_twilio_signature(request, {}, full_form=form_params)
     event_id = request.headers.get("X-Twilio-EventId") or request.headers.get(
         "Twilio-Event-Id"
     )
@@ -2398,7 +2896,8 @@ async def twilio_status_callback(request: Request) -> dict:
     # Deduplicate by EventId + MessageSid.
     if event_id:
         cache_key = f"status:{message_sid}"
-        if twilio_state_store.get_call_session(cache_key):
+        seen = _status_seen_locally(cache_key)
+        if seen or twilio_state_store.get_call_session(cache_key):
             logger.info(
                 "twilio_status_duplicate",
                 extra={"event_id": event_id, "sid": message_sid},
@@ -2407,29 +2906,27 @@ async def twilio_status_callback(request: Request) -> dict:
         twilio_state_store.set_call_session(
             cache_key, cache_key, state=message_status, event_id=event_id
         )
-    logger.info(
-        "twilio_status_callback",
-        extra={
-            "message_sid": message_sid,
-            "message_status": message_status,
-            "to": to,
-            "from": from_,
-            "error_code": error_code,
-        },
-    )
+        _remember_status(cache_key)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "twilio_status_callback",
+            extra={
+                "message_sid": message_sid,
+                "message_status": message_status,
+                "to": to,
+                "from": from_,
+                "error_code": error_code,
+            },
+        )
     return {"received": True, "status": message_status, "sid": message_sid}
 
 
 @router.api_route("/fallback", methods=["GET", "POST"])
 async def twilio_fallback(request: Request) -> Response:
     """Fallback handler for voice/SMS if the primary webhook fails."""
-    await _maybe_verify_twilio_signature(request, {})
-    twiml = """
-<Response>
-  <Say voice="Polly.Joanna">We are unable to take your call at the moment. We will call you back shortly.</Say>
-</Response>
-""".strip()
-    return Response(content=twiml, media_type="text/xml")
+    if _twilio_signature_required():
+        await _maybe_verify_twilio_signature(request, {})
+    return Response(content=_FALLBACK_TWIML, media_type="text/xml")
 
 
 @router.post("/voicemail", response_class=Response)
@@ -2445,16 +2942,17 @@ async def twilio_voicemail(
     call_sid_ctx.set(CallSid)
     business_id = business_id_param or DEFAULT_BUSINESS_ID
     # Optional signature verification.
-    form_params: Dict[str, str] = {"CallSid": CallSid}
-    if From is not None:
-        form_params["From"] = From
-    if RecordingUrl is not None:
-        form_params["RecordingUrl"] = RecordingUrl
-    await _maybe_verify_twilio_signature(request, form_params)
+    if _twilio_signature_required():
+        form_params: Dict[str, str] = {"CallSid": CallSid}
+        if From is not None:
+            form_params["From"] = From
+        if RecordingUrl is not None:
+            form_params["RecordingUrl"] = RecordingUrl
+        await _maybe_verify_twilio_signature(request, form_params)
 
     phone = From or ""
     now = datetime.now(UTC)
-    queue = metrics.callbacks_by_business.setdefault(business_id, {})
+    queue = metrics.callbacks_by_business[business_id]
     existing = queue.get(phone)
     if existing is None:
         existing = CallbackItem(
@@ -2476,41 +2974,30 @@ async def twilio_voicemail(
 
     # Best-effort owner notification with a callback link.
     owner_message = f"New voicemail from {phone or 'unknown'} at {now.strftime('%Y-%m-%d %H:%M UTC')}."
-    business_row = None
+    business = None
     if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            business_row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-    owner_phone = getattr(business_row, "owner_phone", None) if business_row else None
-    owner_email = getattr(business_row, "owner_email", None) if business_row else None
+        business = await _load_business_snapshot(business_id)
+    owner_phone = getattr(business, "owner_phone", None) if business else None
+    owner_email = getattr(business, "owner_email", None) if business else None
     callback_hint = " Check dashboard callback queue to return the call."
     owner_message = owner_message + callback_hint
+    # The owner alert goes out after Twilio has its response.
+    notifications = BackgroundTasks()
     if owner_phone:
-        try:
-            from ..services.owner_notifications import notify_owner_with_fallback
-
-            await notify_owner_with_fallback(
-                business_id=business_id,
-                message=owner_message,
-                subject="New voicemail",
-                dedupe_key=f"voicemail_{CallSid or owner_message}",
-                send_email_copy=bool(owner_email),
-            )
-        except Exception:
-            logger.warning(
-                "voicemail_owner_sms_failed",
-                exc_info=True,
-                extra={"business_id": business_id, "call_sid": CallSid},
-            )
+        notifications.add_task(
+            _notify_best_effort,
+            notify_owner_with_fallback,
+            log_event="voicemail_owner_sms_failed",
+            log_extra={"business_id": business_id, "call_sid": CallSid},
+            business_id=business_id,
+            message=owner_message,
+            subject="New voicemail",
+            dedupe_key=f"voicemail_{CallSid or owner_message}",
+            send_email_copy=bool(owner_email),
+        )
 
-    safe_reply = escape(
-        "Thank you. We received your message and will call you back shortly."
+    return Response(
+        content=_TWIML_VOICEMAIL_RECEIVED,
+        media_type="text/xml",
+        background=notifications,
     )
-    twiml = f"""
-<Response>
-  <Say voice="alice">{safe_reply}</Say>
-</Response>
-""".strip()
-    return Response(content=twiml, media_type="text/xml")
@@ -1,11 +1,15 @@
+import asyncio
+import contextlib
 import logging
 import os
+from functools import partial
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from ..deps import ensure_onboarding_ready
-from ..metrics import BusinessVoiceSessionMetrics, metrics
+from ..metrics import metrics
 from ..repositories import conversations_repo, customers_repo
 from ..services import conversation, sessions, subscription as subscription_service
 from ..business_config import get_voice_for_business
@@ -50,9 +54,7 @@ async def start_session(
     )
     # Track voice session API usage.
     metrics.voice_session_requests += 1
-    per_tenant = metrics.voice_sessions_by_business.setdefault(
-        business_id, BusinessVoiceSessionMetrics()
-    )
+    per_tenant = metrics.voice_sessions_by_business[business_id]
     per_tenant.requests += 1
 
     session = sessions.session_store.create(
@@ -82,9 +84,7 @@ async def session_input(
 ) -> SessionInputResponse:
     # Track voice session API usage.
     metrics.voice_session_requests += 1
-    per_tenant = metrics.voice_sessions_by_business.setdefault(
-        business_id, BusinessVoiceSessionMetrics()
-    )
+    per_tenant = metrics.voice_sessions_by_business[business_id]
     per_tenant.requests += 1
 
     session = sessions.session_store.get(session_id)
@@ -95,12 +95,30 @@ async def session_input(
     if not text and payload.audio:
         text = await conversation.speech_service.transcribe(payload.audio)
 
+    # The conversation manager builds its intent history from this transcript,
+    # so the caller's line is logged (off the event loop) before it runs.
     conv = conversations_repo.get_by_session(session_id)
     if conv and text:
-        conversations_repo.append_message(conv.id, role="user", text=text)
+        await anyio.to_thread.run_sync(
+            partial(conversations_repo.append_message, conv.id, role="user", text=text)
+        )
 
+    transcript_write: asyncio.Task[None] | None = None
     try:
         result = await conversation.conversation_manager.handle_input(session, text)
+        if conv:
+            # Nothing reads the reply line before the next turn, so it is
+            # written on a worker thread while the reply is being synthesized.
+            transcript_write = asyncio.create_task(
+                anyio.to_thread.run_sync(
+                    partial(
+                        conversations_repo.append_message,
+                        conv.id,
+                        role="assistant",
+                        text=result.reply_text,
+                    )
+                )
+            )
         voice = get_voice_for_business(business_id)
         audio = await conversation.speech_service.synthesize(
             result.reply_text, voice=voice
@@ -108,14 +126,24 @@ async def session_input(
     except Exception as exc:
         # Track voice session errors globally and per tenant.
         metrics.voice_session_errors += 1
-        per_tenant = metrics.voice_sessions_by_business.setdefault(
-            business_id, BusinessVoiceSessionMetrics()
-        )
         per_tenant.errors += 1
         logger.exception(
             "voice_session_unhandled_error",
             extra={"session_id": session_id, "business_id": business_id},
         )
+        if transcript_write is not None and conv is not None:
+            # The caller never hears this reply, so it is taken back out of
+            # the transcript; a failing write must not defeat the fail-safe.
+            with contextlib.suppress(Exception):
+                await transcript_write
+                await anyio.to_thread.run_sync(
+                    partial(
+                        conversations_repo.delete_last_message,
+                        conv.id,
+                        role="assistant",
+                        text=result.reply_text,
+                    )
+                )
         testing_mode = (
             os.getenv("TESTING", "false").lower() == "true"
             or os.getenv("PYTEST_CURRENT_TEST") is not None
@@ -139,10 +167,8 @@ async def session_input(
             audio="audio://placeholder",
         )
 
-    if conv:
-        conversations_repo.append_message(
-            conv.id, role="assistant", text=result.reply_text
-        )
+    if transcript_write is not None:
+        await transcript_write
 
     return SessionInputResponse(
         reply_text=result.reply_text,
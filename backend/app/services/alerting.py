@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import threading
+import time
 import httpx
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Dict
 
 from ..metrics import metrics
+from .http_clients import close_stale_client
 
 logger = logging.getLogger(__name__)
 
@@ -28,15 +32,106 @@ RUNBOOK_LINKS: Dict[str, str] = {
 }
 
 
-def _should_fire(key: str, cooldown_seconds: int) -> bool:
-    last = metrics.alert_last_fired.get(key)
-    if not last:
-        return True
+# Pooled on-call webhook client, tied to the event loop that opened it.
+_webhook_client: httpx.AsyncClient | None = None
+_webhook_client_loop: asyncio.AbstractEventLoop | None = None
+# Strong references to in-flight webhook posts so they are not collected early.
+_pending_webhooks: set[asyncio.Task[None]] = set()
+# Pooled client for alerts raised outside an event loop (sync handlers run on
+# worker threads), so repeat alerts reuse the keep-alive connection.
+_webhook_sync_client: httpx.Client | None = None
+_webhook_sync_client_lock = threading.Lock()
+
+
+def _webhook_http_client(loop: asyncio.AbstractEventLoop) -> httpx.AsyncClient:
+    global _webhook_client, _webhook_client_loop
+    if _webhook_client is None or _webhook_client_loop is not loop:
+        stale, stale_loop = _webhook_client, _webhook_client_loop
+        _webhook_client = httpx.AsyncClient(
+            timeout=3.0,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        _webhook_client_loop = loop
+        if stale is not None:
+            task = loop.create_task(close_stale_client(stale, stale_loop))
+            _pending_webhooks.add(task)
+            task.add_done_callback(_pending_webhooks.discard)
+    return _webhook_client
+
+
+def _webhook_sync_http_client() -> httpx.Client:
+    global _webhook_sync_client
+    with _webhook_sync_client_lock:
+        if _webhook_sync_client is None:
+            _webhook_sync_client = httpx.Client(
+                timeout=3.0,
+                limits=httpx.Limits(max_keepalive_connections=4),
+            )
+        return _webhook_sync_client
+
+
+async def aclose() -> None:
+    """Close the pooled on-call webhook clients, if any were created."""
+    global _webhook_client, _webhook_client_loop, _webhook_sync_client
+    client, _webhook_client, _webhook_client_loop = _webhook_client, None, None
+    with _webhook_sync_client_lock:
+        sync_client, _webhook_sync_client = _webhook_sync_client, None
+    if client is not None:
+        await client.aclose()
+    if sync_client is not None:
+        sync_client.close()
+
+
+async def _post_webhook_async(
+    client: httpx.AsyncClient,
+    webhook: str,
+    payload: Dict[str, str],
+    key: str,
+    severity: str,
+) -> None:
     try:
-        last_dt = datetime.fromisoformat(last)
+        await client.post(webhook, json=payload)
     except Exception:
+        logger.warning(
+            "oncall_webhook_failed",
+            exc_info=True,
+            extra={"key": key, "severity": severity},
+        )
+
+
+def _post_webhook(
+    webhook: str, payload: Dict[str, str], key: str, severity: str
+) -> None:
+    """Send the on-call webhook without blocking a running event loop.
+
+    Alerts raised from async request handlers schedule the POST as a task on
+    the pooled async client; synchronous callers post through the pooled
+    blocking client.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            _webhook_sync_http_client().post(webhook, json=payload)
+        except Exception:
+            logger.warning(
+                "oncall_webhook_failed",
+                exc_info=True,
+                extra={"key": key, "severity": severity},
+            )
+        return
+    task = loop.create_task(
+        _post_webhook_async(_webhook_http_client(loop), webhook, payload, key, severity)
+    )
+    _pending_webhooks.add(task)
+    task.add_done_callback(_pending_webhooks.discard)
+
+
+def _should_fire(key: str, cooldown_seconds: int) -> bool:
+    last = metrics.alert_last_fired_monotonic.get(key)
+    if last is None:
         return True
-    return datetime.now(timezone.utc) - last_dt >= timedelta(seconds=cooldown_seconds)
+    return time.monotonic() - last >= cooldown_seconds
 
 
 def _record_alert(key: str, detail: str, severity: str, runbook: str) -> None:
@@ -54,17 +149,11 @@ def _record_alert(key: str, detail: str, severity: str, runbook: str) -> None:
     }
     metrics.alert_events_total += 1
     metrics.alert_last_fired[key] = now.isoformat()
+    metrics.alert_last_fired_monotonic[key] = time.monotonic()
     webhook = os.getenv("ONCALL_WEBHOOK_URL")
     if webhook:
         payload = {"text": f"[{severity}] {key}: {detail} | runbook={runbook or 'n/a'}"}
-        try:
-            httpx.post(webhook, json=payload, timeout=3.0)
-        except Exception:
-            logger.warning(
-                "oncall_webhook_failed",
-                exc_info=True,
-                extra={"key": key, "severity": severity},
-            )
+        _post_webhook(webhook, payload, key, severity)
     logger.warning(
         "p0_alert_triggered",
         extra={
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 import logging
 import time
+from typing import Sequence
 
 from .calendar import TimeSlot, calendar_service
 from .stt_tts import speech_service  # noqa: F401  (re-exported for voice router)
@@ -15,6 +17,7 @@ from .nlu import (
     classify_intent_with_metadata,
 )
 from .email_service import email_service
+from .owner_notifications import notify_owner_with_fallback
 from . import sessions
 from . import subscription as subscription_service
 from ..config import get_settings
@@ -23,17 +26,17 @@ from ..db_models import BusinessDB
 from ..metrics import CallbackItem, metrics
 from ..repositories import appointments_repo, customers_repo, conversations_repo
 from ..business_config import (
+    get_business_snapshot,
     get_calendar_id_for_business,
     get_language_for_business,
     get_vertical_for_business,
 )
 from ..assistant_i18n import conversation_text
 
-
 logger = logging.getLogger(__name__)
 
 
-EMERGENCY_KEYWORDS = [
+EMERGENCY_KEYWORDS = (
     "burst",
     "flood",
     "flooding",
@@ -44,7 +47,7 @@ EMERGENCY_KEYWORDS = [
     "backing up",
     "backup",
     "gas leak",
-]
+)
 
 AFFIRMATIVE = {"yes", "y", "yeah", "ya", "si", "sí", "sure", "affirmative"}
 NEGATIVE = {"no", "n", "nope"}
@@ -71,19 +74,20 @@ def _intent_threshold_for_business(business_id: str | None) -> float:
 DEFAULT_BUSINESS_NAME = "Bristol Plumbing"
 
 
-def _get_emergency_keywords_for_business(business_id: str | None) -> list[str]:
+@lru_cache(maxsize=256)
+def _parse_emergency_keywords(raw: str) -> tuple[str, ...]:
+    return tuple(k.strip().lower() for k in raw.split(",") if k.strip())
+
+
+def _get_emergency_keywords_for_business(
+    business_id: str | None,
+) -> tuple[str, ...]:
     """Return per-tenant emergency keywords, falling back to defaults."""
-    if business_id and SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session_db = SessionLocal()
-        try:
-            row = session_db.get(BusinessDB, business_id)
-        finally:
-            session_db.close()
-        if row is not None and getattr(row, "emergency_keywords", None):
-            raw = row.emergency_keywords or ""
-            keywords = [k.strip().lower() for k in raw.split(",") if k.strip()]
-            if keywords:
-                return keywords
+    snapshot = get_business_snapshot(business_id)
+    if snapshot is not None and snapshot.emergency_keywords:
+        keywords = _parse_emergency_keywords(snapshot.emergency_keywords)
+        if keywords:
+            return keywords
     return EMERGENCY_KEYWORDS
 
 
@@ -91,7 +95,7 @@ def _score_emergency_signal(
     text: str | None,
     intent_label: str | None,
     intent_confidence: float | None,
-    keywords: list[str],
+    keywords: Sequence[str],
     existing_confidence: float,
 ) -> tuple[float, list[str]]:
     """Return (confidence, reasons) for emergency detection."""
@@ -343,7 +347,7 @@ def _enqueue_callback_followup(
     phone = session.caller_phone or session.id
     if not phone:
         return
-    queue = metrics.callbacks_by_business.setdefault(business_id, {})
+    queue = metrics.callbacks_by_business[business_id]
     now = datetime.now(UTC)
     existing = queue.get(phone)
     channel = getattr(session, "channel", "phone") or "phone"
@@ -484,7 +488,7 @@ class ConversationManager:
             intent_low_confidence = True
             session.intent = None
         normalized_intent_label = _normalize_intent_label(session.intent)
-        conv = conversations_repo.get_by_session(session.id)
+        # Reuse the conversation loaded for the intent history above.
         if conv:
             conversations_repo.set_intent(
                 conv.id, session.intent, getattr(session, "intent_confidence", None)
@@ -959,8 +963,6 @@ class ConversationManager:
                         f"Address: {session.address or 'n/a'}\n"
                         f"Problem: {session.problem_summary or 'n/a'}"
                     )
-            from .owner_notifications import notify_owner_with_fallback
-
             subject = (
                 "Emergency booking"
                 if session.is_emergency
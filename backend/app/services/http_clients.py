@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Strong references to close tasks handed to another loop, so they are not
+# garbage-collected before the client has finished closing.
+_pending_closes: set[asyncio.Task[None]] = set()
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        logger.debug("http_client_close_failed", exc_info=True)
+
+
+def _spawn_close(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    task = loop.create_task(_aclose_quietly(client))
+    _pending_closes.add(task)
+    task.add_done_callback(_pending_closes.discard)
+
+
+async def close_stale_client(
+    client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+) -> None:
+    """Close a pooled client left behind by another event loop.
+
+    Keep-alive connections belong to the loop that opened them, so if that
+    loop is still running (on another thread) the close is handed to it;
+    otherwise the client is closed from the current loop. Errors are logged
+    and never raised.
+    """
+    if loop is not None and loop.is_running():
+        try:
+            loop.call_soon_threadsafe(_spawn_close, loop, client)
+            return
+        except RuntimeError:
+            # The loop closed between the check and the hand-off.
+            pass
+    await _aclose_quietly(client)
@@ -65,7 +65,7 @@ class JobQueue:
             try:
                 job(*args, **kwargs)
             except Exception:
-                metrics.background_job_errors += 1
+                metrics.incr("background_job_errors")
                 logger.exception(
                     "background_job_failed",
                     extra={"job": getattr(job, "__name__", "unknown")},
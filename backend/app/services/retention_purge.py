@@ -15,6 +15,7 @@ from ..db_models import (
     RetentionPurgeLogDB,
 )
 from ..metrics import metrics
+from .twilio_state import invalidate_sms_conversation_cache
 
 logger = logging.getLogger(__name__)
 _scheduler_started = False
@@ -95,6 +96,9 @@ def run_retention_purge(
 
         # Persist deletions before attempting to log so cleanup isn't lost if logging fails.
         session.commit()
+        if conversations_deleted:
+            # Purged ids must not be reused by the SMS webhook's L1 cache.
+            invalidate_sms_conversation_cache()
 
         log_id: int | None = None
         try:
@@ -114,10 +118,10 @@ def run_retention_purge(
             logger.exception("retention_purge_log_failed")
             # Do not block deletion results if logging fails.
 
-        metrics.retention_purge_runs += 1
-        metrics.retention_appointments_deleted += appointments_deleted
-        metrics.retention_conversations_deleted += conversations_deleted
-        metrics.retention_messages_deleted += messages_deleted
+        metrics.incr("retention_purge_runs")
+        metrics.incr("retention_appointments_deleted", appointments_deleted)
+        metrics.incr("retention_conversations_deleted", conversations_deleted)
+        metrics.incr("retention_messages_deleted", messages_deleted)
 
         return PurgeResult(
             appointments_deleted=appointments_deleted,
@@ -126,7 +130,7 @@ def run_retention_purge(
             log_id=log_id,
         )
     except Exception:
-        metrics.background_job_errors += 1
+        metrics.incr("background_job_errors")
         logger.exception("retention_purge_failed")
         session.rollback()
         raise
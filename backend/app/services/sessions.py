@@ -37,6 +37,7 @@ class CallSession:
     channel: str = "phone"
     lead_source: str | None = None
     no_input_count: int = 0
+    conversation_id: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
@@ -200,6 +201,7 @@ class RedisSessionStore:
             channel=data.get("channel", "phone"),
             lead_source=data.get("lead_source"),
             no_input_count=no_input_count,
+            conversation_id=data.get("conversation_id"),
             created_at=created_at or datetime.now(UTC),
             updated_at=updated_at or datetime.now(UTC),
         )
@@ -236,6 +238,7 @@ class RedisSessionStore:
             "channel": session.channel,
             "lead_source": session.lead_source,
             "no_input_count": session.no_input_count,
+            "conversation_id": session.conversation_id,
             "created_at": session.created_at.isoformat(),
             "updated_at": session.updated_at.isoformat(),
         }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -8,8 +9,9 @@ import httpx
 from ..config import get_settings
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
 from ..db_models import BusinessDB
-from ..metrics import BusinessSmsMetrics, metrics
+from ..metrics import metrics
 from .alerting import record_notification_failure
+from .http_clients import close_stale_client
 
 
 @dataclass
@@ -31,6 +33,33 @@ class SmsService:
     def __init__(self) -> None:
         self._settings = get_settings().sms
         self._sent: List[SentMessage] = []
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def _http_client(self) -> httpx.AsyncClient:
+        """Return a pooled client for Twilio REST calls.
+
+        Keep-alive connections are tied to the event loop that opened them, so
+        a new client is created if the service is used from a different loop
+        and the old one is closed rather than left holding its connections.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
+            stale, stale_loop = self._client, self._client_loop
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+            self._client_loop = loop
+            if stale is not None:
+                await close_stale_client(stale, stale_loop)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        client, self._client, self._client_loop = self._client, None, None
+        if client is not None:
+            await client.aclose()
 
     @property
     def owner_number(self) -> Optional[str]:
@@ -57,9 +86,7 @@ class SmsService:
         metrics.notification_attempts += 1
 
         if business_id:
-            per_tenant = metrics.sms_by_business.setdefault(
-                business_id, BusinessSmsMetrics()
-            )
+            per_tenant = metrics.sms_by_business[business_id]
             per_tenant.sms_sent_total += 1
 
         if self._settings.provider != "twilio":
@@ -83,9 +110,9 @@ class SmsService:
         data = {"From": from_number, "To": to, "Body": body}
         for attempt in range(max(1, attempts)):
             try:
-                async with httpx.AsyncClient(timeout=10.0, auth=(sid, token)) as client:
-                    resp = await client.post(url, data=data)
-                    resp.raise_for_status()
+                client = await self._http_client()
+                resp = await client.post(url, data=data, auth=(sid, token))
+                resp.raise_for_status()
                 return True
             except Exception as exc:
                 record_notification_failure("sms", detail=exc.__class__.__name__)
@@ -117,9 +144,7 @@ class SmsService:
         )
         metrics.sms_sent_owner += 1
         if business_id:
-            per_tenant = metrics.sms_by_business.setdefault(
-                business_id, BusinessSmsMetrics()
-            )
+            per_tenant = metrics.sms_by_business[business_id]
             per_tenant.sms_sent_owner += 1
         return success
 
@@ -134,9 +159,7 @@ class SmsService:
         await self.send_sms(to, body, business_id=business_id, category="customer")
         metrics.sms_sent_customer += 1
         if business_id:
-            per_tenant = metrics.sms_by_business.setdefault(
-                business_id, BusinessSmsMetrics()
-            )
+            per_tenant = metrics.sms_by_business[business_id]
             per_tenant.sms_sent_customer += 1
 
 
@@ -397,6 +397,7 @@ class SpeechService:
     ) -> None:
         self._settings = settings or get_settings().speech
         self._provider_override = provider
+        self._provider: SpeechProvider | None = None
         self._circuit_open_until: float | None = None
         self._last_error: str | None = None
         self._last_provider: str | None = None
@@ -414,13 +415,22 @@ class SpeechService:
         metrics.speech_circuit_trips += 1
 
     def _select_provider(self) -> SpeechProvider:
+        """Return the configured provider, built once per service.
+
+        Providers hold per-process state (GCP credentials and their access
+        token), so reusing one instance lets every utterance after the first
+        skip credential discovery and token refresh.
+        """
         if self._provider_override is not None:
             return self._provider_override
-        if self._settings.provider == "openai" and self._settings.openai_api_key:
-            return OpenAISpeechProvider(self._settings)
-        if self._settings.provider == "gcp":
-            return GoogleCloudSpeechProvider(self._settings)
-        return StubSpeechProvider()
+        if self._provider is None:
+            if self._settings.provider == "openai" and self._settings.openai_api_key:
+                self._provider = OpenAISpeechProvider(self._settings)
+            elif self._settings.provider == "gcp":
+                self._provider = GoogleCloudSpeechProvider(self._settings)
+            else:
+                self._provider = StubSpeechProvider()
+        return self._provider
 
     def _fallback_provider(self) -> SpeechProvider:
         # For now, the fallback is always stub to preserve deterministic flows.
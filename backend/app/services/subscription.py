@@ -10,7 +10,7 @@ from fastapi import HTTPException, status
 from ..config import get_settings
 from ..db import SQLALCHEMY_AVAILABLE, SessionLocal
 from ..db_models import BusinessDB
-from ..metrics import BusinessVoiceSessionMetrics, metrics
+from ..metrics import metrics
 from ..repositories import appointments_repo
 from .email_service import email_service
 
@@ -70,10 +70,8 @@ def _plan_limits(plan: str | None) -> Dict[str, Optional[int]]:
 
 
 def _usage_snapshot(business_id: str) -> UsageSnapshot:
-    per = metrics.voice_sessions_by_business.get(
-        business_id, BusinessVoiceSessionMetrics()
-    )
-    calls = per.requests
+    per = metrics.voice_sessions_by_business.get(business_id)
+    calls = per.requests if per else 0
 
     # Appointment counts are derived from currently stored appointments. In
     # in-memory mode this reflects the running process; when backed by a DB it
@@ -154,6 +152,12 @@ def compute_state(business_id: str) -> SubscriptionState:
     return state
 
 
+def _reminder_due(business_id: str, cache_status: str) -> bool:
+    last_sent = _reminder_cache.get(f"{business_id}:{cache_status}")
+    interval = timedelta(hours=_reminder_interval_hours())
+    return not last_sent or datetime.now(UTC) - last_sent >= interval
+
+
 async def _notify_owner_if_needed(
     business: BusinessDB | None,
     state: SubscriptionState,
@@ -167,11 +171,7 @@ async def _notify_owner_if_needed(
     if not owner_email:
         return
     cache_status = status_override or state.status
-    cache_key = f"{business.id}:{cache_status}"
-    last_sent = _reminder_cache.get(cache_key)
-    interval = timedelta(hours=_reminder_interval_hours())
-    now = datetime.now(UTC)
-    if last_sent and now - last_sent < interval:
+    if not _reminder_due(business.id, cache_status):
         return
     subject = f"Subscription attention needed ({cache_status})"
     grace_note = ""
@@ -190,7 +190,7 @@ async def _notify_owner_if_needed(
             business_id=business.id,
             owner_email=owner_email,
         )
-        _reminder_cache[cache_key] = now
+        _reminder_cache[f"{business.id}:{cache_status}"] = datetime.now(UTC)
     except Exception:
         logger.warning(
             "subscription_reminder_failed",
@@ -199,6 +199,35 @@ async def _notify_owner_if_needed(
         )
 
 
+async def _remind_owner(
+    business_id: str,
+    state: SubscriptionState,
+    *,
+    status_override: str | None = None,
+    message_override: str | None = None,
+) -> None:
+    """Send a subscription reminder, loading the business row only when due.
+
+    check_access runs on every voice/SMS webhook, so the reminder throttle is
+    consulted before opening a session for the owner's contact details.
+    """
+    if not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
+        return
+    if not _reminder_due(business_id, status_override or state.status):
+        return
+    session = SessionLocal()
+    try:
+        business = session.get(BusinessDB, business_id)
+    finally:
+        session.close()
+    await _notify_owner_if_needed(
+        business,
+        state,
+        status_override=status_override,
+        message_override=message_override,
+    )
+
+
 async def notify_status_change(business_id: str, state: SubscriptionState) -> None:
     """Best-effort owner notification for subscription state transitions."""
     if not (SQLALCHEMY_AVAILABLE and SessionLocal is not None):
@@ -233,50 +262,27 @@ async def check_access(
             )
             if state.in_grace and state.grace_remaining_days:
                 state.message = f"Payment past due. Grace ends in {state.grace_remaining_days} day(s)."
-            if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-                session = SessionLocal()
-                try:
-                    business = session.get(BusinessDB, business_id)
-                finally:
-                    session.close()
-                await _notify_owner_if_needed(business, state)
+            await _remind_owner(business_id, state)
         else:
             expiring_window = timedelta(days=_grace_days())
             if (
                 state.current_period_end
                 and state.current_period_end <= datetime.now(UTC) + expiring_window
             ):
-                if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-                    session = SessionLocal()
-                    try:
-                        business = session.get(BusinessDB, business_id)
-                    finally:
-                        session.close()
-                    await _notify_owner_if_needed(
-                        business,
-                        state,
-                        status_override="expiring_soon",
-                        message_override="Subscription renews soon; confirm payment to avoid interruption.",
-                    )
+                await _remind_owner(
+                    business_id,
+                    state,
+                    status_override="expiring_soon",
+                    message_override="Subscription renews soon; confirm payment to avoid interruption.",
+                )
         return state
 
-    # Pull the business row when available for richer messaging/notifications.
-    business = None
-    if SQLALCHEMY_AVAILABLE and SessionLocal is not None:
-        session = SessionLocal()
-        try:
-            business = session.get(BusinessDB, business_id)
-        finally:
-            session.close()
-
     if state.status not in {"active", "trialing"}:
         if state.in_grace:
             state.message = state.message or (
                 f"Payment past due. Grace ends in {state.grace_remaining_days} day(s)."
             )
-            await _notify_owner_if_needed(
-                business, state, message_override=state.message
-            )
+            await _remind_owner(business_id, state, message_override=state.message)
             return state
         state.blocked = True
         state.block_reason = "inactive"
@@ -286,7 +292,7 @@ async def check_access(
             if feature == "calls"
             else "Subscription inactive. Please upgrade or resume billing."
         )
-        await _notify_owner_if_needed(business, state)
+        await _remind_owner(business_id, state)
         if graceful:
             return state
         raise HTTPException(
@@ -305,8 +311,8 @@ async def check_access(
         state.message = state.message or (
             "Subscription renews soon; confirm payment to avoid interruption."
         )
-        await _notify_owner_if_needed(
-            business,
+        await _remind_owner(
+            business_id,
             state,
             status_override="expiring_soon",
             message_override=state.message,
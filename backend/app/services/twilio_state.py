@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, Optional, Protocol, Tuple
 import json
 import logging
 import os
+import threading
+import time
 
 from ..config import get_settings
 
@@ -460,3 +463,47 @@ def _create_twilio_state_store() -> TwilioStateStore:
 
 
 twilio_state_store: TwilioStateStore = _create_twilio_state_store()
+
+
+# Process-local L1 over the SMS conversation links. Active SMS threads resolve
+# the same (business, phone) conversation on every message, so ids are reused
+# for a short window without a state-store or repository round trip; the
+# oldest entries are evicted first. Code that deletes conversations calls
+# invalidate_sms_conversation_cache() so no message is logged to a removed id.
+SMS_CONVERSATION_TTL_SECONDS = 60.0
+_SMS_CONVERSATION_IDS_MAX = 50_000
+
+_sms_conversation_ids: OrderedDict[Tuple[str, str], Tuple[float, str]] = OrderedDict()
+_sms_conversation_ids_lock = threading.Lock()
+
+
+def invalidate_sms_conversation_cache() -> None:
+    """Drop every cached SMS conversation id."""
+    with _sms_conversation_ids_lock:
+        _sms_conversation_ids.clear()
+
+
+def cached_sms_conversation_id(business_id: str, from_phone: str) -> str | None:
+    """Return the cached conversation id for a sender, if still fresh."""
+    key = (business_id, from_phone)
+    with _sms_conversation_ids_lock:
+        cached = _sms_conversation_ids.get(key)
+        if cached is None:
+            return None
+        if cached[0] <= time.monotonic():
+            del _sms_conversation_ids[key]
+            return None
+        return cached[1]
+
+
+def remember_sms_conversation_id(
+    business_id: str, from_phone: str, conversation_id: str
+) -> None:
+    """Cache a sender's conversation id for SMS_CONVERSATION_TTL_SECONDS."""
+    key = (business_id, from_phone)
+    expires_at = time.monotonic() + SMS_CONVERSATION_TTL_SECONDS
+    with _sms_conversation_ids_lock:
+        _sms_conversation_ids[key] = (expires_at, conversation_id)
+        _sms_conversation_ids.move_to_end(key)
+        while len(_sms_conversation_ids) > _SMS_CONVERSATION_IDS_MAX:
+            _sms_conversation_ids.popitem(last=False)
@@ -5,6 +5,8 @@ import pytest
 from app.db import SQLALCHEMY_AVAILABLE, SessionLocal
 from app.db_models import BusinessDB
 from app.deps import DEFAULT_BUSINESS_ID
+from app.routers.twilio_integration import invalidate_owner_summary_cache
+from app.services.twilio_state import invalidate_sms_conversation_cache
 from app.services.oauth_tokens import oauth_store
 
 
@@ -32,6 +34,8 @@ def _reset_default_business_schedule_settings() -> None:
 @pytest.fixture(autouse=True)
 def _isolate_global_state():
     oauth_store._tokens.clear()  # type: ignore[attr-defined]
+    invalidate_owner_summary_cache()
+    invalidate_sms_conversation_cache()
     _reset_default_business_schedule_settings()
     yield
     oauth_store._tokens.clear()  # type: ignore[attr-defined]
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
@@ -16,6 +18,7 @@ def _reset_metrics() -> None:
     metrics.alert_events_total = 0
     metrics.alerts_open.clear()
     metrics.alert_last_fired.clear()
+    metrics.alert_last_fired_monotonic.clear()
 
 
 def test_alerting_records_runbook_and_cooldown() -> None:
@@ -62,3 +65,104 @@ def test_notification_failure_helper_flags_alert() -> None:
     alerting.record_notification_failure("sms", "downstream error")
     assert metrics.notification_failures == 1
     assert "notification_failure" in metrics.alerts_open
+
+
+def test_oncall_webhook_is_scheduled_on_running_loop(monkeypatch) -> None:
+    _reset_metrics()
+    monkeypatch.setenv("ONCALL_WEBHOOK_URL", "https://oncall.example/hook")
+    posted: list[dict] = []
+
+    def _blocking_post(*args, **kwargs):
+        raise AssertionError("blocking httpx.post used inside the event loop")
+
+    class RecordingAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            pass
+
+        async def post(self, url, json=None):
+            posted.append(json)
+
+        async def aclose(self) -> None:
+            return None
+
+    monkeypatch.setattr("app.services.alerting.httpx.post", _blocking_post)
+    monkeypatch.setattr("app.services.alerting.httpx.Client", _blocking_post)
+    monkeypatch.setattr("app.services.alerting.httpx.AsyncClient", RecordingAsyncClient)
+
+    async def _fire() -> None:
+        alerting.maybe_trigger_alert(
+            "twilio_webhook_failure", detail="loop failure", cooldown_seconds=0
+        )
+        assert not posted
+        await asyncio.gather(*alerting._pending_webhooks)
+        await alerting.aclose()
+
+    asyncio.run(_fire())
+    assert len(posted) == 1
+    assert "twilio_webhook_failure" in posted[0]["text"]
+
+
+def test_oncall_webhook_reuses_sync_client_outside_loop(monkeypatch) -> None:
+    _reset_metrics()
+    monkeypatch.setenv("ONCALL_WEBHOOK_URL", "https://oncall.example/hook")
+    clients: list["RecordingClient"] = []
+    posted: list[dict] = []
+
+    class RecordingClient:
+        def __init__(self, *args, **kwargs) -> None:
+            self.closed = False
+            clients.append(self)
+
+        def post(self, url, json=None):
+            posted.append(json)
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr("app.services.alerting.httpx.Client", RecordingClient)
+    asyncio.run(alerting.aclose())
+
+    for detail in ("first failure", "second failure"):
+        alerting.maybe_trigger_alert(
+            "twilio_webhook_failure", detail=detail, cooldown_seconds=0
+        )
+    assert len(posted) == 2
+    assert len(clients) == 1
+
+    asyncio.run(alerting.aclose())
+    assert clients[0].closed
+
+
+def test_oncall_webhook_client_is_closed_when_event_loop_changes(monkeypatch) -> None:
+    _reset_metrics()
+    monkeypatch.setenv("ONCALL_WEBHOOK_URL", "https://oncall.example/hook")
+    clients: list["RecordingAsyncClient"] = []
+
+    class RecordingAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            self.closed = False
+            clients.append(self)
+
+        async def post(self, url, json=None):
+            return None
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr("app.services.alerting.httpx.AsyncClient", RecordingAsyncClient)
+    asyncio.run(alerting.aclose())
+
+    async def _fire(detail: str) -> None:
+        alerting.maybe_trigger_alert(
+            "twilio_webhook_failure", detail=detail, cooldown_seconds=0
+        )
+        await asyncio.gather(*alerting._pending_webhooks)
+
+    asyncio.run(_fire("first loop"))
+    asyncio.run(_fire("second loop"))
+
+    assert len(clients) == 2
+    assert clients[0].closed is True
+    assert clients[1].closed is False
+    asyncio.run(alerting.aclose())
+    assert clients[1].closed is True
@@ -107,3 +107,297 @@ def test_language_vertical_and_voice_overrides_and_defaults() -> None:
     )
     assert business_config.get_voice_for_business(None) == default_voice
     assert business_config.get_voice_for_business("unknown-business") == default_voice
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_language_cache_is_invalidated_on_business_update() -> None:
+    biz_id = "config_language_cache"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Language Cache",
+                language_code="en",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        else:
+            row.language_code = "en"
+        session.commit()
+    finally:
+        session.close()
+
+    assert business_config.get_language_for_business(biz_id) == "en"
+
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        assert row is not None
+        row.language_code = "es"
+        session.commit()
+    finally:
+        session.close()
+
+    # The ORM update drops the cached row, so the new language is visible.
+    assert business_config.get_language_for_business(biz_id) == "es"
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_business_snapshot_carries_owner_contact_and_is_cached(monkeypatch) -> None:
+    biz_id = "config_snapshot_contact"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Snapshot Contact",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        row.owner_phone = "+15550007777"
+        row.owner_email = "owner@example.com"
+        row.owner_email_alerts_enabled = False
+        row.twilio_missed_statuses = "busy,no-answer"
+        session.commit()
+    finally:
+        session.close()
+
+    assert business_config.business_snapshot_cached(biz_id) is False
+    snapshot = business_config.get_business_snapshot(biz_id)
+    assert business_config.business_snapshot_cached(biz_id) is True
+    assert snapshot is not None
+    assert snapshot.name == "Config Snapshot Contact"
+    assert snapshot.owner_phone == "+15550007777"
+    assert snapshot.owner_email == "owner@example.com"
+    assert snapshot.owner_email_alerts_enabled is False
+    assert snapshot.twilio_missed_statuses == "busy,no-answer"
+
+    def _no_session():
+        raise AssertionError("cached snapshot should not open a session")
+
+    monkeypatch.setattr(business_config, "SessionLocal", _no_session)
+    assert business_config.get_business_snapshot(biz_id) is snapshot
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_vertical_and_voice_follow_business_updates() -> None:
+    biz_id = "config_vertical_voice_cache"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Vertical Voice",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        row.vertical = "hvac"
+        row.tts_voice = "nova"
+        session.commit()
+    finally:
+        session.close()
+
+    assert business_config.get_vertical_for_business(biz_id) == "hvac"
+    assert business_config.get_voice_for_business(biz_id) == "nova"
+
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        assert row is not None
+        row.vertical = "electrical"
+        row.tts_voice = "alloy"
+        session.commit()
+    finally:
+        session.close()
+
+    assert business_config.get_vertical_for_business(biz_id) == "electrical"
+    assert business_config.get_voice_for_business(biz_id) == "alloy"
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_lockdown_check_reads_cached_snapshot(monkeypatch) -> None:
+    from app import main
+
+    biz_id = "config_lockdown_snapshot"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Lockdown Snapshot",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        row.lockdown_mode = True  # type: ignore[assignment]
+        session.commit()
+    finally:
+        session.close()
+
+    assert main._is_business_locked(biz_id) is True
+
+    def _no_session():
+        raise AssertionError("cached snapshot should not open a session")
+
+    monkeypatch.setattr(business_config, "SessionLocal", _no_session)
+    assert main._is_business_locked(biz_id) is True
+    monkeypatch.undo()
+
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        assert row is not None
+        row.lockdown_mode = False  # type: ignore[assignment]
+        session.commit()
+    finally:
+        session.close()
+
+    assert main._is_business_locked(biz_id) is False
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_unknown_business_ids_are_bounded_and_expire(monkeypatch) -> None:
+    monkeypatch.setattr(business_config, "_MISSING_BUSINESS_CACHE_MAX", 8)
+    business_config.invalidate_business_cache()
+
+    for index in range(20):
+        assert business_config.get_business_snapshot(f"unknown_{index}") is None
+
+    assert list(business_config._missing_business_ids) == [
+        f"unknown_{index}" for index in range(12, 20)
+    ]
+    assert "unknown_19" not in business_config._business_cache
+    assert business_config.business_snapshot_cached("unknown_19") is True
+
+    monkeypatch.setattr(business_config, "BUSINESS_CACHE_TTL_SECONDS", 0.0)
+    assert business_config.business_snapshot_cached("unknown_19") is False
+    assert "unknown_19" not in business_config._missing_business_ids
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_status_checks_reload_snapshot_sooner_than_display_fields(
+    monkeypatch,
+) -> None:
+    from sqlalchemy import text
+
+    from app.routers import twilio_integration
+
+    biz_id = "config_status_max_age"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Status Max Age",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        row.status = "ACTIVE"
+        session.commit()
+    finally:
+        session.close()
+
+    assert twilio_integration._is_business_active(biz_id) is True
+
+    # A write from another instance (or raw SQL) fires no ORM event here.
+    session = SessionLocal()
+    try:
+        session.execute(
+            text("UPDATE businesses SET status = 'SUSPENDED' WHERE id = :id"),
+            {"id": biz_id},
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    snapshot = business_config.get_business_snapshot(biz_id)
+    assert snapshot is not None and snapshot.status == "ACTIVE"
+
+    monkeypatch.setattr(twilio_integration, "BUSINESS_STATUS_MAX_AGE_SECONDS", 0.0)
+    assert twilio_integration._is_business_active(biz_id) is False
+    snapshot = business_config.get_business_snapshot(biz_id)
+    assert snapshot is not None and snapshot.status == "SUSPENDED"
+
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        assert row is not None
+        row.status = "ACTIVE"
+        session.commit()
+    finally:
+        session.close()
+
+
+@pytest.mark.skipif(
+    not SQLALCHEMY_AVAILABLE or SessionLocal is None,
+    reason="Business configuration tests require database support",
+)
+def test_lockdown_check_rereads_flag_after_status_max_age(monkeypatch) -> None:
+    from sqlalchemy import text
+
+    from app import main
+
+    biz_id = "config_lockdown_max_age"
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        if row is None:
+            row = BusinessDB(  # type: ignore[call-arg]
+                id=biz_id,
+                name="Config Lockdown Max Age",
+                created_at=datetime.now(UTC),
+            )
+            session.add(row)
+        row.lockdown_mode = False  # type: ignore[assignment]
+        session.commit()
+    finally:
+        session.close()
+
+    assert main._is_business_locked(biz_id) is False
+
+    # A write from another instance (or raw SQL) fires no ORM event here.
+    session = SessionLocal()
+    try:
+        session.execute(
+            text("UPDATE businesses SET lockdown_mode = 1 WHERE id = :id"),
+            {"id": biz_id},
+        )
+        session.commit()
+    finally:
+        session.close()
+
+    assert main._is_business_locked(biz_id) is False
+    monkeypatch.setattr(main, "BUSINESS_STATUS_MAX_AGE_SECONDS", 0.0)
+    assert main._is_business_locked(biz_id) is True
+
+    session = SessionLocal()
+    try:
+        row = session.get(BusinessDB, biz_id)
+        assert row is not None
+        row.lockdown_mode = False  # type: ignore[assignment]
+        session.commit()
+    finally:
+        session.close()
@@ -74,3 +74,11 @@ def test_from_env_handles_invalid_business_hours(monkeypatch) -> None:
         settings = AppSettings.from_env()
     assert settings.calendar.default_open_hour == 8
     assert settings.calendar.default_close_hour == 17
+
+
+def test_from_env_reads_owner_voice_require_match(monkeypatch) -> None:
+    monkeypatch.delenv("OWNER_VOICE_REQUIRE_MATCH", raising=False)
+    assert AppSettings.from_env().telephony.owner_voice_require_match is False
+
+    monkeypatch.setenv("OWNER_VOICE_REQUIRE_MATCH", "TRUE")
+    assert AppSettings.from_env().telephony.owner_voice_require_match is True
@@ -509,3 +509,23 @@ def test_conversation_confirm_slot_fallback_when_no_requested_time(monkeypatch):
     result = run(manager.handle_input(session, "yes"))
     assert result.new_state["status"] == "PENDING_FOLLOWUP"
     assert result.new_state["stage"] == "COMPLETED"
+
+
+def test_conversation_turn_loads_conversation_once(monkeypatch):
+    from app.services import conversation as conversation_module
+
+    lookups: list[str] = []
+    real_get_by_session = conversation_module.conversations_repo.get_by_session
+
+    def _counting_get_by_session(session_id):
+        lookups.append(session_id)
+        return real_get_by_session(session_id)
+
+    monkeypatch.setattr(
+        conversation_module.conversations_repo,
+        "get_by_session",
+        _counting_get_by_session,
+    )
+    session = CallSession(id="test-single-lookup", caller_phone="555-0001")
+    run(ConversationManager().handle_input(session, "John Smith"))
+    assert lookups == ["test-single-lookup"]
@@ -115,6 +115,63 @@ def test_db_appointment_repository_create_and_update() -> None:
     assert repo.update("missing-id", status="CANCELLED") is None
 
 
+def test_db_appointment_repository_next_upcoming_for_customer() -> None:
+    repo = DbAppointmentRepository()
+    business_id = "db_repo_next_upcoming"
+    customer_id = f"cust-next-{uuid4()}"
+    now = datetime.now(UTC)
+
+    def _create(hours: int):
+        start = now + timedelta(hours=hours)
+        return repo.create(
+            customer_id=customer_id,
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            service_type="Inspection",
+            is_emergency=False,
+            business_id=business_id,
+        )
+
+    _create(-2)
+    cancelled = _create(1)
+    repo.update(cancelled.id, status="CANCELLED")
+    later = _create(5)
+    soonest = _create(3)
+
+    found = repo.next_upcoming_for_customer(customer_id, business_id, now)
+    assert found is not None
+    assert found.id == soonest.id
+    assert found.id != later.id
+    assert repo.next_upcoming_for_customer(customer_id, "other", now) is None
+
+
+def test_db_appointment_repository_active_counts_between() -> None:
+    repo = DbAppointmentRepository()
+    business_id = f"db_repo_counts_{uuid4()}"
+    now = datetime.now(UTC)
+
+    def _create(days: int, emergency: bool):
+        start = now - timedelta(days=days)
+        return repo.create(
+            customer_id="cust-counts",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            service_type="Repair",
+            is_emergency=emergency,
+            business_id=business_id,
+        )
+
+    _create(1, True)
+    _create(2, False)
+    cancelled = _create(3, True)
+    repo.update(cancelled.id, status="CANCELLED")
+    _create(10, True)
+
+    window_start = now - timedelta(days=7)
+    assert repo.active_counts_between(business_id, window_start, now) == (2, 1)
+    assert repo.active_counts_between("other", window_start, now) == (0, 0)
+
+
 def test_db_conversation_repository_create_append_and_get() -> None:
     repo = DbConversationRepository()
     business_id = "db_repo_test_business"
@@ -157,3 +214,84 @@ def test_db_conversation_repository_create_append_and_get() -> None:
 
     all_convs = repo.list_all()
     assert any(c.id == conv.id for c in all_convs)
+
+
+def test_db_conversation_repository_append_messages_keeps_order() -> None:
+    repo = DbConversationRepository()
+    conv = repo.create(
+        channel="phone",
+        customer_id=None,
+        session_id=f"sess-db-batch-{uuid4()}",
+        business_id="db_repo_test_business",
+    )
+
+    repo.append_messages(
+        conv.id,
+        [("assistant", "Call started"), ("user", "My sink is leaking")],
+    )
+    repo.append_messages("missing", [("user", "ignore")])
+
+    stored = repo.get(conv.id)
+    assert stored is not None
+    assert [(m.role, m.text) for m in stored.messages] == [
+        ("assistant", "Call started"),
+        ("user", "My sink is leaking"),
+    ]
+
+
+def test_db_conversation_repository_delete_last_message_matches_entry() -> None:
+    repo = DbConversationRepository()
+    conv = repo.create(
+        channel="phone",
+        customer_id=None,
+        session_id=f"sess-db-delete-{uuid4()}",
+        business_id="db_repo_test_business",
+    )
+    repo.append_messages(conv.id, [("user", "Hello"), ("assistant", "Hi there")])
+
+    repo.delete_last_message(conv.id, role="assistant", text="Something else")
+    repo.delete_last_message(conv.id, role="user", text="Hello")
+    repo.delete_last_message(conv.id, role="assistant", text="Hi there")
+    repo.delete_last_message("missing", role="user", text="ignore")
+
+    stored = repo.get(conv.id)
+    assert stored is not None
+    assert [(m.role, m.text) for m in stored.messages] == [("user", "Hello")]
+
+
+def test_db_appointment_repository_next_upcoming_for_phone() -> None:
+    customers = DbCustomerRepository()
+    repo = DbAppointmentRepository()
+    business_id = f"db_repo_next_phone_{uuid4()}"
+    phone = "+19995550123"
+    now = datetime.now(UTC)
+    customer = customers.upsert(
+        name="Next Phone",
+        phone=phone,
+        email=None,
+        address=None,
+        business_id=business_id,
+    )
+
+    def _create(hours: int):
+        start = now + timedelta(hours=hours)
+        return repo.create(
+            customer_id=customer.id,
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            service_type="Inspection",
+            is_emergency=False,
+            business_id=business_id,
+        )
+
+    _create(-1)
+    cancelled = _create(1)
+    repo.update(cancelled.id, status="CANCELLED")
+    _create(6)
+    soonest = _create(2)
+
+    found = repo.next_upcoming_for_phone(phone, business_id, now)
+    assert found is not None
+    assert found.id == soonest.id
+    assert repo.next_upcoming_for_phone(phone, "other", now) is None
+    assert repo.next_upcoming_for_phone("+10000000000", business_id, now) is None
@@ -0,0 +1,42 @@
+import asyncio
+import threading
+
+from app.services import http_clients
+
+
+class RecordingAsyncClient:
+    def __init__(self) -> None:
+        self.closed = threading.Event()
+
+    async def aclose(self) -> None:
+        self.closed.set()
+
+
+def test_close_stale_client_hands_close_to_running_loop() -> None:
+    stale_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=stale_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        client = RecordingAsyncClient()
+        asyncio.run(http_clients.close_stale_client(client, stale_loop))  # type: ignore[arg-type]
+        assert client.closed.wait(timeout=2)
+    finally:
+        stale_loop.call_soon_threadsafe(stale_loop.stop)
+        thread.join(timeout=2)
+        stale_loop.close()
+    assert not http_clients._pending_closes
+
+
+def test_close_stale_client_closes_locally_when_loop_stopped() -> None:
+    stale_loop = asyncio.new_event_loop()
+    stale_loop.close()
+
+    class FailingClient:
+        async def aclose(self) -> None:
+            raise RuntimeError("already closed")
+
+    client = RecordingAsyncClient()
+    asyncio.run(http_clients.close_stale_client(client, stale_loop))  # type: ignore[arg-type]
+    assert client.closed.is_set()
+    # Close errors are logged, not raised.
+    asyncio.run(http_clients.close_stale_client(FailingClient(), None))  # type: ignore[arg-type]
@@ -58,6 +58,8 @@ def test_owner_assistant_voice_reply():
     assert resp.status_code == 200
     assert "<Response>" in resp.text
     assert "<Say" in resp.text
+    assert resp.text.startswith('<Response><Say voice="alice">')
+    assert resp.text.endswith("</Say></Response>")
 
 
 def test_business_context_includes_usage():
@@ -72,3 +72,21 @@ def test_rate_limit_returns_429_with_retry_after(monkeypatch) -> None:
     resp2 = client.post("/telephony/inbound", json={})
     assert resp2.status_code == 429
     assert resp2.headers.get("Retry-After")
+
+
+def test_metrics_incr_is_safe_across_threads() -> None:
+    import threading
+
+    metrics.background_job_errors = 0
+
+    def _bump() -> None:
+        for _ in range(1000):
+            metrics.incr("background_job_errors")
+
+    threads = [threading.Thread(target=_bump) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert metrics.background_job_errors == 8000
+    metrics.background_job_errors = 0
@@ -316,3 +316,24 @@ def test_qbo_callback_failure_when_configured(monkeypatch):
     )
     assert resp.status_code == 502
     assert "token exchange failed" in resp.json().get("detail", "")
+
+
+def test_background_sync_failure_counts_errors_under_metrics_lock(monkeypatch):
+    from app.metrics import metrics
+    from app.routers import qbo_integration
+
+    def failing_push(**kwargs):
+        raise RuntimeError("qbo down")
+
+    bumped: list[str] = []
+    real_incr = metrics.incr
+
+    def recording_incr(name: str, amount: int = 1) -> None:
+        bumped.append(name)
+        real_incr(name, amount)
+
+    monkeypatch.setattr(qbo_integration, "_push_customer_and_receipt", failing_push)
+    monkeypatch.setattr(metrics, "incr", recording_incr)
+
+    qbo_integration._background_sync("default_business", "realm", "token")
+    assert bumped == ["qbo_sync_errors", "background_job_errors"]
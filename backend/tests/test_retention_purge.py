@@ -13,6 +13,7 @@ from app.db_models import (
 )
 from app.main import app
 from app.metrics import metrics
+from app.services import twilio_state
 
 client = TestClient(app)
 
@@ -232,3 +233,45 @@ def test_retention_prune_skips_disabled_tenant() -> None:
     finally:
         _cleanup_business(session, biz_id)
         session.close()
+
+
+def test_retention_prune_invalidates_cached_sms_conversation_ids() -> None:
+    assert SessionLocal is not None
+    session = SessionLocal()
+    biz_id = "retention_sms_cache_biz"
+    _cleanup_business(session, biz_id)
+
+    old_time = datetime.now(UTC) - timedelta(days=40)
+    session.add(
+        BusinessDB(  # type: ignore[call-arg]
+            id=biz_id,
+            name="Retention SMS Cache Biz",
+            conversation_retention_days=15,
+            retention_enabled=True,
+        )
+    )
+    session.add(
+        ConversationDB(  # type: ignore[call-arg]
+            id="conv-sms-cache-old",
+            business_id=biz_id,
+            customer_id="cust-sms-cache",
+            channel="sms",
+            created_at=old_time,
+        )
+    )
+    session.commit()
+    twilio_state.remember_sms_conversation_id(
+        biz_id, "+15550009999", "conv-sms-cache-old"
+    )
+    assert (
+        twilio_state.cached_sms_conversation_id(biz_id, "+15550009999")
+        == "conv-sms-cache-old"
+    )
+
+    resp = client.post("/v1/admin/retention/prune")
+    assert resp.status_code == 200
+    assert resp.json()["conversations_deleted"] >= 1
+    assert twilio_state.cached_sms_conversation_id(biz_id, "+15550009999") is None
+
+    _cleanup_business(session, biz_id)
+    session.close()
@@ -116,6 +116,7 @@ def test_redis_session_store_save_persists_mutations_across_instances() -> None:
     )
     session.stage = "ASK_PROBLEM"
     session.no_input_count = 2
+    session.conversation_id = "conv-123"
     session.intent = "schedule_service"
     session.intent_confidence = 0.92
     session.is_emergency = True
@@ -131,6 +132,7 @@ def test_redis_session_store_save_persists_mutations_across_instances() -> None:
     assert fetched.lead_source == "test"
     assert fetched.stage == "ASK_PROBLEM"
     assert fetched.no_input_count == 2
+    assert fetched.conversation_id == "conv-123"
     assert fetched.intent == "schedule_service"
     assert fetched.intent_confidence == 0.92
     assert fetched.is_emergency is True
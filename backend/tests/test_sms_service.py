@@ -230,3 +230,80 @@ def test_send_sms_twilio_failure_is_swallowed(monkeypatch: pytest.MonkeyPatch) -
         sms_service._settings.twilio_account_sid = original_sid  # type: ignore[attr-defined]
         sms_service._settings.twilio_auth_token = original_token  # type: ignore[attr-defined]
         sms_service._settings.from_number = original_from  # type: ignore[attr-defined]
+
+
+def test_send_sms_twilio_reuses_pooled_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    sms_service._sent.clear()  # type: ignore[attr-defined]
+    created: list[object] = []
+
+    class RecordingAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            created.append(self)
+
+        async def post(self, *args, **kwargs):
+            class _Resp:
+                def raise_for_status(self) -> None:
+                    return None
+
+            return _Resp()
+
+        async def aclose(self) -> None:
+            return None
+
+    monkeypatch.setattr("app.services.sms.httpx.AsyncClient", RecordingAsyncClient)
+
+    original_provider = sms_service._settings.provider  # type: ignore[attr-defined]
+    original_sid = sms_service._settings.twilio_account_sid  # type: ignore[attr-defined]
+    original_token = sms_service._settings.twilio_auth_token  # type: ignore[attr-defined]
+    original_from = sms_service._settings.from_number  # type: ignore[attr-defined]
+
+    async def _send_twice() -> list[bool]:
+        results = [
+            await sms_service.send_sms("+15550007001", "First"),
+            await sms_service.send_sms("+15550007002", "Second"),
+        ]
+        await sms_service.aclose()
+        return results
+
+    try:
+        sms_service._settings.provider = "twilio"  # type: ignore[attr-defined]
+        sms_service._settings.twilio_account_sid = "sid"  # type: ignore[attr-defined]
+        sms_service._settings.twilio_auth_token = "token"  # type: ignore[attr-defined]
+        sms_service._settings.from_number = "+15550005555"  # type: ignore[attr-defined]
+
+        assert run(_send_twice()) == [True, True]
+        assert len(created) == 1
+    finally:
+        sms_service._settings.provider = original_provider  # type: ignore[attr-defined]
+        sms_service._settings.twilio_account_sid = original_sid  # type: ignore[attr-defined]
+        sms_service._settings.twilio_auth_token = original_token  # type: ignore[attr-defined]
+        sms_service._settings.from_number = original_from  # type: ignore[attr-defined]
+
+
+def test_pooled_client_is_closed_when_event_loop_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from app.services.sms import SmsService
+
+    created: list["RecordingAsyncClient"] = []
+
+    class RecordingAsyncClient:
+        def __init__(self, *args, **kwargs) -> None:
+            self.closed = False
+            created.append(self)
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr("app.services.sms.httpx.AsyncClient", RecordingAsyncClient)
+    service = SmsService()
+
+    first = run(service._http_client())
+    second = run(service._http_client())
+
+    assert len(created) == 2
+    assert first is created[0] and second is created[1]
+    assert created[0].closed is True
+    assert created[1].closed is False
+    run(service.aclose())
+    assert created[1].closed is True
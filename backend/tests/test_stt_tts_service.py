@@ -182,3 +182,10 @@ async def test_provider_override_can_be_injected() -> None:
         provider=EchoProvider(),
     )
     assert await service.synthesize("hi") == "echo:hi"
+
+
+def test_configured_provider_is_reused_across_calls() -> None:
+    service = SpeechService(settings=SpeechSettings(provider="gcp"))
+    provider = service._select_provider()
+    assert provider.name == "gcp"
+    assert service._select_provider() is provider
@@ -352,3 +352,19 @@ async def test_subscription_state_helpers_cover_no_db_and_notify_failures(monkey
         subscription_service.email_service, "notify_owner", failing_notify
     )
     await subscription_service._notify_owner_if_needed(dummy_business, state)
+
+
+@pytest.mark.anyio
+async def test_remind_owner_skips_business_lookup_when_throttled(monkeypatch):
+    subscription_service._reminder_cache.clear()
+    subscription_service._reminder_cache[f"{DEFAULT_BUSINESS_ID}:past_due"] = (
+        datetime.now(UTC)
+    )
+
+    def fail_session():
+        raise AssertionError("throttled reminders should not load the business")
+
+    monkeypatch.setattr(subscription_service, "SessionLocal", fail_session)
+    state = subscription_service.SubscriptionState(status="past_due")
+    await subscription_service._remind_owner(DEFAULT_BUSINESS_ID, state)
+    subscription_service._reminder_cache.clear()
@@ -92,3 +92,40 @@ def test_telephony_audio_transcribe_path(monkeypatch):
     assert body["reply_text"] == "Acknowledged"
     assert body["session_state"]["stage"] == "NEXT"
     assert body["audio"] == "audio://ok"
+
+
+def test_telephony_audio_logs_caller_line_before_assistant_runs(monkeypatch):
+    from app.repositories import conversations_repo
+
+    inbound_resp = client.post("/telephony/inbound", json={"caller_phone": "555-4444"})
+    assert inbound_resp.status_code == 200
+    session_id = inbound_resp.json()["session_id"]
+    seen_history: list[list[str]] = []
+
+    class DummyResult:
+        reply_text = "Noted"
+        new_state = {"stage": "NEXT"}
+
+    async def fake_handle_input(sess, text):
+        conv = conversations_repo.get_by_session(sess.id)
+        assert conv is not None
+        seen_history.append([m.text for m in conv.messages if m.role == "user"])
+        return DummyResult()
+
+    monkeypatch.setattr(
+        conversation.conversation_manager, "handle_input", fake_handle_input
+    )
+
+    resp = client.post(
+        "/telephony/audio",
+        json={"session_id": session_id, "text": "My sink is leaking"},
+    )
+    assert resp.status_code == 200
+    assert seen_history == [["My sink is leaking"]]
+
+    conv = conversations_repo.get_by_session(session_id)
+    assert conv is not None
+    assert [(m.role, m.text) for m in conv.messages[-2:]] == [
+        ("user", "My sink is leaking"),
+        ("assistant", "Noted"),
+    ]
@@ -1,7 +1,11 @@
 from datetime import datetime, UTC, timedelta
+import asyncio
 import base64
 import hashlib
 import hmac
+import io
+import struct
+import wave
 
 import pytest
 from fastapi.testclient import TestClient
@@ -34,6 +38,55 @@ def test_twilio_sms_basic():
     assert "<Message>" in body
 
 
+def test_twilio_sms_relinks_when_linked_conversation_is_missing():
+    from app.repositories import conversations_repo as repo  # local import
+
+    phone = "+15550000077"
+    twilio_state_store.set_sms_conversation(DEFAULT_BUSINESS_ID, phone, "conv-missing")
+
+    resp = client.post(
+        "/twilio/sms",
+        data={"From": phone, "Body": "Hello again"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status_code == 200
+
+    link = twilio_state_store.get_sms_conversation(DEFAULT_BUSINESS_ID, phone)
+    assert link is not None
+    assert link.conversation_id != "conv-missing"
+    conv = repo.get(link.conversation_id)
+    assert conv is not None
+    assert conv.channel == "sms"
+    assert conv.messages[0].text == "Hello again"
+
+
+def test_twilio_sms_repeat_message_reuses_cached_conversation(monkeypatch):
+    from app.repositories import conversations_repo as repo  # local import
+
+    phone = "+15550000078"
+    headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    first = client.post(
+        "/twilio/sms", data={"From": phone, "Body": "First"}, headers=headers
+    )
+    assert first.status_code == 200
+    link = twilio_state_store.get_sms_conversation(DEFAULT_BUSINESS_ID, phone)
+    assert link is not None
+
+    def _unexpected_lookup(business_id: str, from_phone: str):
+        raise AssertionError("repeat SMS reached the state store")
+
+    monkeypatch.setattr(twilio_state_store, "get_sms_conversation", _unexpected_lookup)
+    second = client.post(
+        "/twilio/sms", data={"From": phone, "Body": "Second"}, headers=headers
+    )
+    assert second.status_code == 200
+
+    conv = repo.get(link.conversation_id)
+    assert conv is not None
+    user_lines = [m.text for m in conv.messages if m.role == "user"]
+    assert user_lines == ["First", "Second"]
+
+
 def test_twilio_sms_opt_out_sets_flag_and_confirms():
     # Ensure a clean customer repository (in-memory mode).
     customers_repo._by_id.clear()
@@ -162,6 +215,22 @@ def test_twilio_sms_yes_with_no_upcoming_appointment_gives_clear_reply():
     assert "could not find an upcoming appointment" in body.lower()
 
 
+def test_twilio_sms_multiword_keyword_ignores_extra_whitespace():
+    customers_repo._by_id.clear()
+    customers_repo._by_phone.clear()
+    customers_repo._by_business.clear()
+    phone = "+15550007778"
+    twilio_state_store.clear_pending_action(DEFAULT_BUSINESS_ID, phone)
+
+    resp = client.post(
+        "/twilio/sms",
+        data={"From": phone, "Body": "  Change   Time "},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status_code == 200
+    assert "could not find an upcoming appointment" in resp.text.lower()
+
+
 def test_twilio_sms_reschedule_marks_pending_reschedule():
     # Clean state.
     customers_repo._by_id.clear()
@@ -347,6 +416,36 @@ def test_twilio_voice_completed_call_short_circuits(monkeypatch):
     assert metrics.twilio_voice_requests == 1
 
 
+def test_twilio_voice_noop_webhooks_skip_tenant_checks(monkeypatch):
+    async def _fail_check_access(*args, **kwargs):
+        raise AssertionError("subscription check should be skipped")
+
+    monkeypatch.setattr(
+        twilio_integration.subscription_service, "check_access", _fail_check_access
+    )
+
+    resp = client.post(
+        "/twilio/voice?uptime_check=true",
+        data={"CallSid": "CA_UPTIME"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status_code == 200
+    assert resp.text == "<Response/>"
+
+    twilio_state_store.set_call_session("CA_DUP_END", "sess-dup-end", event_id="EV_DUP")
+    resp = client.post(
+        "/twilio/voice",
+        data={"CallSid": "CA_DUP_END", "CallStatus": "completed"},
+        headers={
+            "Content-Type": "application/x-www-form-urlencoded",
+            "X-Twilio-EventId": "EV_DUP",
+        },
+    )
+    assert resp.status_code == 200
+    assert resp.text == "<Response/>"
+    assert twilio_state_store.get_call_session("CA_DUP_END") is not None
+
+
 def test_twilio_voice_rejects_missing_required_fields():
     resp = client.post(
         "/twilio/voice",
@@ -719,6 +818,28 @@ def test_twilio_signature_required_when_enabled(monkeypatch) -> None:
     assert resp.status_code == 401
 
 
+def test_twilio_signature_skipped_for_stub_provider(monkeypatch) -> None:
+    class SmsCfg:
+        def __init__(self) -> None:
+            self.provider = "stub"
+            self.verify_twilio_signatures = True
+            self.twilio_auth_token = "test-token"
+
+    class DummySettings:
+        def __init__(self) -> None:
+            self.sms = SmsCfg()
+
+    monkeypatch.setattr(twilio_integration, "get_settings", lambda: DummySettings())
+    assert twilio_integration._twilio_signature_required() is False  # type: ignore[attr-defined]
+
+    resp = client.post(
+        "/twilio/sms",
+        data={"From": "+15550000003", "Body": "Hello"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status_code == 200
+
+
 def test_twilio_signature_valid_allows_request(monkeypatch) -> None:
     class SmsCfg:
         def __init__(self) -> None:
@@ -753,6 +874,38 @@ def test_twilio_signature_valid_allows_request(monkeypatch) -> None:
     assert "<Message>" in body
 
 
+def test_twilio_voice_signature_covers_unbound_form_fields(monkeypatch) -> None:
+    class SmsCfg:
+        def __init__(self) -> None:
+            self.verify_twilio_signatures = True
+            self.twilio_auth_token = "test-token"
+            self.twilio_say_language_default = None
+            self.twilio_say_language_es = None
+
+    class DummySettings:
+        def __init__(self) -> None:
+            self.sms = SmsCfg()
+
+    monkeypatch.setattr(twilio_integration, "get_settings", lambda: DummySettings())
+
+    path = "/twilio/voice"
+    # "To" is not bound by the handler but is still part of the signed form.
+    form = {"CallSid": "CA_SIGNED", "From": "+15550000002", "To": "+15550009999"}
+    signature = _build_twilio_signature(path, dict(form), "test-token")
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "X-Twilio-Signature": signature,
+    }
+
+    resp = client.post(path, data=form, headers=headers)
+    assert resp.status_code == 200
+    assert "<Gather" in resp.text
+
+    tampered = dict(form, To="+15550008888")
+    resp = client.post(path, data=tampered, headers=headers)
+    assert resp.status_code == 401
+
+
 def test_twilio_voice_signature_required_when_enabled(monkeypatch) -> None:
     class SmsCfg:
         def __init__(self) -> None:
@@ -896,6 +1049,27 @@ def test_twilio_say_language_attr_uses_sms_settings(monkeypatch) -> None:
     assert attr_es_mx == ' language="es-MX"'
 
 
+def test_twilio_say_language_attr_refreshes_when_settings_change(monkeypatch) -> None:
+    class SmsCfg:
+        def __init__(self, default_lang: str | None) -> None:
+            self.twilio_say_language_default = default_lang
+            self.twilio_say_language_es = None
+
+    class DummySettings:
+        def __init__(self, sms: SmsCfg) -> None:
+            self.sms = sms
+
+    first = DummySettings(SmsCfg("en-US"))
+    monkeypatch.setattr(twilio_integration, "get_settings", lambda: first)
+    assert twilio_integration._twilio_say_language_attr("en") == ' language="en-US"'  # type: ignore[attr-defined]
+    assert twilio_integration._twilio_say_language_attr("es") == ""  # type: ignore[attr-defined]
+
+    # A reloaded settings object is picked up on the next call.
+    reloaded = DummySettings(SmsCfg("en-GB"))
+    monkeypatch.setattr(twilio_integration, "get_settings", lambda: reloaded)
+    assert twilio_integration._twilio_say_language_attr("en") == ' language="en-GB"'  # type: ignore[attr-defined]
+
+
 def _reset_appointments_and_customers() -> None:
     appointments_repo._by_id.clear()  # type: ignore[attr-defined]
     appointments_repo._by_customer.clear()  # type: ignore[attr-defined]
@@ -1287,3 +1461,271 @@ def test_twilio_voice_rejects_suspended_business() -> None:
     per_tenant = metrics.twilio_by_business[biz_id]
     assert per_tenant.voice_requests == 1
     assert per_tenant.voice_errors == 0
+
+
+def test_webhook_action_quotes_business_id_and_appends_query():
+    action = twilio_integration._webhook_action(  # type: ignore[attr-defined]
+        "/twilio/owner-voice", "acme co/1", True, "step=post&selection=2"
+    )
+    assert (
+        action == "/twilio/owner-voice?business_id=acme%20co%2F1&step=post&selection=2"
+    )
+    assert (
+        twilio_integration._webhook_action(  # type: ignore[attr-defined]
+            "/twilio/voice", "ignored", False
+        )
+        == "/twilio/voice"
+    )
+    assert action is twilio_integration._webhook_action(  # type: ignore[attr-defined]
+        "/twilio/owner-voice", "acme co/1", True, "step=post&selection=2"
+    )
+
+
+def test_mulaw_to_pcm_decodes_little_endian_samples():
+    pcm = twilio_integration._mulaw_to_pcm(bytes([0xFF, 0x00, 0x80]))  # type: ignore[attr-defined]
+    assert pcm == struct.pack("<3h", 0, -32124, 32124)
+    assert twilio_integration._mulaw_to_pcm(b"") == b""  # type: ignore[attr-defined]
+
+
+def test_twilio_payload_to_wav_base64_writes_readable_mono_wav():
+    pcm = struct.pack("<4h", 0, 1000, -1000, 32767)
+    audio_b64 = twilio_integration._twilio_payload_to_wav_base64(  # type: ignore[attr-defined]
+        pcm, "audio/l16", 8000
+    )
+    wav_bytes = base64.b64decode(audio_b64)
+    assert len(wav_bytes) == 44 + len(pcm)
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getsampwidth() == 2
+        assert wav_file.getframerate() == 8000
+        assert wav_file.readframes(wav_file.getnframes()) == pcm
+
+
+def test_twilio_payload_to_wav_base64_decodes_mulaw():
+    audio_b64 = twilio_integration._twilio_payload_to_wav_base64(  # type: ignore[attr-defined]
+        bytes([0xFF, 0x00, 0x80]), "audio/x-mulaw", 8000
+    )
+    with wave.open(io.BytesIO(base64.b64decode(audio_b64)), "rb") as wav_file:
+        assert wav_file.readframes(3) == struct.pack("<3h", 0, -32124, 32124)
+
+
+def test_build_gather_twiml_escapes_reply_and_sets_speech_timeout():
+    twiml = twilio_integration._build_gather_twiml(  # type: ignore[attr-defined]
+        "Tom & Jerry <3", "/twilio/voice-assistant", ' language="en-US"'
+    )
+    assert twiml == (
+        b'<Response><Say voice="alice" language="en-US">Tom &amp; Jerry &lt;3</Say>'
+        b'<Gather input="speech" action="/twilio/voice-assistant" method="POST"'
+        b' speechTimeout="auto" /></Response>'
+    )
+    turn = twilio_integration._build_gather_twiml(  # type: ignore[attr-defined]
+        "Hi", "/twilio/voice", "", speech_timeout_auto=False
+    )
+    assert b"speechTimeout" not in turn
+
+
+def test_stream_min_bytes_and_safe_int():
+    min_bytes = twilio_integration._stream_min_bytes  # type: ignore[attr-defined]
+    assert min_bytes(8000, "audio/x-mulaw", 1.0) == 8000
+    assert min_bytes(8000, "audio/l16", 1.0) == 16000
+    assert min_bytes(8000, "", 0.0) == 1600
+
+    safe_int = twilio_integration._safe_int  # type: ignore[attr-defined]
+    assert safe_int(16000, 8000) == 16000
+    assert safe_int("16000", 8000) == 16000
+    assert safe_int(None, 8000) == 8000
+    assert safe_int("abc", 8000) == 8000
+
+
+def test_owner_summary_reuses_cached_pipeline(monkeypatch) -> None:
+    calls: list[str] = []
+    real_pipeline = twilio_integration.owner_routes.owner_pipeline
+
+    def _counting_pipeline(**kwargs):
+        calls.append(kwargs["business_id"])
+        return real_pipeline(**kwargs)
+
+    monkeypatch.setattr(
+        twilio_integration.owner_routes, "owner_pipeline", _counting_pipeline
+    )
+    first = twilio_integration._owner_summary_for_selection(
+        "3", DEFAULT_BUSINESS_ID, "en", ""
+    )
+    second = twilio_integration._owner_summary_for_selection(
+        "3", DEFAULT_BUSINESS_ID, "es", ""
+    )
+    assert calls == [DEFAULT_BUSINESS_ID]
+    assert first != second
+
+    twilio_integration.invalidate_owner_summary_cache()
+    twilio_integration._owner_summary_for_selection("3", DEFAULT_BUSINESS_ID, "en", "")
+    assert len(calls) == 2
+
+
+def test_owner_summary_cache_is_bounded_and_drops_expired(monkeypatch) -> None:
+    monkeypatch.setattr(twilio_integration, "_OWNER_SUMMARY_CACHE_MAX", 2)
+    for business_id in ("biz-a", "biz-b", "biz-c"):
+        twilio_integration._cached_owner_summary("kind", business_id, lambda: 1)
+    assert list(twilio_integration._owner_summary_cache) == [
+        ("kind", "biz-b"),
+        ("kind", "biz-c"),
+    ]
+
+    monkeypatch.setattr(twilio_integration, "OWNER_SUMMARY_TTL_SECONDS", -1.0)
+    twilio_integration.invalidate_owner_summary_cache()
+    twilio_integration._cached_owner_summary("kind", "biz-a", lambda: 1)
+    assert twilio_integration._cached_owner_summary("kind", "biz-a", lambda: 2) == 2
+
+
+def test_twilio_voice_assistant_silent_turns_render_gather_then_record():
+    metrics.callbacks_by_business.clear()
+    call_sid = "CA_ASSISTANT_SILENT"
+    phone = "+15551239876"
+    bodies = []
+    for _ in range(3):
+        resp = client.post(
+            "/twilio/voice-assistant",
+            data={"CallSid": call_sid, "From": phone, "SpeechResult": ""},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        assert resp.status_code == 200
+        bodies.append(resp.text)
+
+    gather = next(b for b in bodies if "catch that" in b)
+    assert gather.startswith("<Response><Say")
+    assert (
+        '<Gather input="speech dtmf" numDigits="1" '
+        'action="/twilio/voice-assistant" method="POST" speechTimeout="auto" />'
+    ) in gather
+    voicemail = next(b for b in bodies if "trouble hearing you" in b)
+    assert voicemail.endswith(
+        '<Record action="/twilio/voicemail" method="POST" playBeep="true" '
+        'timeout="5" /><Hangup/></Response>'
+    )
+
+
+def test_notify_best_effort_logs_instead_of_raising(caplog) -> None:
+    async def _failing_send(*args, **kwargs):
+        raise RuntimeError("provider down")
+
+    with caplog.at_level("WARNING", logger=twilio_integration.logger.name):
+        asyncio.run(
+            twilio_integration._notify_best_effort(
+                _failing_send,
+                "+15550001111",
+                log_event="test_notify_failed",
+                business_id=DEFAULT_BUSINESS_ID,
+            )
+        )
+    assert any(r.message == "test_notify_failed" for r in caplog.records)
+
+
+def test_say_record_hangup_twiml_omits_record_without_action() -> None:
+    without = twilio_integration._say_record_hangup_twiml("Bye &amp; thanks", "", None)
+    assert without == (
+        b'<Response><Say voice="alice">Bye &amp; thanks</Say><Hangup/></Response>'
+    )
+    with_record = twilio_integration._say_record_hangup_twiml(
+        "Bye", ' language="es-US"', "/twilio/voicemail"
+    )
+    assert with_record == (
+        b'<Response><Say voice="alice" language="es-US">Bye</Say>'
+        b'<Record action="/twilio/voicemail" method="POST" playBeep="true" '
+        b'timeout="5" /><Hangup/></Response>'
+    )
+
+
+def test_voice_turns_reuse_conversation_id_from_session(monkeypatch) -> None:
+    call_sid = "CA_CONV_ID_REUSE"
+    resp = client.post(
+        "/twilio/voice",
+        data={"CallSid": call_sid, "From": "+15551230042", "CallStatus": "in-progress"},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status_code == 200
+    link = twilio_state_store.get_call_session(call_sid)
+    session = sessions.session_store.get(link.session_id)
+    assert session.conversation_id
+
+    def fail_lookup(session_id):
+        raise AssertionError("conversation lookup should be skipped")
+
+    monkeypatch.setattr(
+        twilio_integration.conversations_repo, "get_by_session", fail_lookup
+    )
+    assert twilio_integration._session_conversation_id(session) == (
+        session.conversation_id
+    )
+
+
+def test_session_conversation_id_falls_back_to_lookup_once() -> None:
+    from app.repositories import conversations_repo
+
+    session = sessions.session_store.create(business_id=DEFAULT_BUSINESS_ID)
+    conv = conversations_repo.create(
+        channel="phone", session_id=session.id, business_id=DEFAULT_BUSINESS_ID
+    )
+    assert session.conversation_id is None
+    assert twilio_integration._session_conversation_id(session) == conv.id
+    assert session.conversation_id == conv.id
+
+
+def test_copy_tables_cover_both_languages() -> None:
+    for table in (
+        twilio_integration._SMS_STATIC_TEXT,
+        twilio_integration._SMS_TEMPLATE_TEXT,
+        twilio_integration._STREAM_PROMPT_TEXT,
+    ):
+        kinds = {kind for _, kind in table}
+        assert set(table) == {(lang, kind) for lang in ("en", "es") for kind in kinds}
+    body = twilio_integration._SMS_TEMPLATE_TEXT[("es", "missed_call")].format(
+        business_name="Plomería Sur"
+    )
+    assert "Plomería Sur" in body
+
+
+def test_say_gather_retry_twiml_is_built_once_per_variant() -> None:
+    prompt = twilio_integration._VOICE_PROMPT_TEXT[("en", "voice_silent")]
+    first = twilio_integration._say_gather_retry_twiml(
+        prompt, "", "/twilio/voice", ""
+    )
+    assert first is twilio_integration._say_gather_retry_twiml(
+        prompt, "", "/twilio/voice", ""
+    )
+    assert first.startswith(b"<Response><Say")
+    assert b'action="/twilio/voice"' in first
+
+
+def test_fast_escape_matches_html_escape() -> None:
+    from html import escape
+
+    plain = "See you Tuesday at 9, thanks!"
+    assert twilio_integration._fast_escape(plain) is plain
+    for text in ("Tom & Jerry", "<b>hi</b>", 'say "hi"', "it's"):
+        assert twilio_integration._fast_escape(text) == escape(text)
+
+
+def test_sms_no_appointment_reply_is_escaped_and_cached() -> None:
+    first = twilio_integration._sms_no_appointment_reply("en", "Smith & Sons")
+    assert b"Smith &amp; Sons" in first
+    assert first.startswith(b"<Response><Message>")
+    assert twilio_integration._sms_no_appointment_reply("en", "Smith & Sons") is first
+
+
+def test_twilio_status_callback_repeat_skips_state_store(monkeypatch) -> None:
+    form = {"MessageSid": "SM_LOCAL_DUP", "MessageStatus": "sent"}
+    headers = {
+        "Content-Type": "application/x-www-form-urlencoded",
+        "X-Twilio-EventId": "EV_LOCAL_DUP",
+    }
+    first = client.post("/twilio/status-callback", data=form, headers=headers)
+    assert first.status_code == 200
+
+    def _unexpected_lookup(call_sid: str):
+        raise AssertionError("repeat status callback reached the state store")
+
+    monkeypatch.setattr(twilio_state_store, "get_call_session", _unexpected_lookup)
+    form["MessageStatus"] = "delivered"
+    second = client.post("/twilio/status-callback", data=form, headers=headers)
+    assert second.status_code == 200
+    assert second.json()["status"] == "delivered"
@@ -96,6 +96,35 @@ def test_twilio_stream_stop_enqueues_partial_callback(monkeypatch):
     assert item.status == "PENDING"
 
 
+def test_twilio_stream_stop_partial_lead_sms_failure_is_contained(monkeypatch):
+    from app.services.sms import sms_service
+
+    monkeypatch.setenv("TWILIO_STREAMING_ENABLED", "true")
+    config.get_settings.cache_clear()
+    deps.get_settings.cache_clear()
+    sent: list[str] = []
+
+    async def failing_notify_customer(phone, body, business_id=None):
+        sent.append(phone)
+        raise RuntimeError("sms provider down")
+
+    monkeypatch.setattr(sms_service, "notify_customer", failing_notify_customer)
+
+    event = {
+        "call_sid": "CS_STOP_SMS",
+        "stream_sid": "SS_STOP_SMS",
+        "business_id": DEFAULT_BUSINESS_ID,
+        "from_number": "+15550002223",
+    }
+    start = client.post("/v1/twilio/voice-stream", json={**event, "event": "start"})
+    assert start.status_code == 200
+
+    stop = client.post("/v1/twilio/voice-stream", json={**event, "event": "stop"})
+    assert stop.status_code == 200
+    assert stop.json()["status"] == "completed"
+    assert sent == ["+15550002223"]
+
+
 def test_twilio_stream_silence_triggers_callback(monkeypatch):
     metrics.callbacks_by_business.clear()
     metrics.twilio_by_business.clear()
@@ -196,7 +225,14 @@ def test_twilio_streaming_websocket_ingest(monkeypatch):
             }
         )
 
-        link = twilio_state_store.get_call_session("CS_WS1")
+        # Events are handled concurrently with the client; the start event
+        # registers the call once the tenant snapshot has loaded.
+        link = None
+        for _ in range(50):
+            link = twilio_state_store.get_call_session("CS_WS1")
+            if link is not None:
+                break
+            time.sleep(0.01)
         assert link is not None
 
         ws.send_json({"event": "stop"})
@@ -219,3 +255,73 @@ def test_twilio_streaming_websocket_requires_token(monkeypatch):
         with pytest.raises(WebSocketDisconnect) as exc:
             ws.receive_text()
     assert exc.value.code == 1008
+
+
+def test_twilio_streaming_websocket_reuses_buffer_across_flushes(monkeypatch):
+    monkeypatch.setenv("TWILIO_STREAMING_ENABLED", "true")
+    monkeypatch.setenv("TWILIO_STREAM_MIN_SECONDS", "0.1")
+    monkeypatch.delenv("TWILIO_STREAM_TOKEN", raising=False)
+    config.get_settings.cache_clear()
+    deps.get_settings.cache_clear()
+
+    audio_sizes: list[int] = []
+
+    async def fake_transcribe(audio_b64: str | None) -> str:
+        audio_sizes.append(len(base64.b64decode(audio_b64 or "")))
+        return ""
+
+    monkeypatch.setattr(speech_service, "transcribe", fake_transcribe)
+
+    frame = base64.b64encode(b"\xff" * 160).decode("ascii")
+    with client.websocket_connect(
+        "/v1/twilio/voice-stream?call_sid=CS_WS_BUF&business_id=default_business"
+    ) as ws:
+        # 0.1 s of 8 kHz mu-law is 800 bytes, so every five frames flush.
+        for _ in range(10):
+            ws.send_json(
+                {"event": "media", "media": {"track": "inbound", "payload": frame}}
+            )
+        ws.send_json({"event": "stop"})
+        for _ in range(50):
+            if len(audio_sizes) >= 2:
+                break
+            time.sleep(0.01)
+
+    # Each flush is a 44-byte WAV header plus 800 samples of 16-bit PCM.
+    assert audio_sizes == [44 + 1600, 44 + 1600]
+
+
+def test_twilio_streaming_websocket_skips_malformed_frames(monkeypatch):
+    monkeypatch.setenv("TWILIO_STREAMING_ENABLED", "true")
+    monkeypatch.setenv("TWILIO_STREAM_MIN_SECONDS", "0.1")
+    monkeypatch.delenv("TWILIO_STREAM_TOKEN", raising=False)
+    config.get_settings.cache_clear()
+    deps.get_settings.cache_clear()
+
+    audio_sizes: list[int] = []
+
+    async def fake_transcribe(audio_b64: str | None) -> str:
+        audio_sizes.append(len(base64.b64decode(audio_b64 or "")))
+        return ""
+
+    monkeypatch.setattr(speech_service, "transcribe", fake_transcribe)
+
+    frame = base64.b64encode(b"\xff" * 160).decode("ascii")
+    with client.websocket_connect(
+        "/v1/twilio/voice-stream?call_sid=CS_WS_BAD&business_id=default_business"
+    ) as ws:
+        ws.send_text("{not json")
+        ws.send_json(
+            {"event": "media", "media": {"track": "inbound", "payload": "%%%"}}
+        )
+        ws.send_json(
+            {"event": "media", "media": {"track": "inbound", "payload": frame}}
+        )
+        ws.send_json({"event": "stop"})
+        for _ in range(50):
+            if audio_sizes:
+                break
+            time.sleep(0.01)
+
+    # Only the well-formed frame reaches the transcriber.
+    assert audio_sizes == [44 + 320]
@@ -7,7 +7,6 @@ from app.deps import DEFAULT_BUSINESS_ID
 from app.services import conversation
 from app.routers import voice as voice_router
 
-
 client = TestClient(app)
 
 
@@ -132,6 +131,125 @@ def test_voice_session_input_transcribes_audio_when_text_missing(monkeypatch):
     assert data["session_state"]["stage"] == "DONE"
 
 
+def test_voice_session_input_logs_caller_line_before_assistant_runs(monkeypatch):
+    from app.repositories import conversations_repo
+
+    seen_history: list[list[str]] = []
+
+    async def fake_handle_input(session, text):
+        conv = conversations_repo.get_by_session(session.id)
+        assert conv is not None
+        seen_history.append([m.text for m in conv.messages if m.role == "user"])
+        return type(
+            "R",
+            (),
+            {"reply_text": "Got it", "new_state": {"stage": "NEXT"}},
+        )()
+
+    async def fake_synthesize(text: str, voice: str | None = None) -> str:
+        return "audio://ok"
+
+    monkeypatch.setattr(
+        conversation.conversation_manager, "handle_input", fake_handle_input
+    )
+    monkeypatch.setattr(conversation.speech_service, "synthesize", fake_synthesize)
+
+    start_resp = client.post(
+        "/v1/voice/session/start", json={"caller_phone": "555-6666"}
+    )
+    assert start_resp.status_code == 200
+    session_id = start_resp.json()["session_id"]
+
+    input_resp = client.post(
+        f"/v1/voice/session/{session_id}/input",
+        json={"text": "The heater is out"},
+    )
+    assert input_resp.status_code == 200
+    assert seen_history == [["The heater is out"]]
+
+    conv = conversations_repo.get_by_session(session_id)
+    assert conv is not None
+    assert [(m.role, m.text) for m in conv.messages] == [
+        ("user", "The heater is out"),
+        ("assistant", "Got it"),
+    ]
+
+
+def _start_session_outside_testing_mode(monkeypatch, caller_phone: str) -> str:
+    start_resp = client.post(
+        "/v1/voice/session/start", json={"caller_phone": caller_phone}
+    )
+    assert start_resp.status_code == 200
+
+    original_getenv = voice_router.os.getenv
+
+    def fake_getenv(key: str, default: str | None = None):
+        if key == "PYTEST_CURRENT_TEST":
+            return None
+        if key == "TESTING":
+            return "false"
+        return original_getenv(key, default)
+
+    async def fake_handle_input(session, text):
+        return type(
+            "R",
+            (),
+            {"reply_text": "Never heard", "new_state": {"stage": "NEXT"}},
+        )()
+
+    async def failing_synthesize(text: str, voice: str | None = None) -> str:
+        raise RuntimeError("tts down")
+
+    monkeypatch.setattr(voice_router.os, "getenv", fake_getenv)
+    monkeypatch.setattr(
+        conversation.conversation_manager, "handle_input", fake_handle_input
+    )
+    monkeypatch.setattr(conversation.speech_service, "synthesize", failing_synthesize)
+    return start_resp.json()["session_id"]
+
+
+@pytest.mark.anyio
+async def test_voice_session_input_fallback_survives_transcript_write_failure(
+    monkeypatch,
+):
+    from app.repositories import conversations_repo
+
+    session_id = _start_session_outside_testing_mode(monkeypatch, "555-7777")
+    original_append = conversations_repo.append_message
+
+    def failing_append(conversation_id: str, role: str, text: str) -> None:
+        if role == "assistant":
+            raise RuntimeError("db down")
+        original_append(conversation_id, role=role, text=text)
+
+    monkeypatch.setattr(conversations_repo, "append_message", failing_append)
+
+    result = await voice_router.session_input(
+        session_id=session_id,
+        payload=voice_router.SessionInputRequest(text="hi"),
+        business_id=DEFAULT_BUSINESS_ID,
+    )
+    assert "trouble speaking" in result.reply_text.lower()
+    assert result.audio == "audio://placeholder"
+
+
+@pytest.mark.anyio
+async def test_voice_session_input_fallback_drops_unheard_reply(monkeypatch):
+    from app.repositories import conversations_repo
+
+    session_id = _start_session_outside_testing_mode(monkeypatch, "555-8888")
+
+    result = await voice_router.session_input(
+        session_id=session_id,
+        payload=voice_router.SessionInputRequest(text="hi"),
+        business_id=DEFAULT_BUSINESS_ID,
+    )
+    assert "trouble speaking" in result.reply_text.lower()
+    conv = conversations_repo.get_by_session(session_id)
+    assert conv is not None
+    assert [(m.role, m.text) for m in conv.messages] == [("user", "hi")]
+
+
 @pytest.mark.anyio
 async def test_voice_session_input_returns_fallback_when_not_testing(monkeypatch):
     from app.services.sessions import CallSession